@@ -17,6 +17,8 @@ Routines:
 
 from app.agent.decision_engine import (
     evaluate_practice,
+    evaluate_practices,
+    BatchEvaluation,
     should_propose_cancellation,
     load_skipper_config
 )
@@ -39,6 +41,8 @@ from app.agent.brain import (
 __all__ = [
     # Decision Engine
     'evaluate_practice',
+    'evaluate_practices',
+    'BatchEvaluation',
     'should_propose_cancellation',
     'load_skipper_config',
     # Thresholds
@@ -5,15 +5,34 @@ Uses Anthropic's Claude to generate human-readable summaries
 of practice conditions and draft cancellation messages.
 """
 
+import hashlib
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
 from typing import Optional
 
+from flask import current_app, has_app_context
+from sqlalchemy.orm import Session
+
+from app.models import db
 from app.practices.interfaces import PracticeEvaluation
-from app.practices.models import Practice
+from app.practices.models import Practice, SkipperSummaryCache
 
 logger = logging.getLogger(__name__)
 
+SKIPPER_MODEL = "claude-sonnet-4-20250514"
+
+# Bump when a prompt's wording changes so cached output from the old prompt
+# is no longer served.
+EVALUATION_SUMMARY_PROMPT_VERSION = 'v1'
+CANCELLATION_MESSAGE_PROMPT_VERSION = 'v1'
+
+# Defaults for apis.anthropic in skipper.yaml
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_SUMMARY_DEADLINE_SECONDS = 20
+
 # Import anthropic only if available
 try:
     import anthropic
@@ -35,6 +54,66 @@ def get_anthropic_client():
     return anthropic.Anthropic(api_key=api_key)
 
 
+def _prompt_fingerprint(kind: str, prompt_version: str, prompt: str) -> str:
+    """Stable hash of everything that determines an LLM response."""
+    payload = "\n".join([kind, prompt_version, SKIPPER_MODEL, prompt])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _get_cached_text(kind: str, fingerprint: str) -> Optional[str]:
+    """
+    Return previously generated text for a fingerprint, recording the hit.
+
+    Uses its own short-lived session so cache bookkeeping never commits or
+    rolls back the caller's unit of work. Any DB failure is a cache miss.
+    """
+    try:
+        with Session(db.engine) as session:
+            entry = session.query(SkipperSummaryCache).filter_by(
+                kind=kind, fingerprint=fingerprint
+            ).one_or_none()
+            if entry is None:
+                return None
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_hit_at = datetime.utcnow()
+            text = entry.text
+            session.commit()
+            return text
+    except Exception as e:
+        logger.warning(f"Skipper summary cache lookup failed: {e}")
+        return None
+
+
+def _store_cached_text(
+    kind: str,
+    fingerprint: str,
+    prompt_version: str,
+    practice_id: Optional[int],
+    text: str,
+    response,
+    latency_ms: int
+) -> None:
+    """Persist a fresh LLM response with its token counts and latency."""
+    usage = getattr(response, 'usage', None)
+    try:
+        with Session(db.engine) as session:
+            session.add(SkipperSummaryCache(
+                kind=kind,
+                fingerprint=fingerprint,
+                prompt_version=prompt_version,
+                model=SKIPPER_MODEL,
+                practice_id=practice_id,
+                text=text,
+                input_tokens=getattr(usage, 'input_tokens', None),
+                output_tokens=getattr(usage, 'output_tokens', None),
+                latency_ms=latency_ms,
+            ))
+            session.commit()
+    except Exception as e:
+        # Includes a concurrent run inserting the same fingerprint first
+        logger.warning(f"Failed to store Skipper summary cache entry: {e}")
+
+
 def generate_evaluation_summary(evaluation: PracticeEvaluation) -> str:
     """
     Generate human-readable summary of practice conditions.
@@ -107,6 +186,13 @@ OVERALL ASSESSMENT: {"Practice can proceed" if evaluation.is_go else "Practice s
 
 Write a clear, concise summary for club members:"""
 
+    kind = 'evaluation_summary'
+    fingerprint = _prompt_fingerprint(kind, EVALUATION_SUMMARY_PROMPT_VERSION, prompt)
+    cached = _get_cached_text(kind, fingerprint)
+    if cached is not None:
+        logger.info(f"Using cached evaluation summary for practice {evaluation.practice_id}")
+        return cached
+
     try:
         logger.info("=" * 50)
         logger.info("CLAUDE API: Generating evaluation summary")
@@ -115,11 +201,10 @@ Write a clear, concise summary for club members:"""
         logger.info(f"  Context length: {len(context)} chars")
         logger.info("  Calling Claude API...")
 
-        import time
         start_time = time.time()
         client = get_anthropic_client()
         response = client.messages.create(
-            model="claude-sonnet-4-20250514",
+            model=SKIPPER_MODEL,
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}]
         )
@@ -134,6 +219,10 @@ Write a clear, concise summary for club members:"""
         logger.info(f"  Response received in {elapsed:.2f}s")
         logger.info(f"  Summary ({len(summary)} chars): {summary[:100]}...")
         logger.info("=" * 50)
+        _store_cached_text(
+            kind, fingerprint, EVALUATION_SUMMARY_PROMPT_VERSION,
+            evaluation.practice_id, summary, response, int(elapsed * 1000)
+        )
         return summary
 
     except Exception as e:
@@ -143,6 +232,73 @@ Write a clear, concise summary for club members:"""
         return _fallback_evaluation_summary(evaluation)
 
 
+def generate_evaluation_summaries(
+    evaluations: list[PracticeEvaluation],
+    max_concurrency: Optional[int] = None,
+    deadline_seconds: Optional[float] = None
+) -> dict[int, str]:
+    """
+    Generate summaries for a whole routine run concurrently.
+
+    Each evaluation goes through generate_evaluation_summary() on a bounded
+    thread pool, so a busy day costs roughly one API round trip instead of
+    one per practice. Any call still running at the deadline is abandoned
+    and gets the template fallback; it may still finish in the background
+    and populate the summary cache for the next run.
+
+    Args:
+        evaluations: Evaluations to summarize
+        max_concurrency: Max calls in flight (default: apis.anthropic.max_concurrency)
+        deadline_seconds: Overall deadline (default: apis.anthropic.summary_deadline_seconds)
+
+    Returns:
+        Dict mapping practice_id to summary text
+    """
+    if not evaluations:
+        return {}
+
+    from app.agent.decision_engine import load_skipper_config
+    settings = load_skipper_config().get('apis', {}).get('anthropic', {})
+    if max_concurrency is None:
+        max_concurrency = settings.get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
+    if deadline_seconds is None:
+        deadline_seconds = settings.get('summary_deadline_seconds', DEFAULT_SUMMARY_DEADLINE_SECONDS)
+
+    # Worker threads need the app context for the summary cache
+    app = current_app._get_current_object() if has_app_context() else None
+
+    def summarize(evaluation: PracticeEvaluation) -> str:
+        if app is None:
+            return generate_evaluation_summary(evaluation)
+        with app.app_context():
+            return generate_evaluation_summary(evaluation)
+
+    logger.info(f"Generating {len(evaluations)} evaluation summaries "
+                f"(concurrency {max_concurrency}, deadline {deadline_seconds}s)")
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+    try:
+        futures = {pool.submit(summarize, evaluation): evaluation for evaluation in evaluations}
+        wait(futures, timeout=deadline_seconds)
+
+        summaries = {}
+        for future, evaluation in futures.items():
+            if not future.done():
+                logger.warning(f"Summary for practice {evaluation.practice_id} missed the "
+                               f"{deadline_seconds}s deadline, using fallback")
+                summaries[evaluation.practice_id] = _fallback_evaluation_summary(evaluation)
+            elif future.exception() is not None:
+                logger.error(f"Summary for practice {evaluation.practice_id} failed: "
+                             f"{future.exception()}")
+                summaries[evaluation.practice_id] = _fallback_evaluation_summary(evaluation)
+            else:
+                summaries[evaluation.practice_id] = future.result()
+        return summaries
+    finally:
+        # Don't block the routine on stragglers; queued calls are dropped
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def generate_cancellation_message(
     practice: Practice,
     evaluation: PracticeEvaluation
@@ -215,6 +371,13 @@ PRACTICE DETAILS:
 
 Write a cancellation message for Slack (use friendly but professional tone):"""
 
+    kind = 'cancellation_message'
+    fingerprint = _prompt_fingerprint(kind, CANCELLATION_MESSAGE_PROMPT_VERSION, prompt)
+    cached = _get_cached_text(kind, fingerprint)
+    if cached is not None:
+        logger.info(f"Using cached cancellation message for practice {practice.id}")
+        return cached
+
     try:
         logger.info("=" * 50)
         logger.info("CLAUDE API: Generating cancellation message")
@@ -222,11 +385,10 @@ Write a cancellation message for Slack (use friendly but professional tone):"""
         logger.info(f"  Context length: {len(context)} chars")
         logger.info("  Calling Claude API...")
 
-        import time
         start_time = time.time()
         client = get_anthropic_client()
         response = client.messages.create(
-            model="claude-sonnet-4-20250514",
+            model=SKIPPER_MODEL,
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}]
         )
@@ -241,6 +403,10 @@ Write a cancellation message for Slack (use friendly but professional tone):"""
         logger.info(f"  Response received in {elapsed:.2f}s")
         logger.info(f"  Message ({len(message)} chars): {message[:100]}...")
         logger.info("=" * 50)
+        _store_cached_text(
+            kind, fingerprint, CANCELLATION_MESSAGE_PROMPT_VERSION,
+            practice.id, message, response, int(elapsed * 1000)
+        )
         return message
 
     except Exception as e:
@@ -7,7 +7,10 @@ runs threshold checks, and produces PracticeEvaluation results.
 
 import logging
 import os
+import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -15,14 +18,19 @@ from app.practices.interfaces import (
     PracticeEvaluation,
     WeatherConditions,
     TrailCondition,
-    DaylightInfo
+    DaylightInfo,
+    EventConflict
 )
 from app.practices.models import Practice
-from app.integrations.weather import get_weather_for_location
-from app.integrations.trail_conditions import get_trail_conditions
+from app.integrations.weather import (
+    get_weather_for_location,
+    get_forecast_grid,
+    get_weather_forecasts
+)
+from app.integrations.trail_conditions import get_trail_conditions, get_all_trail_conditions
 from app.integrations.daylight import get_daylight_info
-from app.integrations.event_conflicts import get_event_conflicts
-from app.integrations.air_quality import get_air_quality
+from app.integrations.event_conflicts import get_event_conflicts, get_all_event_conflicts
+from app.integrations.air_quality import AirQualityInfo, get_air_quality, get_air_quality_batch
 from app.agent.thresholds import (
     check_weather_thresholds,
     check_trail_thresholds,
@@ -34,6 +42,9 @@ from app.agent.thresholds import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent upstream fetches in evaluate_practices()
+BATCH_FETCH_WORKERS = 6
+
 # Module-level config cache
 _config_cache: Optional[dict] = None
 _config_mtime: Optional[float] = None
@@ -76,85 +87,124 @@ def load_skipper_config(force_reload: bool = False) -> dict:
         }
 
 
-def evaluate_practice(
-    practice: Practice,
-    skip_lead_check: bool = False
-) -> PracticeEvaluation:
-    """
-    Evaluate all conditions for a practice and determine if it's safe to proceed.
+@dataclass
+class _PracticeInputs:
+    """External data fetched for one practice evaluation."""
+    weather: Optional[WeatherConditions] = None
+    trail: Optional[TrailCondition] = None
+    daylight: Optional[DaylightInfo] = None
+    conflicts: Optional[list[EventConflict]] = None
+    aqi_info: Optional[AirQualityInfo] = None
 
-    Fetches:
-    - Weather conditions from NWS API
-    - Trail conditions from SkinnySkI
-    - Daylight information for location/date
 
-    Checks:
-    - Weather thresholds (temp, wind, precipitation, lightning)
-    - Trail quality and grooming for activity type
-    - Lead confirmation status (unless skip_lead_check=True)
-    - Daylight requirements
+@dataclass
+class BatchEvaluation:
+    """Result of evaluate_practices(): per-practice evaluations plus stage timings."""
+    evaluations: dict[int, PracticeEvaluation] = field(default_factory=dict)
+    errors: dict[int, Exception] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
 
-    Args:
-        practice: Practice to evaluate
-        skip_lead_check: If True, skip lead verification (for 7am weather-only check)
+    def get(self, practice_id: int) -> PracticeEvaluation:
+        """Return a practice's evaluation, re-raising the error if it failed."""
+        if practice_id in self.errors:
+            raise self.errors[practice_id]
+        return self.evaluations[practice_id]
 
-    Returns:
-        PracticeEvaluation with all violations and go/no-go decision
-    """
-    logger.info(f"Evaluating practice {practice.id} on {practice.date}")
 
-    config = load_skipper_config()
-    evaluation = PracticeEvaluation(
-        practice_id=practice.id,
-        evaluated_at=datetime.utcnow()
-    )
+def _has_coordinates(practice: Practice) -> bool:
+    return bool(practice.location and practice.location.latitude and practice.location.longitude)
+
+
+def _fetch_practice_inputs(practice: Practice) -> _PracticeInputs:
+    """Fetch weather, trail, daylight, event conflict and AQI data for one practice."""
+    inputs = _PracticeInputs()
 
     # Fetch weather conditions
-    weather: Optional[WeatherConditions] = None
-    if practice.location and practice.location.latitude and practice.location.longitude:
+    if _has_coordinates(practice):
         try:
-            weather = get_weather_for_location(
+            inputs.weather = get_weather_for_location(
                 lat=practice.location.latitude,
                 lon=practice.location.longitude,
                 target_datetime=practice.date
             )
-            evaluation.weather = weather
-            logger.info(f"Weather: {weather.temperature_f:.1f}°F, feels like {weather.feels_like_f:.1f}°F, "
-                       f"{weather.conditions_summary}")
         except Exception as e:
             logger.error(f"Failed to fetch weather: {e}")
             # Continue evaluation without weather data
 
     # Fetch trail conditions
-    trail: Optional[TrailCondition] = None
     if practice.location:
         try:
-            trail = get_trail_conditions(practice.location.name)
-            evaluation.trail_conditions = trail
-            if trail:
-                logger.info(f"Trail: {trail.ski_quality}, {trail.trails_open}, "
-                           f"groomed: {trail.groomed} ({trail.groomed_for or 'N/A'})")
-            else:
-                logger.warning(f"No trail report found for {practice.location.name}")
+            inputs.trail = get_trail_conditions(practice.location.name)
         except Exception as e:
             logger.error(f"Failed to fetch trail conditions: {e}")
             # Continue evaluation without trail data
 
     # Fetch daylight information
-    daylight: Optional[DaylightInfo] = None
-    if practice.location and practice.location.latitude and practice.location.longitude:
+    if _has_coordinates(practice):
         try:
-            daylight = get_daylight_info(
+            inputs.daylight = get_daylight_info(
                 lat=practice.location.latitude,
                 lon=practice.location.longitude,
                 date=practice.date
             )
-            logger.info(f"Daylight: sunset {daylight.sunset.strftime('%H:%M')}, "
-                       f"dusk {daylight.civil_twilight_end.strftime('%H:%M')}")
         except Exception as e:
             logger.error(f"Failed to fetch daylight info: {e}")
             # Continue evaluation without daylight data
 
+    # Fetch event conflicts
+    try:
+        location_name = practice.location.name if practice.location else None
+        inputs.conflicts = get_event_conflicts(practice.date, location_name)
+    except Exception as e:
+        logger.error(f"Failed to check event conflicts: {e}")
+        # Continue evaluation without event conflict data
+
+    # Fetch air quality
+    if _has_coordinates(practice):
+        try:
+            inputs.aqi_info = get_air_quality(
+                lat=practice.location.latitude,
+                lon=practice.location.longitude
+            )
+        except Exception as e:
+            logger.error(f"Failed to check air quality: {e}")
+            # Continue evaluation without AQI data
+
+    return inputs
+
+
+def _evaluate_with_inputs(
+    practice: Practice,
+    inputs: _PracticeInputs,
+    config: dict,
+    skip_lead_check: bool
+) -> PracticeEvaluation:
+    """Run every threshold check for a practice against already-fetched inputs."""
+    evaluation = PracticeEvaluation(
+        practice_id=practice.id,
+        evaluated_at=datetime.utcnow()
+    )
+
+    weather = inputs.weather
+    trail = inputs.trail
+    daylight = inputs.daylight
+
+    if weather:
+        evaluation.weather = weather
+        logger.info(f"Weather: {weather.temperature_f:.1f}°F, feels like {weather.feels_like_f:.1f}°F, "
+                   f"{weather.conditions_summary}")
+
+    if trail:
+        evaluation.trail_conditions = trail
+        logger.info(f"Trail: {trail.ski_quality}, {trail.trails_open}, "
+                   f"groomed: {trail.groomed} ({trail.groomed_for or 'N/A'})")
+    elif practice.location:
+        logger.warning(f"No trail report found for {practice.location.name}")
+
+    if daylight:
+        logger.info(f"Daylight: sunset {daylight.sunset.strftime('%H:%M')}, "
+                   f"dusk {daylight.civil_twilight_end.strftime('%H:%M')}")
+
     # Run threshold checks
     all_violations = []
 
@@ -179,38 +229,26 @@ def evaluate_practice(
         all_violations.extend(daylight_violations)
 
     # Event conflict checks
-    try:
-        location_name = practice.location.name if practice.location else None
-        conflicts = get_event_conflicts(practice.date, location_name)
+    if inputs.conflicts is not None:
+        conflicts = inputs.conflicts
         evaluation.event_conflicts = conflicts
 
         if conflicts:
             logger.info(f"Found {len(conflicts)} event conflicts")
             conflict_violations = check_event_conflicts(conflicts, config)
             all_violations.extend(conflict_violations)
-    except Exception as e:
-        logger.error(f"Failed to check event conflicts: {e}")
-        # Continue evaluation without event conflict data
 
     # Air quality checks
-    if practice.location and practice.location.latitude and practice.location.longitude:
-        try:
-            aqi_info = get_air_quality(
-                lat=practice.location.latitude,
-                lon=practice.location.longitude
-            )
-            if aqi_info:
-                evaluation.air_quality = {
-                    'aqi': aqi_info.aqi,
-                    'category': aqi_info.category,
-                    'pollutant': aqi_info.pollutant
-                }
-                logger.info(f"AQI: {aqi_info.aqi} ({aqi_info.category})")
-                aqi_violations = check_air_quality(aqi_info.aqi, aqi_info.category, config)
-                all_violations.extend(aqi_violations)
-        except Exception as e:
-            logger.error(f"Failed to check air quality: {e}")
-            # Continue evaluation without AQI data
+    aqi_info = inputs.aqi_info
+    if aqi_info:
+        evaluation.air_quality = {
+            'aqi': aqi_info.aqi,
+            'category': aqi_info.category,
+            'pollutant': aqi_info.pollutant
+        }
+        logger.info(f"AQI: {aqi_info.aqi} ({aqi_info.category})")
+        aqi_violations = check_air_quality(aqi_info.aqi, aqi_info.category, config)
+        all_violations.extend(aqi_violations)
 
     # Update evaluation with violations
     evaluation.violations = all_violations
@@ -244,6 +282,207 @@ def evaluate_practice(
     return evaluation
 
 
+def evaluate_practice(
+    practice: Practice,
+    skip_lead_check: bool = False
+) -> PracticeEvaluation:
+    """
+    Evaluate all conditions for a practice and determine if it's safe to proceed.
+
+    Fetches:
+    - Weather conditions from NWS API
+    - Trail conditions from SkinnySkI
+    - Daylight information for location/date
+
+    Checks:
+    - Weather thresholds (temp, wind, precipitation, lightning)
+    - Trail quality and grooming for activity type
+    - Lead confirmation status (unless skip_lead_check=True)
+    - Daylight requirements
+
+    Args:
+        practice: Practice to evaluate
+        skip_lead_check: If True, skip lead verification (for 7am weather-only check)
+
+    Returns:
+        PracticeEvaluation with all violations and go/no-go decision
+    """
+    logger.info(f"Evaluating practice {practice.id} on {practice.date}")
+
+    config = load_skipper_config()
+    inputs = _fetch_practice_inputs(practice)
+    return _evaluate_with_inputs(practice, inputs, config, skip_lead_check)
+
+
+def _timed(timings: dict[str, float], stage: str, fn, *args):
+    """Run fn(*args), recording its wall time under timings[stage]."""
+    started = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        timings[stage] = time.perf_counter() - started
+
+
+def _group_by_forecast_grid(practices: list[Practice]) -> dict[tuple, list[Practice]]:
+    """Group practices with coordinates by NWS grid cell (or raw point if the lookup fails)."""
+    groups: dict[tuple, list[Practice]] = {}
+    for practice in practices:
+        if not _has_coordinates(practice):
+            continue
+        lat, lon = practice.location.latitude, practice.location.longitude
+        try:
+            key = get_forecast_grid(lat, lon)
+        except Exception as e:
+            logger.error(f"Failed to resolve forecast grid for ({lat},{lon}): {e}")
+            key = (lat, lon)
+        groups.setdefault(key, []).append(practice)
+    return groups
+
+
+def evaluate_practices(
+    practices: list[Practice],
+    skip_lead_check: bool = False
+) -> BatchEvaluation:
+    """
+    Evaluate many practices, fetching each upstream input once.
+
+    Practices are grouped by NWS grid cell (weather), venue (trails), date
+    (daylight, event conflicts) and AirNow reporting area (AQI). The distinct
+    upstream fetches run concurrently on a small thread pool; threshold checks
+    then run on the calling thread, since they read lazy-loaded ORM
+    relationships that must stay on the request's session.
+
+    Args:
+        practices: Practices to evaluate
+        skip_lead_check: If True, skip lead verification (for 7am weather-only check)
+
+    Returns:
+        BatchEvaluation with an evaluation (or error) per practice id and
+        per-stage wall times in seconds
+    """
+    batch = BatchEvaluation()
+    if not practices:
+        return batch
+
+    run_started = time.perf_counter()
+    timings = batch.timings
+    config = load_skipper_config()
+    logger.info(f"Evaluating {len(practices)} practices in batch")
+
+    # Read everything the worker threads need while still on the session's thread
+    grid_started = time.perf_counter()
+    grid_groups = _group_by_forecast_grid(practices)
+    timings['forecast_grid'] = time.perf_counter() - grid_started
+
+    grid_requests = {
+        key: (
+            group[0].location.latitude,
+            group[0].location.longitude,
+            [practice.date for practice in group],
+        )
+        for key, group in grid_groups.items()
+    }
+    coordinates = {
+        (practice.location.latitude, practice.location.longitude)
+        for practice in practices
+        if _has_coordinates(practice)
+    }
+
+    # Fetch the shared inputs concurrently, one task per distinct upstream call
+    weather_timings: dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers=BATCH_FETCH_WORKERS) as pool:
+        trail_future = pool.submit(_timed, timings, 'trail_conditions', get_all_trail_conditions)
+        conflicts_future = pool.submit(_timed, timings, 'event_conflicts', get_all_event_conflicts)
+        aqi_future = pool.submit(_timed, timings, 'air_quality', get_air_quality_batch, coordinates)
+        weather_futures = {
+            key: pool.submit(_timed, weather_timings, str(key), get_weather_forecasts, *request)
+            for key, request in grid_requests.items()
+        }
+
+        weather_by_practice: dict[int, Optional[WeatherConditions]] = {}
+        for key, future in weather_futures.items():
+            group = grid_groups[key]
+            try:
+                forecasts = future.result()
+            except Exception as e:
+                logger.error(f"Failed to fetch weather for grid {key}: {e}")
+                continue
+            for practice, weather in zip(group, forecasts):
+                weather_by_practice[practice.id] = weather
+
+        trails_available = True
+        try:
+            trail_future.result()
+        except Exception as e:
+            logger.error(f"Failed to fetch trail conditions: {e}")
+            trails_available = False
+
+        conflicts_available = True
+        try:
+            conflicts_future.result()
+        except Exception as e:
+            logger.error(f"Failed to check event conflicts: {e}")
+            conflicts_available = False
+
+        try:
+            aqi_by_coordinate = aqi_future.result()
+        except Exception as e:
+            logger.error(f"Failed to check air quality: {e}")
+            aqi_by_coordinate = {}
+
+    timings['weather'] = max(weather_timings.values(), default=0.0)
+    timings['fetch'] = time.perf_counter() - run_started
+
+    # Fan the shared results back out (trail/conflict lookups now hit warm caches)
+    threshold_started = time.perf_counter()
+    trail_by_venue: dict[str, Optional[TrailCondition]] = {}
+    conflicts_by_key: dict[tuple, list[EventConflict]] = {}
+    daylight_by_key: dict[tuple, Optional[DaylightInfo]] = {}
+
+    for practice in practices:
+        try:
+            inputs = _PracticeInputs(weather=weather_by_practice.get(practice.id))
+            location_name = practice.location.name if practice.location else None
+
+            if trails_available and location_name:
+                if location_name not in trail_by_venue:
+                    trail_by_venue[location_name] = get_trail_conditions(location_name)
+                inputs.trail = trail_by_venue[location_name]
+
+            if conflicts_available:
+                conflict_key = (practice.date.date(), location_name)
+                if conflict_key not in conflicts_by_key:
+                    conflicts_by_key[conflict_key] = get_event_conflicts(practice.date, location_name)
+                inputs.conflicts = conflicts_by_key[conflict_key]
+
+            if _has_coordinates(practice):
+                lat, lon = practice.location.latitude, practice.location.longitude
+                daylight_key = (lat, lon, practice.date.date())
+                if daylight_key not in daylight_by_key:
+                    try:
+                        daylight_by_key[daylight_key] = get_daylight_info(lat=lat, lon=lon, date=practice.date)
+                    except Exception as e:
+                        logger.error(f"Failed to fetch daylight info: {e}")
+                        daylight_by_key[daylight_key] = None
+                inputs.daylight = daylight_by_key[daylight_key]
+                inputs.aqi_info = aqi_by_coordinate.get((lat, lon))
+
+            batch.evaluations[practice.id] = _evaluate_with_inputs(
+                practice, inputs, config, skip_lead_check
+            )
+        except Exception as e:
+            logger.error(f"Error evaluating practice {practice.id}: {e}", exc_info=True)
+            batch.errors[practice.id] = e
+
+    timings['thresholds'] = time.perf_counter() - threshold_started
+    timings['total'] = time.perf_counter() - run_started
+
+    logger.info("Batch evaluation timings: " + ", ".join(
+        f"{stage}={seconds:.2f}s" for stage, seconds in timings.items()
+    ))
+    return batch
+
+
 def should_propose_cancellation(evaluation: PracticeEvaluation) -> bool:
     """
     Determine if an evaluation warrants a cancellation proposal.
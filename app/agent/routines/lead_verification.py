@@ -17,12 +17,12 @@ from app.practices.interfaces import PracticeStatus
 from app.practices.models import Practice
 from app.practices.service import published_practices
 from app.agent.decision_engine import (
-    evaluate_practice,
+    evaluate_practices,
     should_propose_cancellation,
     load_skipper_config
 )
 from app.agent.proposals import create_cancellation_proposal
-from app.agent.brain import generate_evaluation_summary
+from app.agent.brain import generate_evaluation_summaries
 from app.utils import now_central_naive
 
 logger = logging.getLogger(__name__)
@@ -155,6 +155,13 @@ def _run_lead_verification_check(
         'practices': []
     }
 
+    # Fetch shared weather/trail/AQI/calendar inputs once for the whole run
+    batch = evaluate_practices(practices, skip_lead_check=False)
+    results['timings'] = batch.timings
+
+    # Summarize every evaluation in one concurrent pass
+    summaries = generate_evaluation_summaries(list(batch.evaluations.values()))
+
     # Track practices that need lead DMs
     practices_needing_dm = []
 
@@ -164,11 +171,11 @@ def _run_lead_verification_check(
                        f"{practice.day_of_week} at {practice.date.strftime('%H:%M')}, "
                        f"{practice.location.name if practice.location else 'No location'}")
 
-            # Evaluate practice conditions (INCLUDING lead check)
-            evaluation = evaluate_practice(practice, skip_lead_check=False)
+            # Practice conditions (INCLUDING lead check)
+            evaluation = batch.get(practice.id)
 
             # Generate summary
-            summary = generate_evaluation_summary(evaluation)
+            summary = summaries[practice.id]
 
             logger.info(f"Evaluation: {summary}")
             logger.info(f"Go/No-Go: {'GO' if evaluation.is_go else 'NO-GO'} "
@@ -11,14 +11,18 @@ from datetime import timedelta
 from app.models import db
 from app.practices.interfaces import PracticeStatus
 from app.practices.models import Practice
-from app.practices.service import convert_practice_to_info, published_practices
+from app.practices.service import (
+    PRACTICE_INFO_LOADER,
+    convert_practice_to_info,
+    published_practices,
+)
 from app.agent.decision_engine import (
-    evaluate_practice,
+    evaluate_practices,
     should_propose_cancellation,
     load_skipper_config
 )
 from app.agent.proposals import create_cancellation_proposal
-from app.agent.brain import generate_evaluation_summary
+from app.agent.brain import generate_evaluation_summaries
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +65,7 @@ def run_morning_check(channel_override: str = None) -> dict:
     today_end = today_start + timedelta(days=1)
 
     # Find all scheduled or confirmed practices today
-    practices = published_practices().filter(
+    practices = published_practices(PRACTICE_INFO_LOADER).filter(
         Practice.date >= today_start,
         Practice.date < today_end,
         Practice.status.in_([
@@ -83,6 +87,13 @@ def run_morning_check(channel_override: str = None) -> dict:
         'recap_posted': False
     }
 
+    # Fetch shared weather/trail/AQI/calendar inputs once for the whole run
+    batch = evaluate_practices(practices, skip_lead_check=True)
+    results['timings'] = batch.timings
+
+    # Summarize every evaluation in one concurrent pass
+    summaries = generate_evaluation_summaries(list(batch.evaluations.values()))
+
     # Collect evaluation data for daily recap
     recap_evaluations = []
 
@@ -92,11 +103,11 @@ def run_morning_check(channel_override: str = None) -> dict:
                        f"{practice.day_of_week} at {practice.date.strftime('%H:%M')}, "
                        f"{practice.location.name if practice.location else 'No location'}")
 
-            # Evaluate practice conditions (skip lead check - handled by 4pm/10pm jobs)
-            evaluation = evaluate_practice(practice, skip_lead_check=True)
+            # Practice conditions (lead check skipped - handled by 4pm/10pm jobs)
+            evaluation = batch.get(practice.id)
 
             # Generate summary
-            summary = generate_evaluation_summary(evaluation)
+            summary = summaries[practice.id]
 
             logger.info(f"Evaluation: {summary}")
             logger.info(f"Go/No-Go: {'GO' if evaluation.is_go else 'NO-GO'} "
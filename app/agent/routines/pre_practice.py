@@ -12,8 +12,11 @@ from app.models import db
 from app.practices.interfaces import PracticeStatus
 from app.practices.models import Practice
 from app.practices.service import published_practices
-from app.agent.decision_engine import evaluate_practice, load_skipper_config
-from app.agent.brain import generate_evaluation_summary
+from app.agent.decision_engine import (
+    evaluate_practices,
+    load_skipper_config,
+)
+from app.agent.brain import generate_evaluation_summaries
 from app.slack.practices import (
     post_48h_workout_reminder,
     post_24h_lead_confirmation,
@@ -171,6 +174,13 @@ def run_24h_check(channel_override: str = None) -> dict:
         'practices': []
     }
 
+    # Fetch shared weather/trail/AQI/calendar inputs once for the whole run
+    batch = evaluate_practices(practices)
+    results['timings'] = batch.timings
+
+    # Summarize every evaluation in one concurrent pass
+    summaries = generate_evaluation_summaries(list(batch.evaluations.values()))
+
     # Collect practices needing lead confirmation with their lead Slack IDs
     practices_needing_confirmation = []
 
@@ -179,8 +189,8 @@ def run_24h_check(channel_override: str = None) -> dict:
             logger.info(f"Checking practice {practice.id}: {practice.date}")
 
             # Evaluate current conditions
-            evaluation = evaluate_practice(practice)
-            summary = generate_evaluation_summary(evaluation)
+            evaluation = batch.get(practice.id)
+            summary = summaries[practice.id]
 
             practice_result = {
                 'id': practice.id,
@@ -8,7 +8,11 @@ from app.integrations.weather import get_weather_for_location
 from app.models import db
 from app.practices.interfaces import PracticeStatus
 from app.practices.models import Practice
-from app.practices.service import convert_practice_to_info, published_practices
+from app.practices.service import (
+    PRACTICE_INFO_LOADER,
+    convert_practice_to_info,
+    published_practices,
+)
 from app.slack.blocks import (
     build_weekly_summary_blocks,
     build_weekly_summary_fallback_text,
@@ -60,7 +64,7 @@ def run_weekly_summary(
     end = start + timedelta(days=7)
     config = load_skipper_config()
     dry_run = config.get("agent", {}).get("dry_run", True)
-    practices = published_practices().filter(
+    practices = published_practices(PRACTICE_INFO_LOADER).filter(
         Practice.date >= start,
         Practice.date < end,
         Practice.status.in_(
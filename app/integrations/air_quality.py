@@ -5,10 +5,11 @@ Provides AQI data for practice locations to ensure member safety.
 """
 
 import logging
+import math
 import os
 import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterable, Optional
 from dataclasses import dataclass
 import requests
 
@@ -26,6 +27,11 @@ _last_request_time: Optional[float] = None
 _cache: dict = {}
 CACHE_TTL_MINUTES = 30
 
+# Batch lookups treat coordinates this close together as one AirNow reporting
+# area. Metro reporting areas span far more than this, so every Twin Cities
+# venue collapses to a single request.
+REPORTING_AREA_RADIUS_MILES = 15
+
 
 @dataclass
 class AirQualityInfo:
@@ -79,31 +85,17 @@ def _is_cache_valid(cache_entry: dict) -> bool:
     return age < timedelta(minutes=CACHE_TTL_MINUTES)
 
 
-def get_air_quality(lat: float, lon: float) -> Optional[AirQualityInfo]:
-    """
-    Get current air quality for a location.
-
-    Args:
-        lat: Latitude
-        lon: Longitude
-
-    Returns:
-        AirQualityInfo dataclass or None if unavailable
-    """
-    logger.info(f"Fetching air quality for ({lat}, {lon})")
+def _distance_miles(a: tuple[float, float], b: tuple[float, float]) -> float:
+    """Great-circle distance between two (lat, lon) points in miles."""
+    lat1, lon1 = map(math.radians, a)
+    lat2, lon2 = map(math.radians, b)
+    h = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * 3958.8 * math.asin(math.sqrt(h))
 
-    # Check cache first
-    cache_key = _get_cache_key(lat, lon)
-    if cache_key in _cache and _is_cache_valid(_cache[cache_key]):
-        logger.info("Returning cached AQI data")
-        return _cache[cache_key]['data']
-
-    # Get API key from environment
-    api_key = os.environ.get('AIRNOW_API_KEY')
-    if not api_key:
-        logger.warning("AIRNOW_API_KEY not configured - AQI checks disabled")
-        return None
 
+def _fetch_air_quality(lat: float, lon: float, api_key: str) -> Optional[AirQualityInfo]:
+    """Query AirNow for one coordinate, honoring the shared rate limit."""
     # Rate limit check
     if _should_rate_limit():
         wait_time = MIN_REQUEST_INTERVAL_SECONDS - (time.time() - _last_request_time)
@@ -143,13 +135,6 @@ def get_air_quality(lat: float, lon: float) -> Optional[AirQualityInfo]:
         )
 
         logger.info(f"AQI: {aqi_info.aqi} ({aqi_info.category}) - {aqi_info.pollutant}")
-
-        # Cache the result
-        _cache[cache_key] = {
-            'data': aqi_info,
-            'cached_at': datetime.utcnow()
-        }
-
         return aqi_info
 
     except requests.exceptions.RequestException as e:
@@ -160,6 +145,108 @@ def get_air_quality(lat: float, lon: float) -> Optional[AirQualityInfo]:
         return None
 
 
+def get_air_quality(lat: float, lon: float) -> Optional[AirQualityInfo]:
+    """
+    Get current air quality for a location.
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+
+    Returns:
+        AirQualityInfo dataclass or None if unavailable
+    """
+    logger.info(f"Fetching air quality for ({lat}, {lon})")
+
+    # Check cache first
+    cache_key = _get_cache_key(lat, lon)
+    if cache_key in _cache and _is_cache_valid(_cache[cache_key]):
+        logger.info("Returning cached AQI data")
+        return _cache[cache_key]['data']
+
+    # Get API key from environment
+    api_key = os.environ.get('AIRNOW_API_KEY')
+    if not api_key:
+        logger.warning("AIRNOW_API_KEY not configured - AQI checks disabled")
+        return None
+
+    aqi_info = _fetch_air_quality(lat, lon, api_key)
+    if aqi_info:
+        # Cache the result
+        _cache[cache_key] = {
+            'data': aqi_info,
+            'cached_at': datetime.utcnow()
+        }
+
+    return aqi_info
+
+
+def get_air_quality_batch(
+    coordinates: Iterable[tuple[float, float]]
+) -> dict[tuple[float, float], Optional[AirQualityInfo]]:
+    """
+    Get current air quality for many locations with one request per reporting area.
+
+    Coordinates within REPORTING_AREA_RADIUS_MILES of one another share a
+    single AirNow observation. Every coordinate's reading is written to the
+    cache, so later get_air_quality() calls for the same spots are free.
+
+    Args:
+        coordinates: (lat, lon) pairs, e.g. for every upcoming practice
+
+    Returns:
+        Dict mapping each input (lat, lon) to its AirQualityInfo (or None)
+    """
+    results: dict[tuple[float, float], Optional[AirQualityInfo]] = {}
+    pending: dict[str, list[tuple[float, float]]] = {}
+
+    for coord in coordinates:
+        if coord in results:
+            continue
+        cache_key = _get_cache_key(*coord)
+        if cache_key in _cache and _is_cache_valid(_cache[cache_key]):
+            results[coord] = _cache[cache_key]['data']
+        else:
+            results[coord] = None
+            pending.setdefault(cache_key, []).append(coord)
+
+    if not pending:
+        return results
+
+    api_key = os.environ.get('AIRNOW_API_KEY')
+    if not api_key:
+        logger.warning("AIRNOW_API_KEY not configured - AQI checks disabled")
+        return results
+
+    # Greedily group uncached coordinates around the first member of each area
+    areas: list[tuple[tuple[float, float], list[str]]] = []
+    for cache_key, coords in pending.items():
+        anchor = coords[0]
+        for area_anchor, keys in areas:
+            if _distance_miles(anchor, area_anchor) <= REPORTING_AREA_RADIUS_MILES:
+                keys.append(cache_key)
+                break
+        else:
+            areas.append((anchor, [cache_key]))
+
+    logger.info(f"Fetching air quality for {len(pending)} locations "
+                f"in {len(areas)} reporting areas")
+
+    for (lat, lon), keys in areas:
+        aqi_info = _fetch_air_quality(lat, lon, api_key)
+        if not aqi_info:
+            continue
+        for cache_key in keys:
+            _cache[cache_key] = {
+                'data': aqi_info,
+                'cached_at': datetime.utcnow()
+            }
+            for coord in pending[cache_key]:
+                results[coord] = aqi_info
+
+    return results
+
+
 def clear_cache():
     """Clear the AQI cache (useful for testing)."""
     global _cache
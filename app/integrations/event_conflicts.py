@@ -4,10 +4,11 @@ Event conflict detection for ski practices.
 Scrapes race calendars and venue closures to identify conflicts with scheduled practices.
 """
 
+import bisect
 import logging
 import re
 import time
-from datetime import datetime, timedelta
+from datetime import date as date_type, datetime, timedelta
 from typing import Optional
 import requests
 from bs4 import BeautifulSoup
@@ -245,18 +246,59 @@ def _scrape_skinnyski_races() -> list[EventConflict]:
         return []
 
 
-def _get_cached_conflicts() -> list[EventConflict]:
+class _ConflictIndex:
     """
-    Get cached event conflicts from all sources.
+    Date-sorted view over scraped conflicts.
+
+    Built once per cache fill so lookups bisect on date instead of scanning the
+    whole calendar, and location names are lowercased up front rather than on
+    every comparison.
+    """
+
+    def __init__(self, conflicts: list[EventConflict]):
+        ordered = sorted(conflicts, key=lambda c: c.date)
+        self.conflicts = ordered
+        self.dates = [c.date.date() for c in ordered]
+        self.locations = [c.location.lower() if c.location else None for c in ordered]
+
+    def in_range(
+        self,
+        start: date_type,
+        end: date_type,
+        location_name: Optional[str] = None
+    ) -> list[EventConflict]:
+        """Conflicts dated start..end inclusive, optionally fuzzy-matched to a location."""
+        lo = bisect.bisect_left(self.dates, start)
+        hi = bisect.bisect_right(self.dates, end)
+
+        if not location_name:
+            return self.conflicts[lo:hi]
+
+        location_lower = location_name.lower()
+        matches = []
+        for i in range(lo, hi):
+            conflict_location_lower = self.locations[i]
+            # No location info, keep it (might affect any location).
+            # Otherwise fuzzy match: check if either name contains the other.
+            if (conflict_location_lower is None or
+                    location_lower in conflict_location_lower or
+                    conflict_location_lower in location_lower):
+                matches.append(self.conflicts[i])
+        return matches
+
+
+def _get_conflict_index() -> _ConflictIndex:
+    """
+    Get the indexed event conflicts from all sources, scraping if the cache is stale.
 
     Returns:
-        List of EventConflict objects
+        _ConflictIndex over all cached conflicts
     """
     cache_key = 'all_conflicts'
 
     if cache_key in _cache and _is_cache_valid(_cache[cache_key]):
         logger.info("Returning cached event conflicts")
-        return _cache[cache_key]['data']
+        return _cache[cache_key]['index']
 
     # Scrape fresh data from all sources
     all_conflicts = []
@@ -273,14 +315,37 @@ def _get_cached_conflicts() -> list[EventConflict]:
     # - MNLA events
     # - Park closure notices
 
+    index = _ConflictIndex(all_conflicts)
+
     # Update cache
     _cache[cache_key] = {
-        'data': all_conflicts,
+        'data': index.conflicts,
+        'index': index,
         'cached_at': datetime.utcnow()
     }
 
     logger.info(f"Cached {len(all_conflicts)} total event conflicts")
-    return all_conflicts
+    return index
+
+
+def _get_cached_conflicts() -> list[EventConflict]:
+    """
+    Get cached event conflicts from all sources.
+
+    Returns:
+        List of EventConflict objects, sorted by date
+    """
+    return _get_conflict_index().conflicts
+
+
+def get_all_event_conflicts() -> list[EventConflict]:
+    """
+    Get every cached event conflict, scraping if the cache is stale.
+
+    Returns:
+        List of EventConflict objects, sorted by date
+    """
+    return _get_cached_conflicts()
 
 
 def get_event_conflicts(date: datetime, location_name: Optional[str] = None) -> list[EventConflict]:
@@ -297,38 +362,30 @@ def get_event_conflicts(date: datetime, location_name: Optional[str] = None) ->
     logger.info(f"Checking event conflicts for {date.date()}"
                f"{f' at {location_name}' if location_name else ''}")
 
-    # Get all cached conflicts
-    all_conflicts = _get_cached_conflicts()
-
-    # Filter by date (same day)
     target_date = date.date()
-    matching_conflicts = [
-        conflict for conflict in all_conflicts
-        if conflict.date.date() == target_date
-    ]
-
-    # If location specified, filter by location
-    if location_name:
-        location_lower = location_name.lower()
-        location_matches = []
+    matching_conflicts = _get_conflict_index().in_range(target_date, target_date, location_name)
 
-        for conflict in matching_conflicts:
-            if not conflict.location:
-                # No location info, keep it (might affect any location)
-                location_matches.append(conflict)
-                continue
+    logger.info(f"Found {len(matching_conflicts)} event conflicts")
+    return matching_conflicts
 
-            conflict_location_lower = conflict.location.lower()
 
-            # Fuzzy match: check if either name contains the other
-            if (location_lower in conflict_location_lower or
-                conflict_location_lower in location_lower):
-                location_matches.append(conflict)
+def get_event_conflicts_between(
+    start: datetime,
+    end: datetime,
+    location_name: Optional[str] = None
+) -> list[EventConflict]:
+    """
+    Get event conflicts in a date window, e.g. for weekly or newsletter race listings.
 
-        matching_conflicts = location_matches
+    Args:
+        start: First date of the window (inclusive)
+        end: Last date of the window (inclusive)
+        location_name: Optional location name to filter by (fuzzy match)
 
-    logger.info(f"Found {len(matching_conflicts)} event conflicts")
-    return matching_conflicts
+    Returns:
+        List of EventConflict objects in the window, sorted by date
+    """
+    return _get_conflict_index().in_range(start.date(), end.date(), location_name)
 
 
 def clear_cache():
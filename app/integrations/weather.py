@@ -279,29 +279,61 @@ def _parse_forecast_period(period: dict, target_datetime: datetime, alerts: list
     )
 
 
-def get_weather_forecast(lat: float, lon: float, target_datetime: datetime) -> WeatherConditions:
+def _resolve_grid(lat: float, lon: float) -> dict:
+    """Grid coordinates for a point, raising if NWS did not return a usable cell."""
+    # Get grid coordinates (cached)
+    grid_info = _get_grid_coordinates(lat, lon)
+
+    # Validate required grid coordinates
+    if not grid_info.get('gridId') or grid_info.get('gridX') is None or grid_info.get('gridY') is None:
+        raise ValueError(f"Could not determine NWS grid coordinates for ({lat},{lon})")
+
+    return grid_info
+
+
+def get_forecast_grid(lat: float, lon: float) -> tuple[str, int, int]:
     """
-    Get weather conditions for a specific location and time.
+    Get the NWS forecast grid cell for a location.
+
+    Locations in the same cell share one hourly forecast, so batch callers
+    can group by this key and fetch each forecast once.
+
+    Returns:
+        (gridId, gridX, gridY) tuple
+
+    Raises:
+        requests.exceptions.RequestException: If the points lookup fails
+        ValueError: If NWS returns no grid for the location
+    """
+    grid_info = _resolve_grid(lat, lon)
+    return grid_info['gridId'], grid_info['gridX'], grid_info['gridY']
+
+
+def get_weather_forecasts(
+    lat: float,
+    lon: float,
+    target_datetimes: list[datetime]
+) -> list[Optional[WeatherConditions]]:
+    """
+    Get weather conditions for several times at one location.
+
+    Shares a single grid, hourly forecast and alerts lookup across all
+    target times.
 
     Args:
         lat: Latitude
         lon: Longitude
-        target_datetime: Target datetime for forecast
+        target_datetimes: Target datetimes for forecasts
 
     Returns:
-        WeatherConditions dataclass
+        WeatherConditions per target datetime (None where no forecast period exists)
 
     Raises:
         requests.exceptions.RequestException: If API calls fail
     """
-    logger.info(f"Getting weather for ({lat},{lon}) at {target_datetime}")
+    logger.info(f"Getting weather for ({lat},{lon}) at {len(target_datetimes)} times")
 
-    # Get grid coordinates (cached)
-    grid_info = _get_grid_coordinates(lat, lon)
-
-    # Validate required grid coordinates
-    if not grid_info.get('gridId') or grid_info.get('gridX') is None or grid_info.get('gridY') is None:
-        raise ValueError(f"Could not determine NWS grid coordinates for ({lat},{lon})")
+    grid_info = _resolve_grid(lat, lon)
 
     # Get hourly forecast
     periods = _get_hourly_forecast(
@@ -310,12 +342,6 @@ def get_weather_forecast(lat: float, lon: float, target_datetime: datetime) -> W
         grid_info['gridY']
     )
 
-    # Find closest forecast to target time
-    closest_period = _find_closest_forecast(periods, target_datetime)
-
-    if not closest_period:
-        raise ValueError(f"No forecast data available for {target_datetime}")
-
     # Fetch weather alerts (before constructing dataclass)
     alerts = []
     try:
@@ -324,8 +350,40 @@ def get_weather_forecast(lat: float, lon: float, target_datetime: datetime) -> W
         logger.warning(f"Failed to fetch weather alerts: {e}")
         # Continue without alerts rather than failing
 
-    # Parse into WeatherConditions with alerts included
-    weather = _parse_forecast_period(closest_period, target_datetime, alerts)
+    forecasts = []
+    for target_datetime in target_datetimes:
+        # Find closest forecast to target time
+        closest_period = _find_closest_forecast(periods, target_datetime)
+        if not closest_period:
+            forecasts.append(None)
+            continue
+        # Parse into WeatherConditions with alerts included
+        forecasts.append(_parse_forecast_period(closest_period, target_datetime, alerts))
+
+    return forecasts
+
+
+def get_weather_forecast(lat: float, lon: float, target_datetime: datetime) -> WeatherConditions:
+    """
+    Get weather conditions for a specific location and time.
+
+    Args:
+        lat: Latitude
+        lon: Longitude
+        target_datetime: Target datetime for forecast
+
+    Returns:
+        WeatherConditions dataclass
+
+    Raises:
+        requests.exceptions.RequestException: If API calls fail
+    """
+    logger.info(f"Getting weather for ({lat},{lon}) at {target_datetime}")
+
+    weather = get_weather_forecasts(lat, lon, [target_datetime])[0]
+
+    if not weather:
+        raise ValueError(f"No forecast data available for {target_datetime}")
 
     return weather
 
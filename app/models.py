@@ -238,6 +238,8 @@ class User(db.Model):
             status.in_([UserStatus.PENDING, UserStatus.ACTIVE, UserStatus.ALUMNI, UserStatus.DROPPED]),
             name='check_user_status_valid'
         ),
+        # Slack sync matches members by email case-insensitively.
+        db.Index('ix_users_email_lower', db.func.lower(email)),
     )
 
 class Season(db.Model):
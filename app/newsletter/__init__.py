@@ -8,9 +8,12 @@ Modules:
 - models: Database models for newsletters, versions, submissions, digests
 - interfaces: Enums and dataclasses for type-safe communication
 - collector: Slack message collection from configured channels
+- archive: Incremental Slack message archive the newsletter reads from
 - news_scraper: SkinnySkI, Loppet, Three Rivers scrapers
 - generator: Claude Opus 4.5 newsletter generation (direct approach)
 - mcp_server: MCP tools for agentic newsletter generation
+- prompt_cache: Prompt-caching breakpoints and token usage for Claude calls
+- context_budget: Ranking and token budgets for the generation context
 - slack_actions: Living post management and publishing
 - modals: Slack modal builders for /dispatch command
 - service: Scheduler entry points and orchestration
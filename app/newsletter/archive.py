@@ -0,0 +1,290 @@
+"""
+Slack message archive for the Weekly Dispatch newsletter.
+
+Every daily update used to re-collect the whole week from every channel,
+threads included, although almost all of it had been fetched the day
+before. Collected messages now land in slack_message_archive, keyed by
+(channel_id, ts), and slack_channel_cursors records per channel how far back
+the archive reaches (covered_from) and when it was last collected
+(collected_through).
+
+A sync only asks Slack for a channel's history from REFRESH_WINDOW before
+its collected_through onward, so messages that recent get fresh engagement
+counts, edits and new thread replies, and those Slack no longer returns are
+deleted from the archive. Anything older is served as archived. A request
+reaching further back than covered_from backfills the channel from the
+requested start instead. Threads whose reply count has not changed since the
+last sync are not re-fetched. Readers (the newsletter service, the content
+analysis script, the MCP collect tool) call collect_archived_messages(),
+which syncs and then reads the archive for the channels currently configured.
+
+Bookkeeping times (collected_through, first_seen_at, refreshed_at) are UTC
+like the models' defaults. posted_at and covered_from are in the server's
+local time, as the collector parses Slack timestamps.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Mapping
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.models import db
+from app.newsletter.collector import (
+    channel_targets,
+    collect_channels,
+    sort_messages,
+)
+from app.newsletter.interfaces import MessageVisibility, SlackMessage
+from app.newsletter.models import SlackChannelCursor, SlackMessageArchive
+
+logger = logging.getLogger(__name__)
+
+# Messages posted this long before the previous sync are re-fetched to
+# refresh their engagement counts, edits and thread replies.
+REFRESH_WINDOW = timedelta(days=2)
+
+
+def _as_local(utc: datetime) -> datetime:
+    """A naive UTC time in the naive local time posted_at uses."""
+    return utc.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+
+
+def _fetch_since(cursor, since: datetime) -> datetime:
+    """Lower bound to collect one channel from, given its cursor."""
+    if cursor is None or since < cursor[0]:
+        return since
+    _covered_from, collected_through = cursor
+    return max(since, _as_local(collected_through) - REFRESH_WINDOW)
+
+
+def _known_reply_counts(session: Session, since: datetime) -> dict[str, dict[str, int]]:
+    """channel_id -> parent ts -> archived reply_count, for threaded parents.
+
+    A thread whose reply count is unchanged since the last run already has
+    its replies archived, so the collector skips fetching it again.
+    """
+    known: dict[str, dict[str, int]] = {}
+    rows = (
+        session.query(
+            SlackMessageArchive.channel_id,
+            SlackMessageArchive.message_ts,
+            SlackMessageArchive.reply_count,
+        )
+        .filter(
+            SlackMessageArchive.thread_ts.is_(None),
+            SlackMessageArchive.reply_count > 0,
+            SlackMessageArchive.posted_at >= since,
+        )
+        .all()
+    )
+    for channel_id, message_ts, reply_count in rows:
+        known.setdefault(channel_id, {})[message_ts] = reply_count
+    return known
+
+
+def _store_batch(session: Session, batch, now: datetime) -> tuple[int, int, int]:
+    """Upsert one channel's messages; returns (inserted, refreshed, deleted).
+
+    Archived rows in the collected range that Slack no longer returned were
+    deleted there: parents posted since batch.since, the replies under them,
+    and replies missing from a thread that was fetched in full.
+    """
+    returned = {m.message_ts for m in batch.messages}
+    vanished_parents = [
+        row.message_ts
+        for row in session.query(SlackMessageArchive).filter(
+            SlackMessageArchive.channel_id == batch.channel_id,
+            SlackMessageArchive.thread_ts.is_(None),
+            SlackMessageArchive.posted_at >= batch.since,
+        )
+        if row.message_ts not in returned
+    ]
+    deleted = 0
+    if vanished_parents or batch.fetched_threads:
+        stale = session.query(SlackMessageArchive).filter(
+            SlackMessageArchive.channel_id == batch.channel_id,
+            or_(
+                SlackMessageArchive.message_ts.in_(vanished_parents),
+                SlackMessageArchive.thread_ts.in_(vanished_parents),
+                # Replies are only fetched from batch.since onward
+                and_(
+                    SlackMessageArchive.thread_ts.in_(batch.fetched_threads),
+                    SlackMessageArchive.posted_at >= batch.since,
+                ),
+            ),
+        )
+        for row in stale:
+            if row.message_ts not in returned:
+                session.delete(row)
+                deleted += 1
+
+    if not batch.messages:
+        return 0, 0, deleted
+
+    existing = {
+        row.message_ts: row
+        for row in session.query(SlackMessageArchive).filter(
+            SlackMessageArchive.channel_id == batch.channel_id,
+            SlackMessageArchive.message_ts.in_(returned),
+        )
+    }
+    # A thread whose replies failed to fetch keeps its archived reply count
+    # (0 for a new parent), so the next run sees a change and fetches it.
+    failed_threads = set(batch.failed_threads)
+    inserted = refreshed = 0
+    for msg in batch.messages:
+        row = existing.get(msg.message_ts)
+        reply_count = msg.reply_count
+        if msg.message_ts in failed_threads:
+            reply_count = row.reply_count if row is not None else 0
+        if row is None:
+            row = SlackMessageArchive(
+                channel_id=msg.channel_id,
+                message_ts=msg.message_ts,
+                first_seen_at=now,
+            )
+            session.add(row)
+            existing[msg.message_ts] = row
+            inserted += 1
+        else:
+            refreshed += 1
+        row.channel_name = msg.channel_name
+        row.thread_ts = msg.thread_ts
+        row.user_id = msg.user_id
+        row.user_name = msg.user_name
+        row.text = msg.text
+        row.permalink = msg.permalink
+        row.reaction_count = msg.reaction_count
+        row.reply_count = reply_count
+        row.visibility = msg.visibility.value
+        row.posted_at = msg.posted_at
+        row.refreshed_at = now
+    return inserted, refreshed, deleted
+
+
+def sync_archive(since: datetime) -> dict[str, MessageVisibility]:
+    """Bring the archive up to date for every channel from `since` onward.
+
+    The sync reads and writes through its own sessions, so its commit never
+    carries (and a failure never rolls back) the caller's unit of work.
+
+    Args:
+        since: Earliest posted_at the caller needs.
+
+    Returns:
+        Channel id -> visibility for every current target that resolved,
+        including channels that failed to collect this time.
+    """
+    now = datetime.utcnow()
+    with Session(db.engine) as session:
+        # Plain tuples: since_for runs on collector worker threads.
+        cursors = {
+            c.channel_id: (c.covered_from, c.collected_through)
+            for c in session.query(SlackChannelCursor)
+        }
+        known_reply_counts = _known_reply_counts(session, since)
+
+    batches = collect_channels(
+        channel_targets(),
+        lambda channel_id: _fetch_since(cursors.get(channel_id), since),
+        known_reply_counts=known_reply_counts,
+    )
+
+    channels: dict[str, MessageVisibility] = {}
+    stats = {'failed': 0, 'inserted': 0, 'refreshed': 0, 'deleted': 0}
+    with Session(db.engine) as session:
+        for batch in batches:
+            if batch.channel_id is not None:
+                channels[batch.channel_id] = (
+                    MessageVisibility.PRIVATE if batch.is_private else MessageVisibility.PUBLIC
+                )
+            if not batch.ok:
+                # Leave the archive and cursor alone; the next run retries.
+                stats['failed'] += 1
+                continue
+
+            inserted, refreshed, deleted = _store_batch(session, batch, now)
+            stats['inserted'] += inserted
+            stats['refreshed'] += refreshed
+            stats['deleted'] += deleted
+
+            cursor = session.get(SlackChannelCursor, batch.channel_id)
+            if cursor is None:
+                cursor = SlackChannelCursor(
+                    channel_id=batch.channel_id,
+                    covered_from=batch.since,
+                    collected_through=now,
+                )
+                session.add(cursor)
+            cursor.channel_name = batch.channel_name
+            cursor.covered_from = min(cursor.covered_from, batch.since)
+            cursor.collected_through = now
+
+        session.commit()
+
+    logger.info(
+        f"Slack archive sync: {stats['inserted']} new, {stats['refreshed']} "
+        f"refreshed, {stats['deleted']} deleted across {len(batches)} channels "
+        f"({stats['failed']} failed)"
+    )
+    return channels
+
+
+def archived_messages(
+    since: datetime,
+    channels: Mapping[str, MessageVisibility],
+) -> list[SlackMessage]:
+    """Archived messages from `channels` posted at or after `since`, most recent first.
+
+    Visibility comes from `channels` (the current targets), not from what
+    was stored, so a channel made private since it was archived is read as
+    private and loses its permalinks.
+    """
+    if not channels:
+        return []
+    rows = (
+        SlackMessageArchive.query
+        .filter(
+            SlackMessageArchive.channel_id.in_(list(channels)),
+            SlackMessageArchive.posted_at >= since,
+        )
+        .order_by(SlackMessageArchive.channel_id, SlackMessageArchive.message_ts)
+        .all()
+    )
+    messages = []
+    for row in rows:
+        visibility = channels[row.channel_id]
+        messages.append(SlackMessage(
+            channel_id=row.channel_id,
+            channel_name=row.channel_name or row.channel_id,
+            message_ts=row.message_ts,
+            user_id=row.user_id,
+            user_name=row.user_name,
+            text=row.text,
+            permalink=row.permalink if visibility == MessageVisibility.PUBLIC else None,
+            reaction_count=row.reaction_count or 0,
+            reply_count=row.reply_count or 0,
+            visibility=visibility,
+            posted_at=row.posted_at,
+            thread_ts=row.thread_ts,
+        ))
+    return sort_messages(messages)
+
+
+def collect_archived_messages(since: datetime) -> list[SlackMessage]:
+    """Sync the archive, then return every message since `since`.
+
+    A channel that fails to collect is read from the archive as it stands,
+    so a Slack error degrades to yesterday's data rather than no data. If
+    the sync fails outright there is no current channel list to read with,
+    and nothing is returned rather than messages from channels that may
+    have been excluded since.
+    """
+    try:
+        channels = sync_archive(since)
+    except Exception as e:
+        logger.error(f"Slack archive sync failed, no channels to read: {e}")
+        return []
+    return archived_messages(since, channels)
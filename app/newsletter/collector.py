@@ -7,8 +7,12 @@ respecting privacy rules and engagement metrics for newsletter content.
 
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Mapping, NamedTuple, Optional
 
 import yaml
 from slack_sdk.errors import SlackApiError
@@ -27,6 +31,14 @@ logger = logging.getLogger(__name__)
 # Cache for channel info to avoid repeated lookups
 _channel_cache: dict[str, dict] = {}
 _user_cache: dict[str, str] = {}
+# Workspace base URL (e.g. https://example.slack.com/) for building permalinks
+_workspace_url: Optional[str] = None
+_workspace_url_lock = threading.Lock()
+
+# Channels collected concurrently by collect_all_messages(). Kept small: the
+# history/replies methods share per-workspace Slack rate limits.
+COLLECT_WORKERS_ENV = 'NEWSLETTER_COLLECT_WORKERS'
+DEFAULT_COLLECT_WORKERS = 4
 
 
 def _load_config() -> dict:
@@ -80,15 +92,61 @@ def _get_channel_info(channel_id: str) -> dict:
         return {'name': '', 'is_private': False}
 
 
-def _get_user_name(user_id: str) -> str:
-    """Get user display name with caching.
+def load_user_directory() -> Mapping[str, str]:
+    """Every workspace member's display name, from one paginated users.list.
+
+    Loaded once per collection run and handed to every channel, so a busy
+    week costs a handful of users.list pages instead of a users.info call
+    per distinct author. Names follow _get_user_name's preference order.
+
+    Returns:
+        Read-only user_id -> name map; empty if the listing fails, in which
+        case names fall back to per-user lookups.
+    """
+    client = get_slack_client()
+    names: dict[str, str] = {}
+    cursor = None
+
+    try:
+        while True:
+            result = client.users_list(cursor=cursor, limit=200)
+            for member in result.get('members', []):
+                user_id = member.get('id')
+                if not user_id:
+                    continue
+                profile = member.get('profile', {})
+                names[user_id] = (
+                    profile.get('display_name')
+                    or profile.get('real_name')
+                    or user_id
+                )
+
+            cursor = result.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+    except SlackApiError as e:
+        logger.warning(f"Could not list Slack users, falling back to lookups: {e}")
+        return MappingProxyType({})
+
+    logger.info(f"Loaded {len(names)} Slack user names")
+    return MappingProxyType(names)
+
+
+def _get_user_name(
+    user_id: str,
+    directory: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Get user display name, preferring the run's prefetched directory.
 
     Args:
         user_id: Slack user ID.
+        directory: Map from load_user_directory(), if the caller has one.
 
     Returns:
         User display name or user_id if lookup fails.
     """
+    if directory and user_id in directory:
+        return directory[user_id]
     if user_id in _user_cache:
         return _user_cache[user_id]
 
@@ -146,6 +204,53 @@ def get_message_permalink(channel_id: str, message_ts: str) -> Optional[str]:
         raise
 
 
+def _get_workspace_url() -> str:
+    """Workspace base URL, resolved once per process.
+
+    SLACK_WORKSPACE_DOMAIN wins when set (as in slack.client's permalink
+    builder); otherwise auth.test supplies it. Falls back to the club's
+    domain if neither is available.
+    """
+    global _workspace_url
+    with _workspace_url_lock:
+        if _workspace_url:
+            return _workspace_url
+
+        domain = os.environ.get('SLACK_WORKSPACE_DOMAIN')
+        if domain:
+            url = f"https://{domain}.slack.com/"
+        else:
+            try:
+                url = get_slack_client().auth_test().get('url') or ''
+            except SlackApiError as e:
+                logger.warning(f"Could not resolve Slack workspace URL: {e}")
+                url = ''
+            url = url or "https://twincitiesskiclub.slack.com/"
+        if not url.endswith('/'):
+            url += '/'
+        _workspace_url = url
+        return url
+
+
+def build_message_permalink(
+    channel_id: str,
+    message_ts: str,
+    thread_ts: Optional[str] = None,
+) -> str:
+    """Construct a message permalink locally, without chat.getPermalink.
+
+    Format: {workspace}/archives/{channel}/p{ts without the dot}, plus the
+    thread_ts/cid query Slack uses to open a reply inside its thread.
+    """
+    permalink = (
+        f"{_get_workspace_url()}archives/{channel_id}/"
+        f"p{message_ts.replace('.', '')}"
+    )
+    if thread_ts and thread_ts != message_ts:
+        permalink += f"?thread_ts={thread_ts}&cid={channel_id}"
+    return permalink
+
+
 def _parse_message_timestamp(ts: str) -> Optional[datetime]:
     """Convert Slack message timestamp to datetime.
 
@@ -194,11 +299,42 @@ def _count_replies(message: dict) -> int:
     wait=wait_exponential(multiplier=1, min=2, max=30),
     reraise=True,
 )
+def _fetch_thread_pages(channel_id: str, thread_ts: str, oldest_ts: str) -> list[dict]:
+    """Page through a thread; raises so a failed page retries the whole thread."""
+    client = get_slack_client()
+    replies = []
+    cursor = None
+
+    while True:
+        params = {
+            'channel': channel_id,
+            'ts': thread_ts,
+            'oldest': oldest_ts,
+            'limit': 100,
+        }
+        if cursor:
+            params['cursor'] = cursor
+
+        result = client.conversations_replies(**params)
+
+        for msg in result.get('messages', []):
+            # Skip the parent message (same ts as thread_ts)
+            if msg.get('ts') == thread_ts:
+                continue
+            replies.append(msg)
+
+        cursor = result.get('response_metadata', {}).get('next_cursor')
+        if not cursor:
+            break
+
+    return replies
+
+
 def _fetch_thread_replies(
     channel_id: str,
     thread_ts: str,
     since: datetime,
-) -> list[dict]:
+) -> Optional[list[dict]]:
     """Fetch all replies in a thread.
 
     Args:
@@ -207,44 +343,40 @@ def _fetch_thread_replies(
         since: Only include replies after this timestamp.
 
     Returns:
-        List of reply message dicts (excluding parent message).
+        List of reply message dicts (excluding parent message), or None if
+        the thread could not be fetched completely after retries.
     """
-    client = get_slack_client()
-    replies = []
-    cursor = None
-    oldest_ts = str(since.timestamp())
-
     try:
-        while True:
-            params = {
-                'channel': channel_id,
-                'ts': thread_ts,
-                'oldest': oldest_ts,
-                'limit': 100,
-            }
-            if cursor:
-                params['cursor'] = cursor
-
-            result = client.conversations_replies(**params)
-
-            for msg in result.get('messages', []):
-                # Skip the parent message (same ts as thread_ts)
-                if msg.get('ts') == thread_ts:
-                    continue
-                replies.append(msg)
-
-            cursor = result.get('response_metadata', {}).get('next_cursor')
-            if not cursor:
-                break
-
+        return _fetch_thread_pages(channel_id, thread_ts, str(since.timestamp()))
     except SlackApiError as e:
         error_code = e.response.get('error', '')
         logger.warning(
             f"Failed to fetch thread replies for {thread_ts}: {error_code}"
         )
-        return []
+        return None
 
-    return replies
+
+def _thread_fetch_needed(
+    message: dict,
+    since: datetime,
+    known_reply_count: Optional[int],
+) -> bool:
+    """Whether a parent's thread can hold replies this run doesn't have.
+
+    A thread whose latest reply predates `since` has nothing to return, and
+    one whose reply count matches what the archive stored last run has
+    already been collected.
+    """
+    latest_reply = message.get('latest_reply')
+    if latest_reply:
+        try:
+            if float(latest_reply) < since.timestamp():
+                return False
+        except (TypeError, ValueError):
+            pass
+    if known_reply_count is not None and known_reply_count == _count_replies(message):
+        return False
+    return True
 
 
 @retry(
@@ -256,7 +388,10 @@ def _fetch_thread_replies(
 def collect_channel_messages(
     channel_id: str,
     since: datetime,
-    is_private: bool = False
+    is_private: bool = False,
+    user_names: Optional[Mapping[str, str]] = None,
+    known_reply_counts: Optional[Mapping[str, int]] = None,
+    thread_stats: Optional[dict] = None,
 ) -> list[SlackMessage]:
     """Collect messages from a single Slack channel.
 
@@ -264,6 +399,14 @@ def collect_channel_messages(
         channel_id: Slack channel ID to collect from.
         since: Only collect messages after this timestamp.
         is_private: Whether this is a private channel (affects privacy rules).
+        user_names: Prefetched directory from load_user_directory(); authors
+            missing from it are looked up one by one.
+        known_reply_counts: parent ts -> reply_count already archived; a
+            thread whose count is unchanged is not fetched again.
+        thread_stats: If given, receives the number of skipped thread
+            fetches under 'skipped', the parent ts of every thread whose
+            replies were fetched under 'fetched', and of every thread that
+            failed to fetch under 'failed'.
 
     Returns:
         List of SlackMessage objects.
@@ -294,6 +437,9 @@ def collect_channel_messages(
     cursor = None
     total_fetched = 0
     thread_replies_fetched = 0
+    threads_skipped = 0
+    fetched_threads: list[str] = []
+    failed_threads: list[str] = []
 
     try:
         while True:
@@ -328,12 +474,12 @@ def collect_channel_messages(
                     continue
 
                 # Get user name
-                user_name = _get_user_name(user_id)
+                user_name = _get_user_name(user_id, user_names)
 
                 # Get permalink only for public channels
                 permalink = None
                 if not is_private:
-                    permalink = get_message_permalink(channel_id, message_ts)
+                    permalink = build_message_permalink(channel_id, message_ts)
 
                 # Create SlackMessage for the parent message
                 reply_count = _count_replies(msg)
@@ -353,12 +499,24 @@ def collect_channel_messages(
                 messages.append(slack_message)
 
                 # Fetch thread replies if this message has replies
-                if reply_count > 0:
+                # that this run could still be missing
+                if reply_count > 0 and not _thread_fetch_needed(
+                    msg, since, (known_reply_counts or {}).get(message_ts)
+                ):
+                    threads_skipped += 1
+                elif reply_count > 0:
                     thread_replies = _fetch_thread_replies(
                         channel_id=channel_id,
                         thread_ts=message_ts,
                         since=since,
                     )
+                    if thread_replies is None:
+                        # Reported so the archive does not record this
+                        # reply count as collected
+                        failed_threads.append(message_ts)
+                        thread_replies = []
+                    else:
+                        fetched_threads.append(message_ts)
 
                     for reply in thread_replies:
                         # Skip bot messages and messages without user
@@ -373,13 +531,13 @@ def collect_channel_messages(
                             continue
 
                         reply_ts = reply.get('ts', '')
-                        reply_user_name = _get_user_name(reply_user_id)
+                        reply_user_name = _get_user_name(reply_user_id, user_names)
 
                         # Get permalink for reply (public channels only)
                         reply_permalink = None
                         if not is_private:
-                            reply_permalink = get_message_permalink(
-                                channel_id, reply_ts
+                            reply_permalink = build_message_permalink(
+                                channel_id, reply_ts, thread_ts=message_ts
                             )
 
                         reply_message = SlackMessage(
@@ -408,8 +566,13 @@ def collect_channel_messages(
         logger.info(
             f"Collected {len(messages)} messages from #{channel_name} "
             f"({parent_count} parent + {thread_replies_fetched} thread replies, "
-            f"scanned {total_fetched} total)"
+            f"scanned {total_fetched} total, "
+            f"skipped {threads_skipped} unchanged threads)"
         )
+        if thread_stats is not None:
+            thread_stats['skipped'] = threads_skipped
+            thread_stats['fetched'] = fetched_threads
+            thread_stats['failed'] = failed_threads
 
     except SlackApiError as e:
         error_code = e.response.get('error', '')
@@ -499,19 +662,123 @@ def _resolve_channel_id(channel_name: str) -> Optional[str]:
     return None
 
 
-def collect_all_messages(since: datetime) -> list[SlackMessage]:
-    """Collect messages from all configured channels.
+class _RateLimitGate:
+    """Pool-wide pause after Slack answers a channel with ``ratelimited``.
 
-    Reads channel configuration from config/newsletter.yaml:
-    - Collects from all public channels (where bot is member)
-    - Excludes channels in channels.public_exclude
-    - Includes private channels in channels.private_include (bot must be member)
+    The client's retry handler already honours Retry-After for the call that
+    hit the limit; the gate makes the other workers hold off before starting
+    their next channel instead of piling more requests onto the same limit.
+    """
 
-    Args:
-        since: Only collect messages after this timestamp.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
 
-    Returns:
-        List of SlackMessage objects from all channels, sorted by posted_at desc.
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def note(self, error: SlackApiError) -> None:
+        if error.response.get('error') != 'ratelimited':
+            return
+        try:
+            retry_after = float(error.response.headers.get('Retry-After', 30))
+        except (AttributeError, TypeError, ValueError):
+            retry_after = 30.0
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+
+def _collection_workers() -> int:
+    raw = os.environ.get(COLLECT_WORKERS_ENV, '')
+    try:
+        return max(int(raw), 1) if raw else DEFAULT_COLLECT_WORKERS
+    except ValueError:
+        logger.warning(f"Ignoring invalid {COLLECT_WORKERS_ENV}={raw!r}")
+        return DEFAULT_COLLECT_WORKERS
+
+
+class ChannelBatch(NamedTuple):
+    """Messages collected from one channel by collect_channels()."""
+    channel_name: str
+    channel_id: Optional[str]
+    is_private: bool
+    since: datetime
+    messages: list[SlackMessage]
+    # False when the channel could not be resolved or collection failed
+    ok: bool
+    # Threads not fetched because they could not hold new replies
+    threads_skipped: int = 0
+    # Parent ts of threads whose replies were fetched in full
+    fetched_threads: tuple[str, ...] = ()
+    # Parent ts of threads whose replies could not be fetched
+    failed_threads: tuple[str, ...] = ()
+
+
+def _collect_channel_task(
+    gate: _RateLimitGate,
+    channel_name: str,
+    is_private: bool,
+    channel_id: Optional[str],
+    since_for: Callable[[str], datetime],
+    user_names: Mapping[str, str],
+    known_reply_counts: Mapping[str, Mapping[str, int]],
+) -> ChannelBatch:
+    """Collect one channel on a pool worker, logging how long it took.
+
+    Private channels arrive by name and are resolved here so that lookup
+    runs in parallel too. Failures are logged and yield no messages, exactly
+    as the serial loop did.
+    """
+    label = f"private #{channel_name}" if is_private else f"#{channel_name}"
+    gate.wait()
+    started = time.perf_counter()
+
+    if channel_id is None:
+        channel_id = _resolve_channel_id(channel_name)
+        if not channel_id:
+            logger.warning(
+                f"Private channel #{channel_name} not found or bot not a member"
+            )
+            return ChannelBatch(channel_name, None, is_private, datetime.min, [], False)
+
+    since = since_for(channel_id)
+    thread_stats = {'skipped': 0, 'fetched': [], 'failed': []}
+    try:
+        messages = collect_channel_messages(
+            channel_id=channel_id,
+            since=since,
+            is_private=is_private,
+            user_names=user_names,
+            known_reply_counts=known_reply_counts.get(channel_id),
+            thread_stats=thread_stats,
+        )
+    except SlackApiError as e:
+        gate.note(e)
+        logger.error(f"Failed to collect from {label}: {e}")
+        return ChannelBatch(channel_name, channel_id, is_private, since, [], False)
+
+    logger.info(
+        f"Collected {len(messages)} messages from {label} "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return ChannelBatch(
+        channel_name, channel_id, is_private, since, messages, True,
+        thread_stats['skipped'], tuple(thread_stats['fetched']),
+        tuple(thread_stats['failed']),
+    )
+
+
+def channel_targets() -> list[tuple[str, bool, Optional[str]]]:
+    """(name, is_private, channel_id) for every channel to collect.
+
+    Reads channel configuration from config/newsletter.yaml:
+    - All public channels (where bot is member)
+    - Excluding channels in channels.public_exclude
+    - Plus private channels in channels.private_include (bot must be member);
+      these carry no id yet and are resolved by the collecting worker.
     """
     config = _load_config()
     newsletter_config = config.get('newsletter', {})
@@ -523,74 +790,121 @@ def collect_all_messages(since: datetime) -> list[SlackMessage]:
     # Get inclusion list for private channels
     private_include = channel_config.get('private_include', [])
 
-    all_messages: list[SlackMessage] = []
-
-    # Collect from public channels
     logger.info("Fetching list of public channels...")
     public_channels = _get_all_public_channels()
     logger.info(f"Found {len(public_channels)} public channels with bot membership")
 
+    targets = []
     for channel in public_channels:
         channel_name = channel.get('name', '')
-        channel_id = channel.get('id')
 
         # Skip excluded channels
         if channel_name in public_exclude:
             logger.debug(f"Skipping excluded channel #{channel_name}")
             continue
 
-        try:
-            messages = collect_channel_messages(
-                channel_id=channel_id,
-                since=since,
-                is_private=False,
-            )
-            all_messages.extend(messages)
-        except SlackApiError as e:
-            logger.error(f"Failed to collect from #{channel_name}: {e}")
-            continue
+        targets.append((channel_name, False, channel.get('id')))
 
-    # Collect from configured private channels
     logger.info(f"Collecting from {len(private_include)} private channels...")
     for channel_name in private_include:
-        channel_id = _resolve_channel_id(channel_name)
-        if not channel_id:
-            logger.warning(
-                f"Private channel #{channel_name} not found or bot not a member"
-            )
-            continue
+        targets.append((channel_name, True, None))
 
-        try:
-            messages = collect_channel_messages(
-                channel_id=channel_id,
-                since=since,
-                is_private=True,
+    return targets
+
+
+def collect_channels(
+    targets: list[tuple[str, bool, Optional[str]]],
+    since_for: Callable[[str], datetime],
+    known_reply_counts: Optional[Mapping[str, Mapping[str, int]]] = None,
+) -> list[ChannelBatch]:
+    """Collect every target concurrently; batches come back in target order.
+
+    since_for(channel_id) gives each channel's lower bound. It runs on the
+    worker threads, so it must not touch the database. The user directory is
+    fetched once up front and shared by every channel. known_reply_counts
+    (channel id -> parent ts -> reply_count) lets unchanged threads skip
+    their replies fetch.
+    """
+    gate = _RateLimitGate()
+    user_names = load_user_directory() if targets else MappingProxyType({})
+    with ThreadPoolExecutor(
+        max_workers=_collection_workers(),
+        thread_name_prefix='newsletter-collect',
+    ) as pool:
+        futures = [
+            pool.submit(
+                _collect_channel_task,
+                gate,
+                channel_name,
+                is_private,
+                channel_id,
+                since_for,
+                user_names,
+                known_reply_counts or {},
             )
-            all_messages.extend(messages)
-        except SlackApiError as e:
-            logger.error(f"Failed to collect from private #{channel_name}: {e}")
-            continue
+            for channel_name, is_private, channel_id in targets
+        ]
+        batches = [future.result() for future in futures]
+
+    logger.info(
+        f"Skipped {sum(b.threads_skipped for b in batches)} thread fetches "
+        f"across {len(batches)} channels"
+    )
+    return batches
+
 
-    # Sort by posted_at descending (most recent first)
-    all_messages.sort(
+def sort_messages(messages: list[SlackMessage]) -> list[SlackMessage]:
+    """Sort by posted_at descending (most recent first), in place."""
+    messages.sort(
         key=lambda m: m.posted_at or datetime.min,
         reverse=True,
     )
+    return messages
+
+
+def collect_all_messages(since: datetime) -> list[SlackMessage]:
+    """Collect messages from all configured channels straight from Slack.
+
+    See channel_targets() for which channels are included. Channels are
+    collected concurrently on a small worker pool, but results are combined
+    in channel order before the stable sort, so the returned list is the
+    same as collecting them one after another.
+
+    The newsletter reads through app.newsletter.archive instead, which only
+    fetches what is new since the previous run.
+
+    Args:
+        since: Only collect messages after this timestamp.
+
+    Returns:
+        List of SlackMessage objects from all channels, sorted by posted_at desc.
+    """
+    started = time.perf_counter()
+    targets = channel_targets()
+
+    all_messages: list[SlackMessage] = []
+    # Combine in target order so ties in the sort below keep the serial
+    # loop's ordering.
+    for batch in collect_channels(targets, lambda _channel_id: since):
+        all_messages.extend(batch.messages)
+    sort_messages(all_messages)
 
     logger.info(
         f"Collected {len(all_messages)} total messages from "
-        f"{len(public_channels) - len(public_exclude) + len(private_include)} channels"
+        f"{len(targets)} channels in {time.perf_counter() - started:.2f}s"
     )
 
     return all_messages
 
 
 def clear_caches() -> None:
-    """Clear internal caches for channel and user info.
+    """Clear internal caches for channel info, user info and workspace URL.
 
     Call this if you need fresh data after cache has become stale.
     """
-    global _channel_cache, _user_cache
+    global _channel_cache, _user_cache, _workspace_url
     _channel_cache.clear()
     _user_cache.clear()
+    with _workspace_url_lock:
+        _workspace_url = None
     logger.debug("Cleared collector caches")
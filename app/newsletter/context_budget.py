@@ -0,0 +1,346 @@
+"""
+Token budgeting for the weekly newsletter generation context.
+
+build_generation_context() used to cap each section by item count only, so
+a busy week (long threads, large submissions, many cross-posts) produced an
+arbitrarily large prompt. The context is now assembled in three steps:
+
+1. Ranking: Slack messages are ranked by engagement_score() (reactions,
+   replies and recency) and popped from a heap until each section's top-k
+   is filled, so only k items are ever fully ordered.
+2. Collapsing: a message or news item that is a near-duplicate of a better
+   ranked one (the same announcement cross-posted to several channels, the
+   same story from two sites) is dropped while ranking.
+3. Budgeting: each section keeps the ranked items that fit its token
+   budget, and if the whole context is still over the ceiling, items are
+   trimmed from the least important sections first (TRIM_ORDER). Member
+   submissions are shortened instead of dropped (TRUNCATED_SECTIONS).
+
+Budgets come from generation.context_budget in newsletter.yaml. Tokens are
+estimated from character counts (no tokenizer is needed), so the same
+inputs always give the same context. Every step is recorded in a
+ContextReport, which the generation log prints.
+"""
+
+import heapq
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Conservative estimate for English prose with links
+CHARS_PER_TOKEN = 4
+
+DEFAULT_MAX_CONTEXT_TOKENS = 12000
+
+DEFAULT_SECTION_BUDGETS = {
+    'slack_public': 5000,
+    'slack_private': 800,
+    'trail_conditions': 800,
+    'news': 1500,
+    'submissions': 3000,
+    'prior_newsletter': 400,
+}
+
+DEFAULT_TOP_K = {
+    'slack_public': 15,
+    'slack_private': 5,
+}
+
+# Sections trimmed first when the whole context is over the ceiling. The
+# week header, Slack header and admin feedback are never trimmed.
+TRIM_ORDER = (
+    'prior_newsletter',
+    'slack_private',
+    'news',
+    'slack_public',
+    'trail_conditions',
+    'submissions',
+)
+
+# Sections whose items are cut short rather than dropped: every member
+# submission reaches the model, if only its first MIN_TRUNCATED_TOKENS.
+TRUNCATED_SECTIONS = frozenset({'submissions'})
+MIN_TRUNCATED_TOKENS = 60
+TRUNCATION_MARKER = ' [...]'
+# A line is not cut shorter than this; the item is dropped instead.
+MIN_TRUNCATED_LINE_CHARS = 40
+
+# Engagement score: one point per reaction, two per reply, plus up to
+# RECENCY_BONUS for the most recent message, fading to zero over a week.
+REPLY_WEIGHT = 2.0
+RECENCY_BONUS = 3.0
+RECENCY_WINDOW_DAYS = 7
+
+# Word-set overlap at which two texts count as the same content
+DUPLICATE_SIMILARITY = 0.8
+# Texts with fewer distinct words than this only match exactly
+MIN_DUPLICATE_WORDS = 4
+
+_URL_RE = re.compile(r'<[^>]*>|https?://\S+')
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def estimate_tokens(text: str) -> int:
+    """Upper-bound token estimate for text, from its length."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class ContextBudget:
+    """Token ceiling plus per-section budgets and top-k limits."""
+    max_tokens: int = DEFAULT_MAX_CONTEXT_TOKENS
+    section_tokens: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_SECTION_BUDGETS))
+    top_k: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_TOP_K))
+
+    @classmethod
+    def from_config(cls, config: Optional[dict[str, Any]]) -> 'ContextBudget':
+        """Build from a generation.context_budget mapping; missing keys use defaults."""
+        config = config or {}
+        return cls(
+            max_tokens=config.get('max_tokens', DEFAULT_MAX_CONTEXT_TOKENS),
+            section_tokens={**DEFAULT_SECTION_BUDGETS, **(config.get('sections') or {})},
+            top_k={**DEFAULT_TOP_K, **(config.get('top_k') or {})},
+        )
+
+
+def load_context_budget() -> ContextBudget:
+    """Load generation.context_budget from newsletter.yaml."""
+    config_path = Path(__file__).parent.parent.parent / 'config' / 'newsletter.yaml'
+
+    try:
+        with open(config_path) as f:
+            config = yaml.safe_load(f) or {}
+    except (FileNotFoundError, yaml.YAMLError) as e:
+        logger.warning(f"Could not load context budget config: {e}")
+        config = {}
+    return ContextBudget.from_config((config.get('generation') or {}).get('context_budget'))
+
+
+@dataclass
+class SectionReport:
+    """What happened to one section's candidate items."""
+    candidates: int = 0
+    kept: int = 0
+    duplicates: int = 0
+    over_top_k: int = 0
+    over_budget: int = 0
+    truncated: int = 0
+    tokens: int = 0
+
+    @property
+    def dropped(self) -> int:
+        return self.duplicates + self.over_top_k + self.over_budget
+
+
+@dataclass
+class ContextReport:
+    """Token use and drops for one generation context."""
+    max_tokens: int
+    total_tokens: int = 0
+    sections: dict[str, SectionReport] = field(default_factory=dict)
+
+    def section(self, name: str) -> SectionReport:
+        return self.sections.setdefault(name, SectionReport())
+
+    def log(self) -> None:
+        """Write the budget and every section that lost items to the log."""
+        logger.info(f"  Context budget: {self.total_tokens}/{self.max_tokens} tokens (estimated)")
+        for name, report in self.sections.items():
+            if not report.dropped and not report.truncated:
+                continue
+            logger.info(
+                f"    {name}: kept {report.kept} of {report.candidates} "
+                f"({report.duplicates} near-duplicates, {report.over_top_k} over top-k, "
+                f"{report.over_budget} over budget, {report.truncated} truncated)"
+            )
+
+
+@dataclass
+class ContextSection:
+    """A run of context lines: fixed header, rankable item blocks, footer.
+
+    Sections whose name is in TRIM_ORDER are budgeted; any other section
+    (name None) is always kept whole.
+    """
+    name: Optional[str]
+    header: list[str]
+    blocks: list[list[str]] = field(default_factory=list)
+    footer: list[str] = field(default_factory=list)
+
+    def lines(self) -> list[str]:
+        if self.name is not None and not self.blocks:
+            return []
+        return self.header + [line for block in self.blocks for line in block] + self.footer
+
+
+def _block_tokens(lines: list[str]) -> int:
+    # The trailing newline joins this block to whatever follows it, so the
+    # sum over blocks never underestimates the rendered text.
+    return estimate_tokens("\n".join(lines) + "\n") if lines else 0
+
+
+def _truncate_block(lines: list[str], tokens: int) -> Optional[list[str]]:
+    """The block with its longest line cut so it fits in tokens, or None."""
+    if _block_tokens(lines) <= tokens:
+        return lines
+    excess = len("\n".join(lines)) + 1 - tokens * CHARS_PER_TOKEN
+    longest = max(range(len(lines)), key=lambda index: len(lines[index]))
+    keep = len(lines[longest]) - excess - len(TRUNCATION_MARKER)
+    if keep < MIN_TRUNCATED_LINE_CHARS:
+        return None
+    truncated = list(lines)
+    truncated[longest] = lines[longest][:keep].rstrip() + TRUNCATION_MARKER
+    return truncated
+
+
+def _words(text: str) -> frozenset[str]:
+    return frozenset(_WORD_RE.findall(_URL_RE.sub(' ', text.lower())))
+
+
+def _is_duplicate(words: frozenset[str], kept: list[frozenset[str]]) -> bool:
+    if not words:
+        # Image-only posts and the like have nothing to compare
+        return False
+    for other in kept:
+        if words == other:
+            return True
+        if len(words) < MIN_DUPLICATE_WORDS or len(other) < MIN_DUPLICATE_WORDS:
+            continue
+        if len(words & other) / len(words | other) >= DUPLICATE_SIMILARITY:
+            return True
+    return False
+
+
+def engagement_score(message, latest: Optional[datetime]) -> float:
+    """Reactions, replies (weighted double) and recency relative to latest."""
+    score = (message.reaction_count or 0) + REPLY_WEIGHT * (message.reply_count or 0)
+    if latest is not None and message.posted_at is not None:
+        age_days = (latest - message.posted_at).total_seconds() / 86400
+        score += RECENCY_BONUS * max(0.0, 1 - age_days / RECENCY_WINDOW_DAYS)
+    return score
+
+
+def select_top(
+    items: Sequence[T],
+    k: Optional[int],
+    text: Callable[[T], str],
+    report: SectionReport,
+    score: Optional[Callable[[T], float]] = None,
+) -> list[T]:
+    """Best k items by score (input order if no score), near-duplicates collapsed.
+
+    Ties keep input order, so the selection is deterministic.
+    """
+    report.candidates += len(items)
+    if score is None:
+        heap = [(0.0, index, item) for index, item in enumerate(items)]
+    else:
+        heap = [(-score(item), index, item) for index, item in enumerate(items)]
+    heapq.heapify(heap)
+
+    selected: list[T] = []
+    seen: list[frozenset[str]] = []
+    while heap and (k is None or len(selected) < k):
+        _, _, item = heapq.heappop(heap)
+        words = _words(text(item))
+        if _is_duplicate(words, seen):
+            report.duplicates += 1
+            continue
+        seen.append(words)
+        selected.append(item)
+    report.over_top_k += len(heap)
+    return selected
+
+
+def fit_sections(
+    sections: list[ContextSection],
+    budget: ContextBudget,
+    report: ContextReport,
+) -> str:
+    """Apply section budgets and the overall ceiling, then render the text.
+
+    Each budgeted section keeps its blocks, best ranked first, that fit in
+    what is left of its budget; a block that does not fit is skipped (or,
+    in TRUNCATED_SECTIONS, cut to the remaining budget) and smaller blocks
+    after it still get their turn. If the total is still over
+    budget.max_tokens, blocks are removed from the end of the sections in
+    TRIM_ORDER, one at a time, until it fits. TRUNCATED_SECTIONS are never
+    emptied this way: their blocks are cut down to MIN_TRUNCATED_TOKENS
+    each, and the context may stay over the ceiling if even that is too much.
+    """
+    by_name = {section.name: section for section in sections if section.name is not None}
+    # id() of every block that was cut, so one cut twice counts once
+    truncated_ids: set[int] = set()
+
+    for name, section in by_name.items():
+        section_report = report.section(name)
+        section_report.candidates = max(section_report.candidates, len(section.blocks))
+        limit = budget.section_tokens.get(name)
+        used = 0
+        kept = []
+        for block in section.blocks:
+            cost = _block_tokens(block)
+            if limit is not None and used + cost > limit:
+                truncated = None
+                if name in TRUNCATED_SECTIONS:
+                    truncated = _truncate_block(block, max(limit - used, MIN_TRUNCATED_TOKENS))
+                if truncated is None:
+                    section_report.over_budget += 1
+                    continue
+                if truncated is not block:
+                    truncated_ids.add(id(truncated))
+                block, cost = truncated, _block_tokens(truncated)
+            kept.append(block)
+            used += cost
+        section.blocks = kept
+
+    def total() -> int:
+        return sum(
+            _block_tokens(section.header) + _block_tokens(section.footer)
+            + sum(_block_tokens(block) for block in section.blocks)
+            for section in sections
+            if section.lines()
+        )
+
+    current = total()
+    for name in TRIM_ORDER:
+        section = by_name.get(name)
+        if section is None:
+            continue
+        if name in TRUNCATED_SECTIONS:
+            # Shorten from the last block up instead of dropping any
+            for index in reversed(range(len(section.blocks))):
+                if current <= budget.max_tokens:
+                    break
+                block = section.blocks[index]
+                cost = _block_tokens(block)
+                target = max(MIN_TRUNCATED_TOKENS, cost - (current - budget.max_tokens))
+                truncated = _truncate_block(block, target) if target < cost else None
+                if truncated is not None:
+                    section.blocks[index] = truncated
+                    truncated_ids.add(id(truncated))
+                    current = total()
+            continue
+        while section.blocks and current > budget.max_tokens:
+            section.blocks.pop()
+            report.section(name).over_budget += 1
+            current = total()
+
+    for name, section in by_name.items():
+        section_report = report.section(name)
+        section_report.kept = len(section.blocks)
+        section_report.truncated = sum(id(block) in truncated_ids for block in section.blocks)
+        section_report.tokens = sum(_block_tokens(block) for block in section.blocks)
+
+    text = "\n".join(line for section in sections for line in section.lines())
+    report.total_tokens = estimate_tokens(text)
+    return text
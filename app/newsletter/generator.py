@@ -31,6 +31,16 @@ from app.newsletter.models import (
     NewsletterPrompt,
     db,
 )
+from app.newsletter.context_budget import (
+    ContextBudget,
+    ContextReport,
+    ContextSection,
+    engagement_score,
+    fit_sections,
+    load_context_budget,
+    select_top,
+)
+from app.newsletter.prompt_cache import cacheable_text, log_usage, response_usage, total_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -256,54 +266,85 @@ def _structured_to_markdown(content: dict) -> str:
     return "\n".join(lines)
 
 
-def build_generation_context(context: NewsletterContext) -> str:
+def build_generation_context(
+    context: NewsletterContext,
+    budget: Optional[ContextBudget] = None
+) -> str:
     """Build the context section for Claude from collected data.
 
     Formats all collected data into a structured text block
-    that Claude can use to generate the newsletter.
+    that Claude can use to generate the newsletter. Slack messages are
+    ranked by engagement, near-duplicates are collapsed, and every section
+    is held to its token budget so the whole block fits the configured
+    ceiling (see context_budget). What was dropped is logged.
 
     Args:
         context: NewsletterContext with all collected data
+        budget: Token budgets (default: generation.context_budget in newsletter.yaml)
 
     Returns:
         Formatted context string
     """
+    if budget is None:
+        budget = load_context_budget()
+    report = ContextReport(max_tokens=budget.max_tokens)
     sections = []
 
     # Header with date range
-    sections.append(f"=== NEWSLETTER WEEK ===")
-    sections.append(f"Week: {context.week_start.strftime('%B %d')} - {context.week_end.strftime('%B %d, %Y')}")
-    sections.append("")
+    sections.append(ContextSection(None, [
+        "=== NEWSLETTER WEEK ===",
+        f"Week: {context.week_start.strftime('%B %d')} - {context.week_end.strftime('%B %d, %Y')}",
+        "",
+    ]))
 
     # Slack messages section
     if context.slack_messages:
-        sections.append("=== SLACK ACTIVITY ===")
-        sections.append(f"Total messages collected: {len(context.slack_messages)}")
-        sections.append("")
+        sections.append(ContextSection(None, [
+            "=== SLACK ACTIVITY ===",
+            f"Total messages collected: {len(context.slack_messages)}",
+            "",
+        ]))
 
         # Group by visibility
         public_msgs = [m for m in context.slack_messages if m.visibility == MessageVisibility.PUBLIC]
         private_msgs = [m for m in context.slack_messages if m.visibility == MessageVisibility.PRIVATE]
+        latest = max((m.posted_at for m in context.slack_messages if m.posted_at), default=None)
 
-        if public_msgs:
-            sections.append("PUBLIC CHANNEL HIGHLIGHTS (can quote, link, name):")
-            for msg in public_msgs[:15]:  # Limit to top 15
-                engagement = f"[{msg.reaction_count} reactions, {msg.reply_count} replies]"
-                sections.append(f"- #{msg.channel_name} | {msg.user_name}: {msg.text[:200]}...")
-                if msg.permalink:
-                    sections.append(f"  Link: {msg.permalink}")
-                sections.append(f"  {engagement}")
-                sections.append("")
-
-        if private_msgs:
-            sections.append("PRIVATE CHANNEL THEMES (summarize only, no names/links):")
-            for msg in private_msgs[:5]:  # Limit to 5
-                sections.append(f"- #{msg.channel_name}: {msg.text[:150]}...")
-            sections.append("")
+        def score(msg: SlackMessage) -> float:
+            return engagement_score(msg, latest)
+
+        top_public = select_top(
+            public_msgs, budget.top_k.get('slack_public'), lambda m: m.text,
+            report.section('slack_public'), score=score,
+        )
+        public_blocks = []
+        for msg in top_public:
+            block = [f"- #{msg.channel_name} | {msg.user_name}: {msg.text[:200]}..."]
+            if msg.permalink:
+                block.append(f"  Link: {msg.permalink}")
+            block.append(f"  [{msg.reaction_count} reactions, {msg.reply_count} replies]")
+            block.append("")
+            public_blocks.append(block)
+        sections.append(ContextSection(
+            'slack_public',
+            ["PUBLIC CHANNEL HIGHLIGHTS (can quote, link, name):"],
+            public_blocks,
+        ))
+
+        top_private = select_top(
+            private_msgs, budget.top_k.get('slack_private'), lambda m: m.text,
+            report.section('slack_private'), score=score,
+        )
+        sections.append(ContextSection(
+            'slack_private',
+            ["PRIVATE CHANNEL THEMES (summarize only, no names/links):"],
+            [[f"- #{msg.channel_name}: {msg.text[:150]}..."] for msg in top_private],
+            [""],
+        ))
 
     # Trail conditions section
     if context.trail_conditions:
-        sections.append("=== TRAIL CONDITIONS ===")
+        trail_blocks = []
         for trail in context.trail_conditions:
             grooming = ""
             if trail.groomed:
@@ -311,56 +352,73 @@ def build_generation_context(context: NewsletterContext) -> str:
             date_str = ""
             if trail.report_date:
                 date_str = f" (reported {trail.report_date.strftime('%m/%d')})"
-            sections.append(
+            block = [
                 f"- {trail.location}: {trail.trails_open} open, "
                 f"{trail.ski_quality} quality{grooming}{date_str}"
-            )
+            ]
             if trail.notes:
-                sections.append(f"  Notes: {trail.notes[:100]}...")
-        sections.append("")
-
-    # News items section
+                block.append(f"  Notes: {trail.notes[:100]}...")
+            trail_blocks.append(block)
+        sections.append(ContextSection(
+            'trail_conditions', ["=== TRAIL CONDITIONS ==="], trail_blocks, [""],
+        ))
+
+    # News items section (already newest first; the same story from two
+    # sources is collapsed)
     if context.news_items:
-        sections.append("=== LOCAL SKI NEWS ===")
-        for item in context.news_items:
+        news_blocks = []
+        for item in select_top(
+            context.news_items, None, lambda n: n.title, report.section('news'),
+        ):
             date_str = ""
             if item.published_at:
                 date_str = f" ({item.published_at.strftime('%m/%d')})"
-            sections.append(f"- [{item.source.value}] {item.title}{date_str}")
-            sections.append(f"  URL: {item.url}")
+            block = [f"- [{item.source.value}] {item.title}{date_str}", f"  URL: {item.url}"]
             if item.summary:
-                sections.append(f"  Summary: {item.summary[:150]}...")
-            sections.append("")
+                block.append(f"  Summary: {item.summary[:150]}...")
+            block.append("")
+            news_blocks.append(block)
+        sections.append(ContextSection('news', ["=== LOCAL SKI NEWS ==="], news_blocks))
 
     # Member submissions section
     if context.submissions:
-        sections.append("=== MEMBER SUBMISSIONS ===")
+        submission_blocks = []
         for sub in context.submissions:
             attribution = "(use their name)" if sub.permission_to_name else "(keep anonymous)"
-            sections.append(f"- Type: {sub.submission_type.value} {attribution}")
+            block = [f"- Type: {sub.submission_type.value} {attribution}"]
             if sub.permission_to_name:
-                sections.append(f"  From: {sub.display_name}")
-            sections.append(f"  Content: {sub.content}")
-            sections.append("")
+                block.append(f"  From: {sub.display_name}")
+            block.append(f"  Content: {sub.content}")
+            block.append("")
+            submission_blocks.append(block)
+        sections.append(ContextSection(
+            'submissions', ["=== MEMBER SUBMISSIONS ==="], submission_blocks,
+        ))
 
     # Prior newsletter for continuity
     if context.prior_newsletter_content:
-        sections.append("=== PRIOR NEWSLETTER (for continuity) ===")
         # Truncate to avoid making context too long
         prior_preview = context.prior_newsletter_content[:1000]
         if len(context.prior_newsletter_content) > 1000:
             prior_preview += "...[truncated]"
-        sections.append(prior_preview)
-        sections.append("")
+        sections.append(ContextSection(
+            'prior_newsletter',
+            ["=== PRIOR NEWSLETTER (for continuity) ==="],
+            [[prior_preview, ""]],
+        ))
 
     # Admin feedback if any
     if context.admin_feedback:
-        sections.append("=== ADMIN FEEDBACK ===")
-        sections.append("Please incorporate this feedback in the regeneration:")
-        sections.append(context.admin_feedback)
-        sections.append("")
+        sections.append(ContextSection(None, [
+            "=== ADMIN FEEDBACK ===",
+            "Please incorporate this feedback in the regeneration:",
+            context.admin_feedback,
+            "",
+        ]))
 
-    return "\n".join(sections)
+    text = fit_sections(sections, budget, report)
+    report.log()
+    return text
 
 
 def generate_newsletter(
@@ -434,12 +492,14 @@ Double-check that all links are properly formatted and all names are attributed
 
         client = get_anthropic_client()
 
-        # Build API call parameters
+        # Build API call parameters. The prompt goes in system, marked for
+        # caching, so regenerations within a few minutes reuse it.
         api_params = {
             'model': model,
             'max_tokens': max_tokens,
+            'system': cacheable_text(system_prompt),
             'messages': [
-                {"role": "user", "content": f"{system_prompt}\n\n{user_message}"}
+                {"role": "user", "content": user_message}
             ]
         }
 
@@ -504,7 +564,7 @@ Double-check that all links are properly formatted and all names are attributed
                     raw_content = block.text
                     break
 
-            tokens_used = response.usage.input_tokens + response.usage.output_tokens
+            usage = response_usage(response)
         else:
             response = client.messages.create(**api_params)
 
@@ -525,7 +585,7 @@ Double-check that all links are properly formatted and all names are attributed
                     raw_content = block.text
                     break
 
-            tokens_used = response.usage.input_tokens + response.usage.output_tokens
+            usage = response_usage(response)
 
         if not raw_content:
             logger.error("  ERROR: No text content in response")
@@ -535,8 +595,9 @@ Double-check that all links are properly formatted and all names are attributed
                 error="No text content in Claude response"
             )
 
+        tokens_used = total_tokens(usage)
         logger.info(f"  Response received in {elapsed:.2f}s")
-        logger.info(f"  Tokens used: {tokens_used}")
+        log_usage("Generation", usage)
         logger.info(f"  Content length: {len(raw_content)} chars")
 
         # Try to parse as JSON
@@ -560,6 +621,8 @@ Double-check that all links are properly formatted and all names are attributed
             version_number=0,  # Set by caller
             model_used=DEFAULT_MODEL,
             tokens_used=tokens_used,
+            cache_read_tokens=usage['cache_read_tokens'],
+            cache_write_tokens=usage['cache_write_tokens'],
         )
 
     except Exception as e:
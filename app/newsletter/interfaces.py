@@ -183,7 +183,9 @@ class GenerationResult:
     structured_content: Optional[dict] = None  # Parsed JSON dict (if JSON format)
     version_number: int = 0
     model_used: str = ""
-    tokens_used: int = 0
+    tokens_used: int = 0  # All billed tokens, including cache reads and writes
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     error: Optional[str] = None
 
 
@@ -17,9 +17,13 @@ as needed during generation, rather than pre-collecting all data.
 import json
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+from flask import current_app, has_app_context
+
 from app.models import db
 from app.newsletter.interfaces import (
     NewsletterContext,
@@ -40,6 +44,16 @@ from app.newsletter.models import (
     NewsletterNewsItem,
     NewsletterPrompt,
 )
+from app.newsletter.prompt_cache import (
+    USAGE_KEYS,
+    add_usage,
+    cacheable_text,
+    cacheable_tools,
+    log_usage,
+    mark_conversation_breakpoint,
+    response_usage,
+    total_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -228,10 +242,10 @@ def tool_collect_slack_messages(
     logger.info(f"MCP Tool: collect_slack_messages(since_days={since_days_ago})")
 
     try:
-        from app.newsletter.collector import collect_all_messages
+        from app.newsletter.archive import collect_archived_messages
 
         since = datetime.utcnow() - timedelta(days=since_days_ago)
-        messages = collect_all_messages(since=since)
+        messages = collect_archived_messages(since=since)
 
         # Group messages
         public_messages = []
@@ -567,6 +581,21 @@ TOOL_HANDLERS = {
     "update_living_post": tool_update_living_post,
 }
 
+# Tools that gather data without changing what a later call would see, so
+# calls in one turn can run concurrently and repeat calls within a run can
+# reuse the first result. collect_slack_messages is not one of them: it
+# syncs the message archive (inserting, refreshing and deleting rows and
+# moving the channel cursors), so it runs in call order and is never
+# memoized, like the other writes.
+PARALLEL_SAFE_TOOLS = frozenset({
+    "get_member_submissions",
+    "scrape_ski_news",
+    "get_trail_conditions",
+    "get_prior_newsletter",
+})
+
+MAX_PARALLEL_TOOLS = len(PARALLEL_SAFE_TOOLS)
+
 
 def execute_tool(tool_name: str, tool_input: dict[str, Any]) -> str:
     """Execute a tool and return JSON result.
@@ -590,6 +619,95 @@ def execute_tool(tool_name: str, tool_input: dict[str, Any]) -> str:
         return json.dumps({"error": str(e)})
 
 
+def _tool_memo_key(tool_name: str, tool_input: dict[str, Any]) -> tuple[str, str]:
+    return tool_name, json.dumps(tool_input, sort_keys=True, default=str)
+
+
+def _is_error_result(result: str) -> bool:
+    """True for execute_tool() failures and handler {"success": False, "error": ...} results."""
+    parsed = json.loads(result)
+    return isinstance(parsed, dict) and 'error' in parsed
+
+
+def _run_timed_tool(app, tool_name: str, tool_input: dict[str, Any]) -> tuple[str, float]:
+    """execute_tool() on a worker thread, in its own app context."""
+    start = time.perf_counter()
+    if app is None:
+        result = execute_tool(tool_name, tool_input)
+    else:
+        with app.app_context():
+            result = execute_tool(tool_name, tool_input)
+    return result, time.perf_counter() - start
+
+
+def execute_tool_calls(
+    calls: list[tuple[str, dict[str, Any]]],
+    memo: Optional[dict[tuple[str, str], str]] = None
+) -> list[str]:
+    """Execute one turn's tool calls, returning results in call order.
+
+    Data-gathering tools (PARALLEL_SAFE_TOOLS) are independent and mostly
+    wait on Slack, the news sites or the database, so they run concurrently,
+    each in its own app context. Their results are memoized in `memo` for the
+    rest of the run, and an identical call in the same turn runs once.
+    Results carrying an "error" are not memoized, so a later turn can retry.
+    Tools that write (syncing the Slack archive, saving a version, updating
+    the living post) then run one at a time, in the order Claude asked for them, and are never
+    memoized.
+
+    Args:
+        calls: (tool_name, tool_input) pairs from the assistant turn
+        memo: Per-run cache of data-gathering results, updated in place
+
+    Returns:
+        JSON result strings, one per call
+    """
+    if memo is None:
+        memo = {}
+    results: list[Optional[str]] = [None] * len(calls)
+    pending: dict[tuple[str, str], list[int]] = {}
+
+    for index, (name, tool_input) in enumerate(calls):
+        if name not in PARALLEL_SAFE_TOOLS:
+            continue
+        key = _tool_memo_key(name, tool_input)
+        if key in memo:
+            logger.info(f"    Tool call: {name} (memoized)")
+            results[index] = memo[key]
+        else:
+            pending.setdefault(key, []).append(index)
+
+    if pending:
+        app = current_app._get_current_object() if has_app_context() else None
+        workers = min(len(pending), MAX_PARALLEL_TOOLS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='newsletter-tool') as pool:
+            futures = {
+                key: pool.submit(_run_timed_tool, app, calls[indexes[0]][0], calls[indexes[0]][1])
+                for key, indexes in pending.items()
+            }
+            for key, future in futures.items():
+                name = key[0]
+                try:
+                    result, elapsed = future.result()
+                    logger.info(f"    Tool call: {name} finished in {elapsed:.2f}s")
+                    if not _is_error_result(result):
+                        memo[key] = result
+                except Exception as e:
+                    logger.error(f"Tool {name} execution failed: {e}")
+                    result = json.dumps({"error": str(e)})
+                for index in pending[key]:
+                    results[index] = result
+
+    for index, (name, tool_input) in enumerate(calls):
+        if results[index] is not None:
+            continue
+        start = time.perf_counter()
+        results[index] = execute_tool(name, tool_input)
+        logger.info(f"    Tool call: {name} finished in {time.perf_counter() - start:.2f}s")
+
+    return results
+
+
 # =============================================================================
 # Agentic Newsletter Generation
 # =============================================================================
@@ -671,22 +789,31 @@ Begin by collecting the content you need."""
     try:
         client = get_anthropic_client()
 
+        # Tools and system never change during a run, and each turn only
+        # appends to the conversation, so every turn re-reads the previous
+        # turn's prefix from the prompt cache.
+        tools = cacheable_tools(NEWSLETTER_TOOLS)
+        system = cacheable_text(system_prompt)
         messages = [{"role": "user", "content": user_message}]
         final_content = None
-        total_tokens = 0
+        run_usage = dict.fromkeys(USAGE_KEYS, 0)
+        tool_memo: dict[tuple[str, str], str] = {}
 
         for turn in range(max_turns):
             logger.info(f"  Turn {turn + 1}/{max_turns}")
 
+            mark_conversation_breakpoint(messages)
             response = client.messages.create(
                 model=DEFAULT_MODEL,
                 max_tokens=DEFAULT_MAX_TOKENS,
-                system=system_prompt,
-                tools=NEWSLETTER_TOOLS,
+                system=system,
+                tools=tools,
                 messages=messages,
             )
 
-            total_tokens += response.usage.input_tokens + response.usage.output_tokens
+            usage = response_usage(response)
+            add_usage(run_usage, usage)
+            log_usage(f"Turn {turn + 1}", usage)
 
             # Check stop reason
             if response.stop_reason == "end_turn":
@@ -703,20 +830,22 @@ Begin by collecting the content you need."""
                 assistant_message = {"role": "assistant", "content": response.content}
                 messages.append(assistant_message)
 
+                calls = [block for block in response.content if block.type == "tool_use"]
+                results = execute_tool_calls(
+                    [(block.name, block.input) for block in calls], tool_memo
+                )
+
                 tool_results = []
-                for block in response.content:
-                    if block.type == "tool_use":
-                        logger.info(f"    Tool call: {block.name}")
-                        result = execute_tool(block.name, block.input)
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": result,
-                        })
-
-                        # Check if this was a save that includes content
-                        if block.name == "save_newsletter_version":
-                            final_content = block.input.get("content")
+                for block, result in zip(calls, results):
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": result,
+                    })
+
+                    # Check if this was a save that includes content
+                    if block.name == "save_newsletter_version":
+                        final_content = block.input.get("content")
 
                 messages.append({"role": "user", "content": tool_results})
 
@@ -731,7 +860,7 @@ Begin by collecting the content you need."""
                 error="Agent did not produce content"
             )
 
-        logger.info(f"  Total tokens: {total_tokens}")
+        log_usage("Run total", run_usage)
         logger.info(f"  Content length: {len(final_content)} chars")
         logger.info("=" * 60)
 
@@ -740,7 +869,9 @@ Begin by collecting the content you need."""
             content=final_content,
             version_number=newsletter.current_version or 1,
             model_used=DEFAULT_MODEL,
-            tokens_used=total_tokens,
+            tokens_used=total_tokens(run_usage),
+            cache_read_tokens=run_usage['cache_read_tokens'],
+            cache_write_tokens=run_usage['cache_write_tokens'],
         )
 
     except Exception as e:
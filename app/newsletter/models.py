@@ -6,6 +6,8 @@ Models:
 - NewsletterVersion: Version history for each regeneration
 - NewsletterSubmission: Member-submitted content via /dispatch
 - NewsletterDigest: Collected Slack messages
+- SlackMessageArchive: Every collected Slack message, shared across runs
+- SlackChannelCursor: Per-channel collection high-water marks for the archive
 - NewsletterNewsItem: Scraped news from external sources
 - NewsletterPrompt: Database-editable prompts (override file defaults)
 """
@@ -369,6 +371,77 @@ class NewsletterDigest(db.Model):
         return self.reaction_count + (self.reply_count * 2)
 
 
+class SlackMessageArchive(db.Model):
+    """Slack messages collected from monitored channels, kept across runs.
+
+    Unlike NewsletterDigest this is not tied to a newsletter: each sync
+    only fetches what was posted since shortly before the channel's cursor
+    (the refresh window, for engagement counts and edits) and every reader
+    queries here.
+    """
+    __tablename__ = 'slack_message_archive'
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    channel_id = db.Column(db.String(50), nullable=False)
+    channel_name = db.Column(db.String(255))
+    message_ts = db.Column(db.String(50), nullable=False)
+    # Parent message ts when this is a thread reply
+    thread_ts = db.Column(db.String(50))
+
+    user_id = db.Column(db.String(50))
+    user_name = db.Column(db.String(255))
+    text = db.Column(db.Text, nullable=False)
+    permalink = db.Column(db.String(500))
+
+    reaction_count = db.Column(db.Integer, nullable=False, default=0)
+    reply_count = db.Column(db.Integer, nullable=False, default=0)
+    visibility = db.Column(
+        db.String(50),
+        nullable=False,
+        default=MessageVisibility.PUBLIC.value
+    )
+
+    posted_at = db.Column(db.DateTime)
+    first_seen_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    refreshed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            'channel_id', 'message_ts',
+            name='uq_slack_message_archive_channel_ts'
+        ),
+        db.Index('ix_slack_message_archive_posted_at', 'posted_at'),
+    )
+
+    def __repr__(self):
+        return f'<SlackMessageArchive {self.channel_id}/{self.message_ts}>'
+
+
+class SlackChannelCursor(db.Model):
+    """How much of one channel's history the archive already holds."""
+    __tablename__ = 'slack_channel_cursors'
+
+    channel_id = db.Column(db.String(50), primary_key=True)
+    channel_name = db.Column(db.String(255))
+    # Earliest posted_at (local time, like posted_at) the archive has
+    # collected this channel from
+    covered_from = db.Column(db.DateTime, nullable=False)
+    # Start of the last successful collection, in UTC. The next sync
+    # re-fetches from the refresh window before it; older messages are
+    # served as archived.
+    collected_through = db.Column(db.DateTime, nullable=False)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+
+    def __repr__(self):
+        return f'<SlackChannelCursor {self.channel_id} through={self.collected_through}>'
+
+
 class NewsletterNewsItem(db.Model):
     """Scraped external news from ski-related sources.
 
@@ -10,6 +10,7 @@ import logging
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -18,6 +19,14 @@ import yaml
 
 from app.newsletter.interfaces import SectionType, SectionStatus, MessageVisibility
 from app.newsletter.models import Newsletter, NewsletterSection, db
+from app.newsletter.prompt_cache import (
+    USAGE_KEYS,
+    add_usage,
+    cacheable_text,
+    log_usage,
+    response_usage,
+    total_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +41,10 @@ AI_DRAFTED_SECTIONS = [
     SectionType.MONTH_IN_REVIEW.value,
 ]
 
+# Default for generation.section_concurrency in newsletter.yaml: drafts
+# in flight after the first one (see generate_all_ai_sections)
+DEFAULT_SECTION_CONCURRENCY = 3
+
 # Import anthropic SDK with graceful fallback
 try:
     import anthropic
@@ -329,7 +342,9 @@ def generate_section_draft(
                       'events', 'member_highlight_answers'
 
     Returns:
-        Dict with keys: success, content, char_count, error (if any), model_used
+        Dict with keys: success, content, char_count, error (if any), model_used,
+        and usage (token counts from prompt_cache.response_usage) once the API
+        has answered
     """
     logger.info(f"Generating AI draft for section: {section_type}")
 
@@ -343,6 +358,15 @@ def generate_section_draft(
         member_highlight_answers=context_data.get('member_highlight_answers')
     )
 
+    return _draft_section(section_type, context_str)
+
+
+def _draft_section(section_type: str, context_str: str) -> dict:
+    """Call Claude for one section given its prebuilt context.
+
+    Touches no database state, so generate_all_ai_sections() can run it on
+    worker threads.
+    """
     if not ANTHROPIC_AVAILABLE:
         logger.warning("Anthropic SDK not available, returning fallback")
         return {
@@ -374,17 +398,22 @@ Generate the section now. Output ONLY valid JSON with section_type, content, and
 
         client = _get_anthropic_client()
 
+        # The monthly prompt is identical for every section, so after the
+        # first section it is read from the prompt cache.
         response = client.messages.create(
             model=model,
             max_tokens=max_tokens,
             temperature=temperature,
+            system=cacheable_text(system_prompt),
             messages=[
-                {"role": "user", "content": f"{system_prompt}\n\n{user_message}"}
+                {"role": "user", "content": user_message}
             ]
         )
 
         elapsed = time.time() - start_time
+        usage = response_usage(response)
         logger.info(f"Claude API response received in {elapsed:.2f}s for section {section_type}")
+        log_usage(f"Section {section_type}", usage)
 
         if not response.content:
             logger.error(f"Empty response from Claude API for section {section_type}")
@@ -393,7 +422,8 @@ Generate the section now. Output ONLY valid JSON with section_type, content, and
                 'content': None,
                 'char_count': 0,
                 'error': 'Empty response from Claude API',
-                'model_used': model
+                'model_used': model,
+                'usage': usage,
             }
 
         # Extract text content
@@ -410,7 +440,8 @@ Generate the section now. Output ONLY valid JSON with section_type, content, and
                 'content': None,
                 'char_count': 0,
                 'error': 'No text content in response',
-                'model_used': model
+                'model_used': model,
+                'usage': usage,
             }
 
         # Parse JSON response
@@ -432,7 +463,8 @@ Generate the section now. Output ONLY valid JSON with section_type, content, and
                 'content': content,
                 'char_count': char_count,
                 'error': None,
-                'model_used': model
+                'model_used': model,
+                'usage': usage,
             }
         else:
             # If JSON parsing failed, try to use raw content
@@ -447,7 +479,8 @@ Generate the section now. Output ONLY valid JSON with section_type, content, and
                 'content': raw_content,
                 'char_count': char_count,
                 'error': 'JSON parsing failed, used raw content',
-                'model_used': model
+                'model_used': model,
+                'usage': usage,
             }
 
     except Exception as e:
@@ -463,47 +496,109 @@ Generate the section now. Output ONLY valid JSON with section_type, content, and
 
 def generate_all_ai_sections(
     newsletter: Newsletter,
-    context_data: dict
+    context_data: dict,
+    max_concurrency: Optional[int] = None
 ) -> dict:
     """Generate AI drafts for all AI-assisted sections and save to database.
 
+    The sections are independent, so their drafts are generated concurrently
+    (at most generation.section_concurrency at a time). The first section is
+    drafted on its own, though: its request writes the shared monthly prompt
+    to the prompt cache, and the others start once it has finished so they
+    read that prefix instead of each writing it again. The step takes about
+    as long as the first section plus the slowest of the rest. Contexts are
+    built up front on the calling thread; the workers only call Claude.
+    Successful drafts are written to their NewsletterSection rows in a
+    single commit.
+
     Args:
         newsletter: Newsletter to generate sections for
         context_data: Dict with context data for all sections
+        max_concurrency: Max drafts in flight (default: generation.section_concurrency)
 
     Returns:
-        Dict with keys: success, sections (list of results), errors (list)
+        Dict with keys: success, sections (list of results, each with
+        latency_ms and usage), errors (list), usage (token totals), elapsed_ms
     """
     logger.info(f"Generating all AI sections for newsletter {newsletter.id}")
 
+    if max_concurrency is None:
+        max_concurrency = _load_generation_config().get(
+            'section_concurrency', DEFAULT_SECTION_CONCURRENCY
+        )
+
     results = {
         'success': True,
         'sections': [],
-        'errors': []
+        'errors': [],
+        'usage': dict.fromkeys(USAGE_KEYS, 0),
+        'elapsed_ms': 0,
     }
 
-    for section_type in AI_DRAFTED_SECTIONS:
-        logger.info(f"Processing section: {section_type}")
-
-        # Generate the draft
-        draft_result = generate_section_draft(
+    contexts = {
+        section_type: build_section_context(
             newsletter=newsletter,
             section_type=section_type,
-            context_data=context_data
+            slack_messages=context_data.get('slack_messages'),
+            leadership_messages=context_data.get('leadership_messages'),
+            events=context_data.get('events'),
+            member_highlight_answers=context_data.get('member_highlight_answers')
         )
+        for section_type in AI_DRAFTED_SECTIONS
+    }
+
+    def draft(section_type: str) -> tuple[dict, int]:
+        started = time.perf_counter()
+        draft_result = _draft_section(section_type, contexts[section_type])
+        return draft_result, int((time.perf_counter() - started) * 1000)
+
+    start = time.perf_counter()
+    first, rest = AI_DRAFTED_SECTIONS[0], AI_DRAFTED_SECTIONS[1:]
+    workers = max(1, min(max_concurrency, len(rest)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='section-draft') as pool:
+        # Warm the cache first; a failed first draft still lets the rest run.
+        futures = {first: pool.submit(draft, first)}
+        wait([futures[first]])
+        futures.update(
+            (section_type, pool.submit(draft, section_type))
+            for section_type in rest
+        )
+        drafts = {}
+        for section_type, future in futures.items():
+            try:
+                drafts[section_type] = future.result()
+            except Exception as e:
+                logger.error(f"Error generating section {section_type}: {e}")
+                drafts[section_type] = ({'success': False, 'error': str(e)}, 0)
+    results['elapsed_ms'] = int((time.perf_counter() - start) * 1000)
+
+    existing = {
+        section.section_type: section
+        for section in NewsletterSection.query.filter(
+            NewsletterSection.newsletter_id == newsletter.id,
+            NewsletterSection.section_type.in_(AI_DRAFTED_SECTIONS)
+        )
+    }
+    saved = []
+
+    for section_type in AI_DRAFTED_SECTIONS:
+        draft_result, latency_ms = drafts[section_type]
+        usage = draft_result.get('usage') or dict.fromkeys(USAGE_KEYS, 0)
+        add_usage(results['usage'], usage)
 
         section_result = {
             'section_type': section_type,
             'success': draft_result['success'],
-            'char_count': draft_result.get('char_count', 0)
+            'char_count': draft_result.get('char_count', 0),
+            'latency_ms': latency_ms,
+            'usage': usage,
         }
+        logger.info(f"Section {section_type} drafted in {latency_ms}ms "
+                    f"({total_tokens(usage)} tokens)")
 
         if draft_result['success'] and draft_result.get('content'):
             # Get or create the section record
-            section = NewsletterSection.query.filter_by(
-                newsletter_id=newsletter.id,
-                section_type=section_type
-            ).first()
+            section = existing.get(section_type)
 
             if not section:
                 from app.newsletter.section_editor import SECTION_ORDER
@@ -514,18 +609,13 @@ def generate_all_ai_sections(
                     status=SectionStatus.AWAITING_CONTENT.value
                 )
                 db.session.add(section)
-                db.session.flush()
 
             # Save AI draft
             section.ai_draft = draft_result['content']
             section.content = draft_result['content']
             section.status = SectionStatus.HAS_AI_DRAFT.value
             section.updated_at = datetime.utcnow()
-
-            db.session.commit()
-            logger.info(f"Saved AI draft for section {section_type} (id={section.id})")
-
-            section_result['section_id'] = section.id
+            saved.append((section_result, section))
         else:
             results['success'] = False
             error_msg = draft_result.get('error', 'Unknown error')
@@ -534,8 +624,27 @@ def generate_all_ai_sections(
 
         results['sections'].append(section_result)
 
+    if saved:
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to save AI drafts for newsletter {newsletter.id}: {e}")
+            results['success'] = False
+            results['errors'].append(f"Failed to save AI drafts: {e}")
+            for section_result, _section in saved:
+                section_result['success'] = False
+                section_result['error'] = f"Failed to save: {e}"
+        else:
+            for section_result, section in saved:
+                section_result['section_id'] = section.id
+                logger.info(f"Saved AI draft for section {section_result['section_type']} "
+                            f"(id={section.id})")
+
     total_sections = len(AI_DRAFTED_SECTIONS)
     successful = sum(1 for s in results['sections'] if s['success'])
-    logger.info(f"Generated {successful}/{total_sections} AI sections for newsletter {newsletter.id}")
+    logger.info(f"Generated {successful}/{total_sections} AI sections for newsletter "
+                f"{newsletter.id} in {results['elapsed_ms']}ms")
+    log_usage("AI sections", results['usage'])
 
     return results
@@ -11,7 +11,9 @@ Uses caching and rate limiting to be a good web citizen.
 
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 from typing import Optional
 from urllib.parse import urljoin
@@ -47,6 +49,10 @@ USER_AGENT = "TCSC Newsletter Bot/1.0 (Twin Cities Ski Club; contact@twincitiess
 # Default request timeout
 REQUEST_TIMEOUT_SECONDS = 15
 
+# How long scrape_all_news waits for one source before going on without it.
+# Covers a rate-limit wait plus a retried fetch of a slow page.
+SOURCE_DEADLINE_SECONDS = 45
+
 # =============================================================================
 # Rate Limiting State (per source)
 # =============================================================================
@@ -54,6 +60,11 @@ REQUEST_TIMEOUT_SECONDS = 15
 _last_request_times: dict[str, float] = {}
 _cache: dict[str, dict] = {}
 
+# Outcome of each source's most recent scrape_all_news run
+_last_run_status: dict[str, dict] = {}
+_run_status_lock = threading.Lock()
+_run_counter = 0
+
 
 # =============================================================================
 # Configuration Loading
@@ -826,6 +837,60 @@ def scrape_three_rivers_news(since: datetime, max_articles: int = 3) -> list[New
 # Aggregate Scraper
 # =============================================================================
 
+def _scrape_source(
+    run_id: int, source_name: str, scraper_func, since: datetime, max_articles: int
+) -> list[NewsItem]:
+    """Run one scraper on a worker thread and record how it went.
+
+    A scraper that outlives its deadline keeps running here; its result is
+    dropped from this run but still lands in the cache for the next one.
+    """
+    start = time.perf_counter()
+    try:
+        items = scraper_func(since, max_articles)
+    except Exception as e:
+        _record_source_run(run_id, source_name, 'error', 0, time.perf_counter() - start, str(e))
+        raise
+    _record_source_run(run_id, source_name, 'ok', len(items), time.perf_counter() - start)
+    return items
+
+
+def _record_source_run(
+    run_id: int,
+    source_name: str,
+    status: str,
+    item_count: int,
+    duration: float,
+    error: Optional[str] = None,
+) -> None:
+    """Store the outcome of a source's latest scrape for get_scraper_status()."""
+    with _run_status_lock:
+        previous = _last_run_status.get(source_name)
+        if previous and previous['run_id'] == run_id and previous['status'] == 'timed_out':
+            # The scrape finished after scrape_all_news gave up on it; keep
+            # the timeout visible but note when the cache has been filled.
+            if status == 'ok':
+                previous['finished_late_seconds'] = round(duration, 2)
+            return
+        if previous and previous['run_id'] > run_id:
+            return
+        _last_run_status[source_name] = {
+            'run_id': run_id,
+            'status': status,
+            'items': item_count,
+            'duration_seconds': round(duration, 2),
+            'error': error,
+            'finished_at': datetime.utcnow(),
+        }
+
+
+def _stale_cached(source_name: str, since: datetime, max_articles: int) -> list[NewsItem]:
+    """Items from a source's last successful scrape, ignoring the cache TTL."""
+    entry = _cache.get(f"news_{source_name}") or {}
+    items = [item for item in entry.get('data') or [] if _is_recent(item.published_at, since)]
+    return items[:max_articles]
+
+
 def scrape_all_news(since: datetime) -> list[NewsItem]:
     """
     Scrape news from all configured sources.
@@ -833,6 +898,12 @@ def scrape_all_news(since: datetime) -> list[NewsItem]:
     Combines results from SkinnySkI, Loppet, and Three Rivers
     sorted by publication date (newest first).
 
+    Sources are scraped concurrently, each with its own deadline
+    (news_sources.<name>.deadline_seconds, default SOURCE_DEADLINE_SECONDS).
+    A source that misses its deadline contributes whatever it cached on an
+    earlier run, even if expired, and the newsletter goes ahead without
+    waiting for it.
+
     Args:
         since: Only include articles published after this datetime
 
@@ -857,15 +928,52 @@ def scrape_all_news(since: datetime) -> list[NewsItem]:
         ('three_rivers', scrape_three_rivers_news, sources_config.get('three_rivers', {}).get('max_articles', 3)),
     ]
 
-    for source_name, scraper_func, max_articles in sources:
-        try:
-            items = scraper_func(since, max_articles)
-            all_items.extend(items)
-            logger.info(f"  {source_name}: {len(items)} items")
-        except Exception as e:
-            error_msg = f"{source_name}: {str(e)}"
-            errors.append(error_msg)
-            logger.error(f"  Failed to scrape {source_name}: {e}")
+    global _run_counter
+    with _run_status_lock:
+        _run_counter += 1
+        run_id = _run_counter
+
+    start = time.perf_counter()
+    # Not a with-block: leaving one waits for every worker, which is exactly
+    # what a missed deadline must not do.
+    pool = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='news-scrape')
+    try:
+        futures = [
+            (source_name, max_articles, pool.submit(
+                _scrape_source, run_id, source_name, scraper_func, since, max_articles,
+            ))
+            for source_name, scraper_func, max_articles in sources
+        ]
+
+        # Collected in source order so the combined list is the same as a
+        # serial run's; every deadline counts from the same start.
+        for source_name, max_articles, future in futures:
+            deadline = sources_config.get(source_name, {}).get(
+                'deadline_seconds', SOURCE_DEADLINE_SECONDS
+            )
+            remaining = max(0.0, start + deadline - time.perf_counter())
+            try:
+                items = future.result(timeout=remaining)
+                all_items.extend(items)
+                logger.info(f"  {source_name}: {len(items)} items")
+            except FutureTimeoutError:
+                items = _stale_cached(source_name, since, max_articles)
+                all_items.extend(items)
+                _record_source_run(
+                    run_id, source_name, 'timed_out', len(items), time.perf_counter() - start,
+                    f"no response within {deadline}s",
+                )
+                errors.append(f"{source_name}: timed out after {deadline}s")
+                logger.warning(
+                    f"  {source_name}: missed {deadline}s deadline, "
+                    f"using {len(items)} previously cached items"
+                )
+            except Exception as e:
+                error_msg = f"{source_name}: {str(e)}"
+                errors.append(error_msg)
+                logger.error(f"  Failed to scrape {source_name}: {e}")
+    finally:
+        pool.shutdown(wait=False)
 
     # Sort by publication date (newest first), with None dates last
     def sort_key(item: NewsItem) -> tuple:
@@ -876,7 +984,10 @@ def scrape_all_news(since: datetime) -> list[NewsItem]:
     all_items.sort(key=sort_key, reverse=True)
 
     logger.info("=" * 60)
-    logger.info(f"NEWS SCRAPER: Total {len(all_items)} items from all sources")
+    logger.info(
+        f"NEWS SCRAPER: Total {len(all_items)} items from all sources "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
     if errors:
         logger.warning(f"  Errors: {', '.join(errors)}")
     logger.info("=" * 60)
@@ -896,6 +1007,9 @@ def get_scraper_status() -> dict:
     - sources: List of source status dicts
     - cache_entries: Number of cached entries
     - cache_age: Age of oldest cache entry
+
+    Each source's last_run holds the outcome of its latest scrape_all_news
+    run (status ok, timed_out or error, item count, duration), or None.
     """
     config = _load_config()
     sources_config = config.get('news_sources', {})
@@ -913,6 +1027,8 @@ def get_scraper_status() -> dict:
             'cached': cached_entry is not None,
             'cache_age_minutes': None,
             'last_request': None,
+            'deadline_seconds': source_cfg.get('deadline_seconds', SOURCE_DEADLINE_SECONDS),
+            'last_run': None,
         }
 
         if cached_entry and cached_entry.get('cached_at'):
@@ -923,6 +1039,10 @@ def get_scraper_status() -> dict:
             elapsed = time.time() - _last_request_times[source_name]
             status['last_request'] = int(elapsed)
 
+        with _run_status_lock:
+            last_run = _last_run_status.get(source_name)
+            status['last_run'] = dict(last_run) if last_run else None
+
         sources_status.append(status)
 
     return {
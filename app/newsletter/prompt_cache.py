@@ -0,0 +1,101 @@
+"""
+Anthropic prompt-caching helpers for newsletter generation.
+
+The newsletter calls resend large, unchanging prefixes: the system prompt
+for every weekly version, the monthly prompt once per drafted section, and
+the tool definitions plus the whole conversation on every agent turn. Marking
+the end of those prefixes with a cache breakpoint lets the API reuse them for
+five minutes, billing a cache read (a tenth of the input price) instead of a
+full input. A breakpoint on a prefix shorter than the model's minimum
+cacheable length is ignored by the API, so marking is always safe.
+
+Cache hits and writes are reported separately from input_tokens in the
+response usage; response_usage() collects all four counts so callers can log
+and total them.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+USAGE_KEYS = ('input_tokens', 'output_tokens', 'cache_read_tokens', 'cache_write_tokens')
+
+
+def cacheable_text(text: str) -> list[dict]:
+    """Content list holding text as one block that ends a cached prefix."""
+    return [{"type": "text", "text": text, "cache_control": dict(CACHE_CONTROL)}]
+
+
+def cacheable_tools(tools: list[dict]) -> list[dict]:
+    """Copy of tools with a breakpoint on the last one, caching all of them."""
+    if not tools:
+        return []
+    marked = list(tools)
+    marked[-1] = {**marked[-1], "cache_control": dict(CACHE_CONTROL)}
+    return marked
+
+
+def mark_conversation_breakpoint(messages: list[dict]) -> None:
+    """Move the rolling conversation breakpoint to the last user message.
+
+    The API allows four breakpoints per request. The agent loop uses one
+    each for tools and system, plus this one, which moves forward every turn
+    so the next turn reads everything up to it from the cache. Only the
+    loop's own user-message dicts are touched; assistant content is left as
+    the SDK returned it.
+    """
+    for message in messages:
+        if message.get("role") != "user" or not isinstance(message.get("content"), list):
+            continue
+        for block in message["content"]:
+            if isinstance(block, dict):
+                block.pop("cache_control", None)
+
+    for message in reversed(messages):
+        if message.get("role") != "user":
+            continue
+        content = message["content"]
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+            message["content"] = content
+        if content and isinstance(content[-1], dict):
+            content[-1]["cache_control"] = dict(CACHE_CONTROL)
+        return
+
+
+def _count(usage, name: str) -> int:
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def response_usage(response) -> dict[str, int]:
+    """Input, output, cache-read and cache-write token counts of a response."""
+    usage = getattr(response, 'usage', None)
+    return {
+        'input_tokens': _count(usage, 'input_tokens'),
+        'output_tokens': _count(usage, 'output_tokens'),
+        'cache_read_tokens': _count(usage, 'cache_read_input_tokens'),
+        'cache_write_tokens': _count(usage, 'cache_creation_input_tokens'),
+    }
+
+
+def add_usage(total: dict[str, int], usage: dict[str, int]) -> dict[str, int]:
+    """Accumulate usage into total (in place) and return it."""
+    for key in USAGE_KEYS:
+        total[key] = total.get(key, 0) + usage.get(key, 0)
+    return total
+
+
+def total_tokens(usage: dict[str, int]) -> int:
+    """Every token billed for a call, cached or not."""
+    return sum(usage.get(key, 0) for key in USAGE_KEYS)
+
+
+def log_usage(label: str, usage: dict[str, int]) -> None:
+    """Log one call's token counts, including cache reads and writes."""
+    logger.info(
+        f"  {label} tokens: {usage['input_tokens']} in, {usage['output_tokens']} out, "
+        f"{usage['cache_read_tokens']} cache read, {usage['cache_write_tokens']} cache write"
+    )
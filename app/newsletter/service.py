@@ -198,9 +198,9 @@ def collect_newsletter_content(newsletter: Newsletter) -> NewsletterContext:
 
     # 1. Collect Slack messages
     try:
-        from app.newsletter.collector import collect_all_messages
+        from app.newsletter.archive import collect_archived_messages
 
-        messages = collect_all_messages(since=newsletter.week_start)
+        messages = collect_archived_messages(since=newsletter.week_start)
         context.slack_messages = messages
         logger.info(f"  Collected {len(messages)} Slack messages")
 
@@ -1130,7 +1130,7 @@ def generate_ai_drafts(newsletter_id: int) -> dict:
     for editor review.
 
     Collects context data:
-    1. Slack messages from the month using collect_all_messages()
+    1. Slack messages from the month using collect_archived_messages()
     2. Leadership channel messages (placeholder for now)
     3. Events (placeholder for now)
     4. Member highlight answers if available
@@ -1171,9 +1171,9 @@ def generate_ai_drafts(newsletter_id: int) -> dict:
     # Collect Slack messages from the month
     if newsletter.period_start and newsletter.period_end:
         try:
-            from app.newsletter.collector import collect_all_messages
+            from app.newsletter.archive import collect_archived_messages
 
-            messages = collect_all_messages(since=newsletter.period_start)
+            messages = collect_archived_messages(since=newsletter.period_start)
             context_data['slack_messages'] = messages
             logger.info(f"Collected {len(messages)} Slack messages for AI draft generation")
         except Exception as e:
@@ -59,6 +59,12 @@ class LeadAvailabilityPoll(db.Model):
     responses = db.relationship(
         "LeadAvailabilityResponse", backref="poll", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Every reaction event first asks "is this an open poll?".
+        db.Index("ix_lead_availability_polls_channel_message_status",
+                 "channel_id", "message_ts", "status"),
+    )
+
     @property
     def resolved_done_emoji(self) -> str:
         """The done emoji this poll actually uses -- snapshot first, config
@@ -5,9 +5,11 @@ sorts and labels only. Unavailable and never-responded candidates sort last,
 but every eligible lead/coach is always present in the returned list.
 """
 
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 
-from app.models import User
+from sqlalchemy import and_, func, or_
+
+from app.models import User, db
 from app.practices.availability import eligible_leads
 from app.practices.availability_models import (
     LeadAvailabilityParticipant,
@@ -70,20 +72,36 @@ def _load_counts(user_ids: list[int], poll: LeadAvailabilityPoll | None, anchor)
         return in_block, recent
 
     window_start = anchor - timedelta(days=LOAD_WINDOW_DAYS)
-
+    in_recent_window = Practice.date.between(window_start, anchor)
+    counts = [func.count().filter(in_recent_window)]
+    date_filter = in_recent_window
+    if poll is not None:
+        # Practice.date is a datetime; the block covers every moment of its
+        # first and last days.
+        block_start = datetime.combine(poll.starts_on, time.min)
+        block_end = datetime.combine(poll.ends_on + timedelta(days=1), time.min)
+        in_block_window = and_(Practice.date >= block_start, Practice.date < block_end)
+        counts.append(func.count().filter(in_block_window))
+        date_filter = or_(in_recent_window, in_block_window)
+
+    # One grouped query over just the two windows, so the cost tracks the
+    # pool size rather than the club's whole lead history.
     rows = (
-        PracticeLead.query
+        db.session.query(PracticeLead.user_id, *counts)
         .join(Practice, Practice.id == PracticeLead.practice_id)
-        .filter(PracticeLead.user_id.in_(user_ids), PracticeLead.role == "lead")
-        .with_entities(PracticeLead.user_id, Practice.date)
+        .filter(
+            PracticeLead.user_id.in_(user_ids),
+            PracticeLead.role == "lead",
+            date_filter,
+        )
+        .group_by(PracticeLead.user_id)
         .all()
     )
 
-    for user_id, when in rows:
-        if poll is not None and poll.starts_on <= when.date() <= poll.ends_on:
-            in_block[user_id] += 1
-        if window_start <= when <= anchor:
-            recent[user_id] += 1
+    for user_id, led_recently, *led_in_block in rows:
+        recent[user_id] = led_recently
+        if led_in_block:
+            in_block[user_id] = led_in_block[0]
 
     return in_block, recent
 
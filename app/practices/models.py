@@ -130,6 +130,8 @@ class PracticeSummaryPost(db.Model):
     surface = db.Column(db.String(32), nullable=False)
     channel_id = db.Column(db.String(50))
     message_ts = db.Column(db.String(50), nullable=False)
+    # sha256 of the last blocks/text chat_update'd onto channel_id/message_ts
+    render_hash = db.Column(db.String(64))
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     updated_at = db.Column(
         db.DateTime,
@@ -193,6 +195,10 @@ class Practice(db.Model):
     slack_collab_message_ts = db.Column(db.String(50))  # Collab review post in #collab-coaches-practices
     slack_coach_summary_ts = db.Column(db.String(50))  # Weekly coach summary post for threading edits
     slack_weekly_summary_ts = db.Column(db.String(50))  # Weekly summary post in #announcements-practices
+    # sha256 of the last announcement / collab render sent to Slack, so
+    # refreshes that would not change the message skip chat_update.
+    slack_message_render_hash = db.Column(db.String(64))
+    slack_collab_render_hash = db.Column(db.String(64))
 
     # Coach review workflow
     coach_approved = db.Column(db.Boolean, default=False, nullable=False)
@@ -232,6 +238,16 @@ class Practice(db.Model):
         cascade='all, delete-orphan'
     )
 
+    __table_args__ = (
+        # Reaction events and combined-lift siblings look practices up by
+        # their announcement's channel + root timestamp.
+        db.Index(
+            'ix_practices_slack_channel_message',
+            'slack_channel_id',
+            'slack_message_ts',
+        ),
+    )
+
     @property
     def has_social(self):
         """Derived from whether a social location is set."""
@@ -344,6 +360,40 @@ class CancellationRequest(db.Model):
         return f'<CancellationRequest Practice#{self.practice_id} {self.status}>'
 
 
+class SkipperSummaryCache(db.Model):
+    """Skipper LLM output keyed by a fingerprint of its prompt inputs.
+
+    One row per Anthropic call; identical re-evaluations (e.g. a manual re-run
+    of the 7am check) are served from here. Token counts and latency are kept
+    from the original call so the spend per prompt version stays visible.
+    """
+    __tablename__ = 'skipper_summary_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(40), nullable=False)  # 'evaluation_summary', 'cancellation_message'
+    fingerprint = db.Column(db.String(64), nullable=False)  # sha256 hex
+    prompt_version = db.Column(db.String(20), nullable=False)
+    model = db.Column(db.String(80), nullable=False)
+    practice_id = db.Column(db.Integer)  # Informational only; not a FK so practice deletes don't touch it
+    text = db.Column(db.Text, nullable=False)
+
+    # Call metrics from the miss that produced this row
+    input_tokens = db.Column(db.Integer)
+    output_tokens = db.Column(db.Integer)
+    latency_ms = db.Column(db.Integer)
+
+    hit_count = db.Column(db.Integer, nullable=False, default=0)
+    last_hit_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('kind', 'fingerprint', name='uq_skipper_summary_cache_kind_fingerprint'),
+    )
+
+    def __repr__(self):
+        return f'<SkipperSummaryCache {self.kind} {self.fingerprint[:12]}>'
+
+
 # Imported for Alembic metadata registration.
 from app.practices.availability_models import (  # noqa: E402,F401
     LeadAvailabilityParticipant,
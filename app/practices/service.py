@@ -3,7 +3,9 @@
 import logging
 from typing import Optional
 
-logger = logging.getLogger(__name__)
+from sqlalchemy.orm import selectinload
+
+from app.models import User
 from app.practices.models import (
     Practice,
     PracticeLocation,
@@ -30,6 +32,8 @@ from app.practices.interfaces import (
 )
 from app.practices.publishing import publish_blockers
 
+logger = logging.getLogger(__name__)
+
 
 def convert_social_location_to_info(location: Optional[SocialLocation]) -> Optional[SocialLocationInfo]:
     """Convert SocialLocation model to SocialLocationInfo dataclass."""
@@ -240,12 +244,39 @@ def convert_cancellation_to_proposal(request: CancellationRequest) -> Cancellati
     )
 
 
-def published_practices():
+# Loader profile for queries whose rows go through convert_practice_to_info().
+# Without it each practice lazy-loads location, social location, activities,
+# types and leads, and then each lead's user and Slack user, one statement at
+# a time. A week of practices costs dozens of round trips. With the profile,
+# every relationship is fetched in one IN-query per level for the whole result.
+PRACTICE_INFO_LOADER = 'info'
+
+
+def _loader_options(loader: Optional[str]) -> tuple:
+    """SQLAlchemy loader options for a named practice query profile."""
+    if loader is None:
+        return ()
+    if loader == PRACTICE_INFO_LOADER:
+        return (
+            selectinload(Practice.location),
+            selectinload(Practice.social_location),
+            selectinload(Practice.activities),
+            selectinload(Practice.practice_types),
+            selectinload(Practice.leads)
+            .selectinload(PracticeLead.user)
+            .selectinload(User.slack_user),
+        )
+    raise ValueError(f"Unknown practice loader profile: {loader!r}")
+
+
+def published_practices(loader: Optional[str] = None):
     """Practice query excluding drafts.
 
     Drafts exist so availability can be collected against real details before
     members see anything, so every member-visible read must go through here.
     Returns a Query, so callers keep chaining .filter()/.order_by() as before.
+    Pass loader=PRACTICE_INFO_LOADER when the rows will be converted to
+    PracticeInfo.
     """
     # Re-imported here (Practice is already imported at module level above)
     # so this resolves against app.practices.models.Practice at call time.
@@ -255,10 +286,12 @@ def published_practices():
     # re-reads the current attribute and picks up the patch.
     from app.practices.models import Practice
 
-    return Practice.query.filter(Practice.is_draft.is_(False))
+    options = _loader_options(loader)
+    query = Practice.query.filter(Practice.is_draft.is_(False))
+    return query.options(*options) if options else query
 
 
-def coach_visible_practices():
+def coach_visible_practices(loader: Optional[str] = None):
     """Practice query INCLUDING drafts — for coach and director surfaces only.
 
     The deliberate counterpart to published_practices(). Drafts exist for
@@ -271,8 +304,10 @@ def coach_visible_practices():
     Never use this for anything a member can see. It exists as a named function
     rather than a bare `Practice.query` so every intentional draft-including
     read is greppable and obviously deliberate, rather than looking like
-    someone forgot the gate.
+    someone forgot the gate. Accepts the same loader profiles as
+    published_practices().
     """
     from app.practices.models import Practice
 
-    return Practice.query
+    options = _loader_options(loader)
+    return Practice.query.options(*options) if options else Practice.query
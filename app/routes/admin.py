@@ -6,6 +6,7 @@ from ..constants import DATE_FORMAT, DATETIME_FORMAT, MIN_PRICE_CENTS, CENTS_PER
 from ..slack.sync import sync_slack_users, get_sync_status, get_unmatched_slack_users, get_unmatched_db_users, get_all_users_with_slack_status, link_user_to_slack, unlink_user_from_slack, import_slack_user, sync_profiles_to_slack
 from ..slack.client import send_direct_message, open_conversation, send_message_to_channel
 from ..slack.channel_sync import run_channel_sync, load_channel_config
+from ..slack.modal_cache import invalidate_modal_reference_data
 from ..slack.admin_api import validate_admin_credentials
 from ..integrations.expertvoice import sync_expertvoice
 from ..scheduler import get_scheduler_status
@@ -1091,6 +1092,7 @@ def update_user_tags(user_id):
     # Replace user's tags
     user.tags = new_tags
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1135,6 +1137,7 @@ def create_tag():
     )
     db.session.add(tag)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1184,6 +1187,7 @@ def edit_tag(tag_id):
         tag.description = val.strip() if val else None
 
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1213,6 +1217,7 @@ def delete_tag(tag_id):
     tag_name = tag.display_name
     db.session.delete(tag)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
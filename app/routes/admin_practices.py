@@ -39,6 +39,7 @@ from ..practices.plan_reactions import (
     resolve_plan_reaction_defaults,
     validate_authorized_plan_reactions,
 )
+from ..slack.modal_cache import invalidate_modal_reference_data
 from sqlalchemy.orm import joinedload
 
 # HH:MM, 00:00-23:59. Used to validate practice_days entries -- see
@@ -1116,6 +1117,7 @@ def create_location():
     )
     db.session.add(location)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1164,6 +1166,7 @@ def edit_location(loc_id):
         location.parking_notes = (request.json['parking_notes'] or '').strip() or None
 
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1195,6 +1198,7 @@ def delete_location(loc_id):
     location_name = location.name
     db.session.delete(location)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1248,6 +1252,7 @@ def create_activity():
     )
     db.session.add(activity)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1296,6 +1301,7 @@ def edit_activity(activity_id):
         activity.default_plan_reactions = defaults
 
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1317,6 +1323,7 @@ def delete_activity(activity_id):
     activity_name = activity.name
     db.session.delete(activity)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1371,6 +1378,7 @@ def create_type():
     )
     db.session.add(practice_type)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1422,6 +1430,7 @@ def edit_type(type_id):
         practice_type.default_plan_reactions = defaults
 
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -1443,6 +1452,7 @@ def delete_type(type_id):
     type_name = practice_type.name
     db.session.delete(practice_type)
     db.session.commit()
+    invalidate_modal_reference_data()
 
     return jsonify({
         'success': True,
@@ -0,0 +1,183 @@
+"""Bounded worker pool for Slack work that runs after the ack.
+
+Modal submissions ack immediately and then refresh announcements and
+summaries, and Bolt lazy listeners do their real work after the ack too. Each
+of those used to get its own thread, so a burst of submissions could start
+any number of threads, every one of them holding a connection from the
+five-connection engine pool. Everything now goes through one executor with a
+fixed number of workers and a bounded queue.
+
+When the queue is full, submit() runs the task on the calling thread instead
+of queueing it. That is the push back: the producer (a request thread or the
+Socket Mode dispatcher) slows down to the rate the pool can drain, and the
+thread count never grows with the burst.
+
+Every task runs inside a Flask app context and removes its scoped session
+when it finishes, whichever thread it lands on. stats() reports queue depth
+and wait/run latency for the task mix.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV = "SLACK_BACKGROUND_WORKERS"
+QUEUE_LIMIT_ENV = "SLACK_BACKGROUND_QUEUE_LIMIT"
+# One below the engine's pool_size, so request threads always have a
+# connection left even when every worker is busy.
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE_LIMIT = 32
+# Queue waits longer than this are logged; they mean the pool is undersized.
+SLOW_WAIT_SECONDS = 2.0
+
+
+def _int_env(name: str, default: int) -> int:
+    raw = os.environ.get(name, "")
+    try:
+        return max(int(raw), 1) if raw else default
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
+class PostAckExecutor(Executor):
+    """Fixed-size pool with a bounded queue and caller-runs overflow.
+
+    Subclasses concurrent.futures.Executor so it can also be handed to Bolt
+    as the listener_executor for lazy listeners.
+    """
+
+    def __init__(self, max_workers: int | None = None, queue_limit: int | None = None):
+        self.max_workers = max_workers or _int_env(WORKERS_ENV, DEFAULT_WORKERS)
+        self.queue_limit = (
+            queue_limit
+            if queue_limit is not None
+            else _int_env(QUEUE_LIMIT_ENV, DEFAULT_QUEUE_LIMIT)
+        )
+        self._flask_app = None
+        self._pool = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._ran_inline = 0
+        self._max_queue_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+
+    def bind_flask_app(self, flask_app) -> None:
+        """App whose context tasks run in when submitted outside one."""
+        self._flask_app = flask_app
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        flask_app = (
+            current_app._get_current_object() if has_app_context() else self._flask_app
+        )
+        submitted_at = time.monotonic()
+        with self._lock:
+            saturated = self._queued >= self.queue_limit
+            if not saturated:
+                self._queued += 1
+                self._max_queue_depth = max(self._max_queue_depth, self._queued)
+                if self._pool is None:
+                    # Created on first use so processes that never submit
+                    # (migrations, CLI commands) start no threads.
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="slack-post-ack",
+                    )
+                pool = self._pool
+
+        if saturated:
+            with self._lock:
+                self._ran_inline += 1
+            logger.warning(
+                "Slack background queue full (%s waiting); running %s inline",
+                self.queue_limit,
+                getattr(fn, "__name__", fn),
+            )
+            future = Future()
+            try:
+                future.set_result(
+                    self._run(fn, args, kwargs, flask_app, submitted_at, queued=False)
+                )
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+
+        return pool.submit(self._run, fn, args, kwargs, flask_app, submitted_at)
+
+    def _run(self, fn, args, kwargs, flask_app, submitted_at, queued=True):
+        started_at = time.monotonic()
+        waited = started_at - submitted_at
+        with self._lock:
+            if queued:
+                self._queued -= 1
+            self._active += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        if waited > SLOW_WAIT_SECONDS:
+            logger.warning(
+                "Slack background task %s waited %.1fs for a worker",
+                getattr(fn, "__name__", fn),
+                waited,
+            )
+
+        failed = False
+        try:
+            if flask_app is None:
+                return fn(*args, **kwargs)
+            with flask_app.app_context():
+                from app.models import db
+
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    db.session.remove()
+        except Exception:
+            failed = True
+            logger.exception(
+                "Slack background task %s failed", getattr(fn, "__name__", fn)
+            )
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._failed += failed
+                self._total_run += time.monotonic() - started_at
+
+    def stats(self) -> dict:
+        """Queue depth, throughput and latency since the process started."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.max_workers,
+                "queue_limit": self.queue_limit,
+                "queued": self._queued,
+                "active": self._active,
+                "completed": completed,
+                "failed": self._failed,
+                "ran_inline": self._ran_inline,
+                "max_queue_depth": self._max_queue_depth,
+                "avg_wait_ms": round(1000 * self._total_wait / completed, 1) if completed else 0.0,
+                "max_wait_ms": round(1000 * self._max_wait, 1),
+                "avg_run_ms": round(1000 * self._total_run / completed, 1) if completed else 0.0,
+            }
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+post_ack_executor = PostAckExecutor()
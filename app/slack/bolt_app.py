@@ -22,6 +22,8 @@ from datetime import datetime
 from types import SimpleNamespace
 from typing import Optional
 
+from app.slack.background import post_ack_executor
+
 logger = logging.getLogger(__name__)
 
 # Initialize Bolt app with signing secret for request verification
@@ -68,6 +70,7 @@ def bind_flask_app(flask_app) -> None:
     global _flask_app
 
     _flask_app = flask_app
+    post_ack_executor.bind_flask_app(flask_app)
 
 
 def _ack_practice_reaction_action(ack) -> None:
@@ -112,7 +115,10 @@ if _bot_token:
         signing_secret=_signing_secret,
         # Process events synchronously before returning response
         # This ensures we're still in Flask's request context
-        process_before_response=True
+        process_before_response=True,
+        # Lazy listeners share the bounded post-ack pool with modal
+        # post-save work instead of getting a pool of their own.
+        listener_executor=post_ack_executor,
     )
     handler = SlackRequestHandler(bolt_app)
     logger.info("Slack Bolt app initialized (HTTP mode)")
@@ -2624,18 +2630,14 @@ def _handle_practice_create_submission(
         ":white_check_mark: Created practice for "
         f"{practice_datetime.strftime('%A, %B %-d at %-I:%M %p')}"
     )
-    threading.Thread(
-        target=_post_practice_create_updates,
-        args=(
-            client,
-            practice_id,
-            channel_id,
-            user_id,
-            confirm_text,
-        ),
-        daemon=True,
-        name="practice-create-post",
-    ).start()
+    post_ack_executor.submit(
+        _post_practice_create_updates,
+        client,
+        practice_id,
+        channel_id,
+        user_id,
+        confirm_text,
+    )
     return None
 
 
@@ -2741,11 +2743,7 @@ def _run_practice_edit_full_post_save(
 
 def _dispatch_practice_edit_full_post_save(work) -> None:
     """Run committed Full Edit Slack synchronization off the response path."""
-    threading.Thread(
-        target=work,
-        daemon=True,
-        name="practice-edit-post-save",
-    ).start()
+    post_ack_executor.submit(work)
 
 
 def _handle_practice_edit_full_submission(
@@ -3118,45 +3116,74 @@ def _handle_practice_edit_full_submission(
 def _load_modal_ref_data():
     """Load reference data for practice modal dropdowns.
 
+    Served from the modal reference cache (see app.slack.modal_cache).
+
     Returns:
         Tuple of (locations, all_activities, all_types) where each is a list of (id, name) tuples.
     """
+    from app.slack.modal_cache import cached_reference_data
+    return tuple(
+        list(rows)
+        for rows in cached_reference_data("ref_data", _query_modal_ref_data)
+    )
+
+
+def _query_modal_ref_data():
     from app.practices.models import PracticeLocation, PracticeActivity, PracticeType
-    locations = [
+    locations = tuple(
         (l.id, f"{l.name} - {l.spot}" if l.spot else l.name)
         for l in PracticeLocation.query.order_by(PracticeLocation.name).all()
-    ]
-    all_activities = [
+    )
+    all_activities = tuple(
         (a.id, a.name) for a in PracticeActivity.query.order_by(PracticeActivity.name).all()
-    ]
-    all_types = [
+    )
+    all_types = tuple(
         (t.id, t.name) for t in PracticeType.query.order_by(PracticeType.name).all()
-    ]
+    )
     return locations, all_activities, all_types
 
 
 def _load_eligible_people():
     """Load eligible coaches and leads for practice modal pickers.
 
+    Served from the modal reference cache (see app.slack.modal_cache).
+
     Returns:
         Tuple of (eligible_coaches, eligible_leads), each a list of
         (user_id, "First Last", slack_uid) tuples for Slack-linked users only.
     """
-    from app.models import Tag, User
-    coach_tag_ids = [t.id for t in Tag.query.filter(
-        Tag.name.in_(['HEAD_COACH', 'ASSISTANT_COACH'])).all()]
-    lead_tag_ids = [t.id for t in Tag.query.filter(
-        Tag.name.in_(['PRACTICES_LEAD'])).all()]
-
-    def _people(tag_ids):
-        return [
-            (u.id, f"{u.first_name} {u.last_name}", u.slack_user.slack_uid)
-            for u in User.query.filter(User.tags.any(Tag.id.in_(tag_ids)))
-            .order_by(User.first_name).all()
-            if u.slack_user and u.slack_user.slack_uid
-        ]
+    from app.slack.modal_cache import cached_reference_data
+    return tuple(
+        list(rows)
+        for rows in cached_reference_data("people", _query_eligible_people)
+    )
+
+
+def _query_eligible_people():
+    from app.models import SlackUser, Tag, User, db
+
+    def _people(tag_names):
+        # One joined row per user: reading u.slack_user per row used to
+        # lazy-load each linked SlackUser separately.
+        rows = (
+            db.session.query(
+                User.id, User.first_name, User.last_name, SlackUser.slack_uid
+            )
+            .join(User.slack_user)
+            .filter(
+                User.tags.any(Tag.name.in_(tag_names)),
+                SlackUser.slack_uid.isnot(None),
+                SlackUser.slack_uid != "",
+            )
+            .order_by(User.first_name)
+            .all()
+        )
+        return tuple(
+            (user_id, f"{first_name} {last_name}", slack_uid)
+            for user_id, first_name, last_name, slack_uid in rows
+        )
 
-    return _people(coach_tag_ids), _people(lead_tag_ids)
+    return _people(['HEAD_COACH', 'ASSISTANT_COACH']), _people(['PRACTICES_LEAD'])
 
 
 def _post_practice_create_updates(
@@ -3168,7 +3195,7 @@ def _post_practice_create_updates(
 ):
     """Refresh a committed practice's summaries and post a confirmation.
 
-    Runs in a background thread (see handle_practice_create_submission) so the
+    Runs on the post-ack pool (see handle_practice_create_submission) so the
     slow Slack API calls stay off the view_submission request path and the ack
     returns within Slack's ~3s limit. All work is best-effort.
     """
@@ -3242,7 +3269,7 @@ def _process_rsvp(practice_id: int, status: str, user_id: str, user_name: str) -
     from app.models import db, User
     from app.practices.models import Practice, PracticeRSVP
     from app.practices.interfaces import RSVPStatus
-    from app.slack.practices import update_practice_rsvp_counts, log_rsvp_action
+    from app.slack.practices import schedule_rsvp_count_refresh, log_rsvp_action
 
     # Validate status
     valid_statuses = {RSVPStatus.GOING.value, RSVPStatus.NOT_GOING.value, RSVPStatus.MAYBE.value}
@@ -3289,7 +3316,7 @@ def _process_rsvp(practice_id: int, status: str, user_id: str, user_name: str) -
     db.session.commit()
 
     try:
-        update_practice_rsvp_counts(practice)
+        schedule_rsvp_count_refresh(practice.id)
     except Exception as e:
         logger.warning(f"Could not update RSVP counts: {e}")
 
@@ -3308,7 +3335,7 @@ def _process_rsvp_with_notes(practice_id: int, status: str, user_id: str, notes:
     from app.models import db, User
     from app.practices.models import Practice, PracticeRSVP
     from app.practices.interfaces import RSVPStatus
-    from app.slack.practices import update_practice_rsvp_counts, log_rsvp_action
+    from app.slack.practices import schedule_rsvp_count_refresh, log_rsvp_action
 
     # Validate status
     valid_statuses = {RSVPStatus.GOING.value, RSVPStatus.NOT_GOING.value, RSVPStatus.MAYBE.value}
@@ -3351,7 +3378,7 @@ def _process_rsvp_with_notes(practice_id: int, status: str, user_id: str, notes:
 
     # Update the main message going count
     try:
-        update_practice_rsvp_counts(practice)
+        schedule_rsvp_count_refresh(practice.id)
     except Exception as e:
         import logging
         logging.getLogger(__name__).warning(f"Could not update RSVP counts: {e}")
@@ -0,0 +1,49 @@
+"""Per-process cache for practice modal reference lists.
+
+Opening a practice modal needs every location, activity and type plus the
+Slack-linked coaches and leads, and Slack closes the trigger after ~3
+seconds. Those lists change only when an admin edits them, so they are
+loaded once and reused.
+
+Entries are stamped with the version current when their load started. The
+admin CRUD routes for locations, activities, types and tags call
+invalidate_modal_reference_data() after committing, which bumps the version
+so the next modal open reloads; a load that raced the bump is stamped with
+the old version and is discarded on its next read. The TTL bounds staleness
+from writes this process cannot see: other workers, scripts, and Slack
+account linking.
+"""
+
+import threading
+import time
+
+CACHE_TTL_SECONDS = 300
+
+_lock = threading.Lock()
+_version = 0
+_entries: dict[str, tuple[int, float, object]] = {}
+
+
+def cached_reference_data(name: str, loader):
+    """Return loader()'s result for name, reloading when stale."""
+    now = time.monotonic()
+    with _lock:
+        version = _version
+        entry = _entries.get(name)
+    if entry is not None:
+        stamp, loaded_at, value = entry
+        if stamp == version and now - loaded_at <= CACHE_TTL_SECONDS:
+            return value
+
+    value = loader()
+    with _lock:
+        _entries[name] = (version, now, value)
+    return value
+
+
+def invalidate_modal_reference_data() -> None:
+    """Drop every cached list; call after committing a reference-data edit."""
+    global _version
+    with _lock:
+        _version += 1
+        _entries.clear()
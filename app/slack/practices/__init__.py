@@ -59,6 +59,7 @@ from app.slack.practices.rsvp import (
     post_thread_reply,
     update_going_list_thread,
     update_practice_rsvp_counts,
+    schedule_rsvp_count_refresh,
     log_rsvp_action,
 )
 from app.slack.practices.reactions import (
@@ -127,6 +128,7 @@ __all__ = [
     "post_thread_reply",
     "update_going_list_thread",
     "update_practice_rsvp_counts",
+    "schedule_rsvp_count_refresh",
     "log_rsvp_action",
     # reactions
     "handle_attendance_reaction",
@@ -39,6 +39,11 @@ from app.slack.practices._config import (
     _get_announcement_channel,
     get_default_duration_minutes,
 )
+from app.slack.practices.render_hash import (
+    remember_render,
+    render_hash,
+    render_unchanged,
+)
 
 
 _UNSET = object()
@@ -1195,13 +1200,24 @@ def update_practice_announcement(
         announcement_notice=announcement_notice,
     )
 
+    digest = render_hash(
+        practice.slack_channel_id, practice.slack_message_ts, blocks, fallback
+    )
+
     try:
-        client.chat_update(
-            channel=practice.slack_channel_id,
-            ts=practice.slack_message_ts,
-            blocks=blocks,
-            text=fallback,
-        )
+        if render_unchanged(practice, "slack_message_render_hash", digest):
+            current_app.logger.info(
+                f"Announcement for practice #{practice.id} unchanged; "
+                "skipping chat_update"
+            )
+        else:
+            client.chat_update(
+                channel=practice.slack_channel_id,
+                ts=practice.slack_message_ts,
+                blocks=blocks,
+                text=fallback,
+            )
+            remember_render(practice, "slack_message_render_hash", digest)
 
         _reconcile_plan_reactions(
             client,
@@ -1307,13 +1323,20 @@ def update_combined_lift_post(
                 "error": "Combined Details did not sync; root was not changed",
                 "details": details,
             }
+    digest = render_hash(
+        practice.slack_channel_id, practice.slack_message_ts, blocks, fallback
+    )
     try:
-        client.chat_update(
-            channel=practice.slack_channel_id,
-            ts=practice.slack_message_ts,
-            blocks=blocks,
-            text=fallback,
-        )
+        if not render_unchanged(practice, "slack_message_render_hash", digest):
+            client.chat_update(
+                channel=practice.slack_channel_id,
+                ts=practice.slack_message_ts,
+                blocks=blocks,
+                text=fallback,
+            )
+            # Siblings share the root, so they share its last render.
+            for item in siblings:
+                remember_render(item, "slack_message_render_hash", digest)
         if details is None:
             details = _upsert_combined_details_reply(client, siblings)
         _reconcile_combined_plan_reactions(
@@ -30,9 +30,9 @@ def publish_app_home(user_slack_id: str) -> dict:
     now = now_central_naive()
     end_date = now + timedelta(days=14)
 
-    from app.practices.service import published_practices
+    from app.practices.service import PRACTICE_INFO_LOADER, published_practices
 
-    practices = published_practices().filter(
+    practices = published_practices(PRACTICE_INFO_LOADER).filter(
         Practice.date >= now,
         Practice.date <= end_date
     ).order_by(Practice.date).all()
@@ -18,6 +18,7 @@ from app.practices.models import Practice, CancellationRequest
 from app.practices.interfaces import PracticeEvaluation
 
 from app.slack.practices._config import _get_announcement_channel, _get_escalation_channel
+from app.slack.practices.render_hash import remember_render, render_hash
 
 
 def post_cancellation_proposal(
@@ -162,6 +163,12 @@ def post_cancellation_notice(practice: Practice) -> dict:
                     blocks=blocks,
                     text=fallback,
                 )
+                remember_render(
+                    practice,
+                    "slack_message_render_hash",
+                    render_hash(practice.slack_channel_id,
+                                practice.slack_message_ts, blocks, fallback),
+                )
             except SlackApiError as e:
                 current_app.logger.warning(f"Could not update original announcement: {e}")
 
@@ -210,6 +217,12 @@ def update_practice_as_cancelled(practice: Practice, decided_by_name: str) -> di
             blocks=blocks,
             text=fallback,
         )
+        remember_render(
+            practice,
+            "slack_message_render_hash",
+            render_hash(practice.slack_channel_id,
+                        practice.slack_message_ts, blocks, fallback),
+        )
 
         # Post a thread reply with cancellation notice
         thread_text = guard_fallback_text(
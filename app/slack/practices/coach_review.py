@@ -23,6 +23,11 @@ from app.slack.practices.announcements import (
     _delete_slack_message,
     _recover_ambiguous_link,
 )
+from app.slack.practices.render_hash import (
+    remember_render,
+    render_hash,
+    render_unchanged,
+)
 from app.slack.practices.summary_posts import (
     COACH_SUMMARY,
     stage_summary_post,
@@ -326,13 +331,21 @@ def update_collab_post(practice: Practice) -> dict:
         approved_at=practice.approved_at
     )
 
+    fallback = f"Practice review: {practice.date.strftime('%A, %B %d')}"
+    digest = render_hash(
+        COLLAB_CHANNEL_ID, practice.slack_collab_message_ts, blocks, fallback
+    )
+    if render_unchanged(practice, "slack_collab_render_hash", digest):
+        return {'success': True, 'skipped': 'unchanged'}
+
     try:
         client.chat_update(
             channel=COLLAB_CHANNEL_ID,
             ts=practice.slack_collab_message_ts,
             blocks=blocks,
-            text=f"Practice review: {practice.date.strftime('%A, %B %d')}"
+            text=fallback
         )
+        remember_render(practice, "slack_collab_render_hash", digest)
 
         current_app.logger.info(f"Updated collab post for practice #{practice.id}")
         return {'success': True}
@@ -438,6 +451,7 @@ def post_coach_weekly_summary(
     from datetime import timedelta
     from app.models import AppConfig, Tag
     from app.practices.service import (
+        PRACTICE_INFO_LOADER,
         coach_visible_practices,
         convert_practice_to_info,
     )
@@ -453,7 +467,7 @@ def post_coach_weekly_summary(
     # hiding them made every drafted slot render as an empty "Add Practice"
     # placeholder, inviting a second practice on top of the draft.
     week_end = week_start + timedelta(days=7)
-    practices = coach_visible_practices().filter(
+    practices = coach_visible_practices(PRACTICE_INFO_LOADER).filter(
         Practice.date >= week_start,
         Practice.date < week_end
     ).order_by(Practice.date).all()
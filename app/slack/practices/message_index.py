@@ -0,0 +1,143 @@
+"""Per-process index of the Slack messages reaction events care about.
+
+Every reaction in the workspace reaches handle_attendance_reaction, and most
+are on messages that are neither an open availability poll nor a practice
+announcement. Without this index each one still costs a poll query and an
+announcement query before being ignored.
+
+The index holds every (channel, ts) pair that is a practice announcement or
+an open poll. A message older than the snapshot and absent from it cannot be
+interesting, so its reaction returns without touching the database. Messages
+posted after the snapshot was taken are always treated as candidates, so a
+fresh announcement never loses its first reactions while the index catches
+up. ORM attribute events on the announcement and poll columns drop the
+snapshot whenever a message is posted, relinked or closed, and a TTL bounds
+staleness from writes that bypass the ORM.
+
+A slack_uid -> user_id map serves the linked reactions the same way; it only
+caches positive lookups, so a member linking their account is seen at once.
+"""
+
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+
+from app.models import SlackUser, User, db
+from app.practices.availability_models import LeadAvailabilityPoll, PollStatus
+from app.practices.models import Practice
+
+logger = logging.getLogger(__name__)
+
+INDEX_TTL_SECONDS = 300
+USER_MAP_TTL_SECONDS = 600
+# Slack timestamps come from Slack's clock, not ours.
+CLOCK_SKEW_SECONDS = 60
+
+_lock = threading.Lock()
+_index: dict = {}
+_user_ids: dict[str, tuple[int, float]] = {}
+
+
+def _load_index():
+    announcements = (
+        db.session.query(Practice.slack_channel_id, Practice.slack_message_ts)
+        .filter(
+            Practice.slack_channel_id.isnot(None),
+            Practice.slack_message_ts.isnot(None),
+        )
+        .distinct()
+        .all()
+    )
+    polls = (
+        db.session.query(
+            LeadAvailabilityPoll.channel_id, LeadAvailabilityPoll.message_ts
+        )
+        .filter(
+            LeadAvailabilityPoll.status == PollStatus.OPEN,
+            LeadAvailabilityPoll.message_ts.isnot(None),
+        )
+        .all()
+    )
+    return frozenset(tuple(row) for row in (*announcements, *polls))
+
+
+def is_candidate_message(channel, message_ts) -> bool:
+    """False only when the message is known not to be an announcement or poll.
+
+    Any doubt (unparseable ts, a message newer than the snapshot, a failed
+    load) answers True so the caller falls through to the database.
+    """
+    try:
+        posted_at = float(message_ts)
+    except (TypeError, ValueError):
+        return True
+
+    now = time.time()
+    with _lock:
+        snapshot = _index.get("messages")
+        loaded_at = _index.get("loaded_at", 0.0)
+        if snapshot is None or now - loaded_at > INDEX_TTL_SECONDS:
+            snapshot = None
+
+    if snapshot is None:
+        try:
+            snapshot = _load_index()
+        except Exception:
+            logger.warning("Could not load the reaction message index", exc_info=True)
+            return True
+        loaded_at = now
+        with _lock:
+            _index["messages"] = snapshot
+            _index["loaded_at"] = loaded_at
+
+    if posted_at >= loaded_at - CLOCK_SKEW_SECONDS:
+        return True
+    return (channel, message_ts) in snapshot
+
+
+def user_id_for_slack_uid(slack_user_id):
+    """Linked app user id for a Slack user, or None when not linked."""
+    now = time.time()
+    with _lock:
+        cached = _user_ids.get(slack_user_id)
+    if cached is not None and now - cached[1] <= USER_MAP_TTL_SECONDS:
+        return cached[0]
+
+    row = (
+        db.session.query(User.id)
+        .join(User.slack_user)
+        .filter(SlackUser.slack_uid == slack_user_id)
+        .first()
+    )
+    if row is None:
+        return None
+    with _lock:
+        _user_ids[slack_user_id] = (row[0], now)
+    return row[0]
+
+
+def invalidate_message_index(*_args, **_kwargs):
+    with _lock:
+        _index.clear()
+
+
+def invalidate_user_map(*_args, **_kwargs):
+    with _lock:
+        _user_ids.clear()
+
+
+for _attribute in (
+    Practice.slack_channel_id,
+    Practice.slack_message_ts,
+    LeadAvailabilityPoll.channel_id,
+    LeadAvailabilityPoll.message_ts,
+    LeadAvailabilityPoll.status,
+):
+    event.listen(_attribute, "set", invalidate_message_index)
+
+for _attribute in (User.slack_user_id, SlackUser.slack_uid):
+    event.listen(_attribute, "set", invalidate_user_map)
+for _model in (User, SlackUser):
+    event.listen(_model, "after_delete", invalidate_user_map)
@@ -4,9 +4,13 @@ import logging
 from datetime import datetime
 from types import SimpleNamespace
 
-from app.models import User, db
+from app.models import db
 from app.practices.interfaces import PracticeStatus, RSVPStatus
 from app.practices.models import Practice, PracticeRSVP
+from app.slack.practices.message_index import (
+    is_candidate_message,
+    user_id_for_slack_uid,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +36,10 @@ def handle_attendance_reaction(
     if not all((channel, message_ts, reaction, slack_user_id)):
         return {"success": True, "ignored": "invalid_event"}
 
+    # Most reactions are on unrelated messages; answer those from memory.
+    if not is_candidate_message(channel, message_ts):
+        return {"success": True, "ignored": "message_not_linked"}
+
     # Availability polls live in the same channels as announcements, so check
     # them first. Returns None when this message is not a poll.
     #
@@ -101,17 +109,13 @@ def handle_attendance_reaction(
     if practice.status == PracticeStatus.CANCELLED.value:
         return {"success": True, "ignored": "cancelled"}
 
-    user = (
-        User.query.join(User.slack_user)
-        .filter_by(slack_uid=slack_user_id)
-        .first()
-    )
-    if user is None:
+    user_id = user_id_for_slack_uid(slack_user_id)
+    if user_id is None:
         return {"success": True, "ignored": "unlinked_user"}
 
     rsvp = PracticeRSVP.query.filter_by(
         practice_id=practice.id,
-        user_id=user.id,
+        user_id=user_id,
     ).first()
     if removed:
         if rsvp is None or rsvp.status != RSVPStatus.GOING.value:
@@ -125,7 +129,7 @@ def handle_attendance_reaction(
         if rsvp is None:
             rsvp = PracticeRSVP(
                 practice_id=practice.id,
-                user_id=user.id,
+                user_id=user_id,
                 slack_user_id=slack_user_id,
             )
             db.session.add(rsvp)
@@ -137,9 +141,9 @@ def handle_attendance_reaction(
     db.session.commit()
 
     try:
-        from app.slack.practices.rsvp import update_practice_rsvp_counts
+        from app.slack.practices.rsvp import schedule_rsvp_count_refresh
 
-        update_practice_rsvp_counts(practice)
+        schedule_rsvp_count_refresh(practice.id)
     except Exception:
         logger.warning(
             "Attendance saved but legacy count refresh failed for practice #%s",
@@ -6,13 +6,25 @@ summary, weekly summary, edit logs).
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta
 
+from flask import current_app, has_app_context
 from sqlalchemy import update
 from sqlalchemy.orm.attributes import set_committed_value
 
 from app.practices.drafting import default_practice_days
 from app.practices.models import Practice, PracticeSummaryPost
+from app.slack.practices.render_hash import (
+    remember_render,
+    render_hash,
+    render_unchanged,
+)
+from app.slack.practices.refresh_queue import (
+    coalesce_window_seconds,
+    refresh_queue,
+)
 from app.slack.practices.summary_posts import (
     COACH_SUMMARY,
     WEEKLY_SUMMARY,
@@ -23,6 +35,9 @@ from app.slack.practices.summary_posts import (
 
 logger = logging.getLogger(__name__)
 
+# Set to 1/true to refresh independent surfaces on a small thread pool.
+CONCURRENT_REFRESH_ENV = "PRACTICE_REFRESH_CONCURRENT"
+
 # Change types that any surface may react to.
 ALL_CHANGE_TYPES = ("edit", "cancel", "delete", "rsvp", "workout", "create")
 
@@ -70,6 +85,7 @@ def refresh_practice_posts(
     announcement_notice=None,
     previous_plan_reactions=None,
     previous_date=None,
+    concurrent=None,
 ):
     """Update all Slack posts for a practice after DB changes.
 
@@ -80,6 +96,14 @@ def refresh_practice_posts(
         notify: Whether to post thread notifications (edit logs)
         previous_date: Date before an edit, used to refresh a distinct source
             week when the practice crosses a Monday boundary
+        concurrent: Refresh independent surfaces in parallel; defaults to
+            the PRACTICE_REFRESH_CONCURRENT environment switch
+
+    When PRACTICE_REFRESH_COALESCE_SECONDS is set, the week-level Coach and
+    public summaries of non-delete changes are handed to the coalescing
+    refresh queue instead of rebuilt inline; their results are then
+    {'queued': True, 'future': Future}. Deletes stay synchronous so the
+    deleted practice is excluded from the rebuild it triggers.
 
     Returns:
         dict with results per post type, e.g.:
@@ -94,31 +118,36 @@ def refresh_practice_posts(
         "announcement_notice": announcement_notice,
         "previous_plan_reactions": previous_plan_reactions,
     }
-    results = {}
-    had_announcement = bool(practice.slack_message_ts)
-    for index, surface in enumerate(PRACTICE_SURFACES):
-        result = surface.refresh(practice, change_type, **context)
-        results[surface.name] = result
-        if (
-            change_type == "delete"
-            and surface.name == "announcement"
-            and had_announcement
-            and result.get("success") is not True
-        ):
-            for blocked in PRACTICE_SURFACES[index + 1:]:
-                results[blocked.name] = {
-                    "skipped": "blocked_by_announcement"
-                }
-            break
+    coalesce_window = (
+        coalesce_window_seconds() if change_type != "delete" else 0
+    )
+    if concurrent is None:
+        concurrent = surface_refresh_concurrent()
+    if concurrent:
+        results = _refresh_surfaces_concurrently(
+            practice, change_type, context, coalesce_window
+        )
+    else:
+        results = _refresh_surfaces_serially(
+            practice, change_type, context, coalesce_window
+        )
 
     if (
         change_type == "edit"
         and previous_date is not None
         and week_start_date(previous_date) != week_start_date(practice.date)
     ):
-        previous_results = refresh_registered_practice_summaries(
-            previous_date
-        )
+        if coalesce_window:
+            previous_results = {
+                name: _queue_week_summary_refresh(
+                    name, previous_date, coalesce_window
+                )
+                for name in _WEEK_SUMMARY_REFRESHERS
+            }
+        else:
+            previous_results = refresh_registered_practice_summaries(
+                previous_date
+            )
         results["previous_coach_summary"] = previous_results[
             "coach_summary"
         ]
@@ -171,6 +200,128 @@ def refresh_practice_posts(
     return results
 
 
+def surface_refresh_concurrent() -> bool:
+    """Whether PRACTICE_REFRESH_CONCURRENT enables parallel surface refresh."""
+    return os.environ.get(CONCURRENT_REFRESH_ENV, "").lower() in (
+        "1", "true", "yes",
+    )
+
+
+def _refresh_surface(surface, practice, change_type, context, coalesce_window):
+    """Refresh one surface, diverting week summaries to the refresh queue."""
+    if (
+        coalesce_window
+        and surface.name in _WEEK_SUMMARY_REFRESHERS
+        and change_type in surface.applies_to
+    ):
+        return _queue_week_summary_refresh(
+            surface.name, practice.date, coalesce_window
+        )
+    return surface.refresh(practice, change_type, **context)
+
+
+def _refresh_surfaces_serially(practice, change_type, context, coalesce_window):
+    results = {}
+    had_announcement = bool(practice.slack_message_ts)
+    for index, surface in enumerate(PRACTICE_SURFACES):
+        result = _refresh_surface(
+            surface, practice, change_type, context, coalesce_window
+        )
+        results[surface.name] = result
+        if (
+            change_type == "delete"
+            and surface.name == "announcement"
+            and had_announcement
+            and result.get("success") is not True
+        ):
+            for blocked in PRACTICE_SURFACES[index + 1:]:
+                results[blocked.name] = {
+                    "skipped": "blocked_by_announcement"
+                }
+            break
+    return results
+
+
+def _refresh_surfaces_concurrently(
+    practice, change_type, context, coalesce_window
+):
+    """Refresh surfaces in parallel; latency is the slowest surface, not the sum.
+
+    The announcement stays on the calling thread because it writes Slack
+    timestamps back onto the caller's practice and commits them. Every other
+    surface runs on the pool in its own app context, and so its own session,
+    against a freshly loaded copy of the committed practice. A delete still
+    refreshes the announcement first and blocks the rest if that fails.
+    """
+    flask_app = (
+        current_app._get_current_object() if has_app_context() else None
+    )
+    practice_id = practice.id
+    announcement = next(
+        (s for s in PRACTICE_SURFACES if s.name == "announcement"), None
+    )
+    pooled = [s for s in PRACTICE_SURFACES if s is not announcement]
+    results = {}
+
+    if change_type == "delete" and announcement is not None:
+        had_announcement = bool(practice.slack_message_ts)
+        results["announcement"] = announcement.refresh(
+            practice, change_type, **context
+        )
+        if (
+            had_announcement
+            and results["announcement"].get("success") is not True
+        ):
+            for blocked in pooled:
+                results[blocked.name] = {"skipped": "blocked_by_announcement"}
+            return results
+        announcement = None
+
+    def refresh_in_worker(surface):
+        if flask_app is None:
+            return _refresh_surface(
+                surface, practice, change_type, context, coalesce_window
+            )
+        from app.models import db
+
+        with flask_app.app_context():
+            worker_practice = db.session.get(Practice, practice_id)
+            if worker_practice is None:
+                return {"success": False, "error": "Practice not found"}
+            return _refresh_surface(
+                surface, worker_practice, change_type, context,
+                coalesce_window,
+            )
+
+    with ThreadPoolExecutor(
+        max_workers=max(len(pooled), 1),
+        thread_name_prefix="practice-refresh",
+    ) as pool:
+        futures = {
+            surface.name: pool.submit(refresh_in_worker, surface)
+            for surface in pooled
+        }
+        if announcement is not None:
+            results["announcement"] = _refresh_surface(
+                announcement, practice, change_type, context, coalesce_window
+            )
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as exc:
+                logger.warning(
+                    "Practice #%s: %s refresh raised: %s",
+                    practice_id, name, exc,
+                )
+                results[name] = {"success": False, "error": str(exc)}
+
+    return {
+        surface.name: results[surface.name]
+        for surface in PRACTICE_SURFACES
+        if surface.name in results
+    }
+
+
 def _log_refresh_results(practice, change_type, results):
     """Surface skipped/failed refreshes instead of letting them pass silently.
 
@@ -203,11 +354,19 @@ def _log_refresh_results(practice, change_type, results):
         logger.info(
             "Practice #%s (%s): refresh ok (%s)",
             practice.id, change_type,
-            {n: (r.get('skipped') or 'updated') if isinstance(r, dict) else r
-             for n, r in results.items()},
+            {n: _refresh_outcome(r) for n, r in results.items()},
         )
 
 
+def _refresh_outcome(result):
+    """Short log label for one surface's refresh result."""
+    if not isinstance(result, dict):
+        return result
+    if result.get('queued'):
+        return 'queued'
+    return result.get('skipped') or 'updated'
+
+
 def _refresh_announcement(
     practice,
     change_type,
@@ -317,6 +476,7 @@ def _refresh_coach_summary_for_week(value, *, exclude_practice_id=None):
     try:
         from app.models import AppConfig
         from app.practices.service import (
+            PRACTICE_INFO_LOADER,
             coach_visible_practices,
             convert_practice_to_info,
         )
@@ -336,7 +496,7 @@ def _refresh_coach_summary_for_week(value, *, exclude_practice_id=None):
         # match what post_coach_weekly_summary() originally rendered — otherwise
         # publishing one practice would silently drop the week's other drafts
         # out of the post when it gets rebuilt.
-        week_query = coach_visible_practices().filter(
+        week_query = coach_visible_practices(PRACTICE_INFO_LOADER).filter(
             Practice.date >= week_start,
             Practice.date < week_end,
         )
@@ -373,6 +533,14 @@ def _refresh_coach_summary_for_week(value, *, exclude_practice_id=None):
                 if channel and channel not in channels_to_try:
                     channels_to_try.append(channel)
 
+        fallback = f"Coach Review: Week of {week_start.strftime('%B %-d')}"
+        if record.channel_id and render_unchanged(
+            record,
+            "render_hash",
+            render_hash(resolved_channel, record.message_ts, blocks, fallback),
+        ):
+            return {'success': True, 'skipped': 'unchanged'}
+
         client = get_slack_client()
         for channel in channels_to_try:
             try:
@@ -380,15 +548,17 @@ def _refresh_coach_summary_for_week(value, *, exclude_practice_id=None):
                     channel=channel,
                     ts=record.message_ts,
                     blocks=blocks,
-                    text=(
-                        "Coach Review: Week of "
-                        f"{week_start.strftime('%B %-d')}"
-                    ),
+                    text=fallback,
                 )
             except Exception:
                 continue
             if record.channel_id is None:
                 _persist_summary_channel(record, channel)
+            remember_render(
+                record,
+                "render_hash",
+                render_hash(channel, record.message_ts, blocks, fallback),
+            )
             return {'success': True}
 
         return {'success': False, 'error': 'Could not update in any channel'}
@@ -406,7 +576,11 @@ def _refresh_weekly_summary_for_week(value, *, exclude_practice_id=None):
     try:
         from app.integrations.weather import get_weather_for_location
         from app.practices.interfaces import PracticeStatus
-        from app.practices.service import convert_practice_to_info, published_practices
+        from app.practices.service import (
+            PRACTICE_INFO_LOADER,
+            convert_practice_to_info,
+            published_practices,
+        )
         from app.slack.blocks import (
             build_weekly_summary_blocks,
             build_weekly_summary_fallback_text,
@@ -418,7 +592,7 @@ def _refresh_weekly_summary_for_week(value, *, exclude_practice_id=None):
             return {"skipped": "absent"}
 
         week_start, week_end = _week_bounds(value)
-        week_query = published_practices().filter(
+        week_query = published_practices(PRACTICE_INFO_LOADER).filter(
             Practice.date >= week_start,
             Practice.date < week_end,
             Practice.status.in_([
@@ -484,6 +658,10 @@ def _refresh_weekly_summary_for_week(value, *, exclude_practice_id=None):
                 'error': 'Announcement channel is not configured',
             }
 
+        digest = render_hash(channel_id, record.message_ts, blocks, fallback)
+        if record.channel_id and render_unchanged(record, "render_hash", digest):
+            return {'success': True, 'skipped': 'unchanged'}
+
         client = get_slack_client()
         client.chat_update(
             channel=channel_id,
@@ -493,6 +671,7 @@ def _refresh_weekly_summary_for_week(value, *, exclude_practice_id=None):
         )
         if record.channel_id is None:
             _persist_summary_channel(record, channel_id)
+        remember_render(record, "render_hash", digest)
         return {'success': True}
     except Exception as exc:
         logger.warning(
@@ -521,6 +700,24 @@ def refresh_registered_practice_summaries(
     }
 
 
+_WEEK_SUMMARY_REFRESHERS = {
+    "coach_summary": _refresh_coach_summary_for_week,
+    "weekly_summary": _refresh_weekly_summary_for_week,
+}
+
+
+def _queue_week_summary_refresh(surface_name, value, window_seconds):
+    """Coalesce a week summary rebuild with others for the same week."""
+    week_start = week_start_date(value)
+    refresh_fn = _WEEK_SUMMARY_REFRESHERS[surface_name]
+    future = refresh_queue.submit(
+        (surface_name, week_start),
+        lambda: refresh_fn(week_start),
+        window_seconds,
+    )
+    return {"queued": True, "future": future}
+
+
 def _refresh_coach_summary(
     practice,
     change_type,
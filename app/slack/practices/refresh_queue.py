@@ -0,0 +1,131 @@
+"""Debounced, coalescing queue for practice Slack surface rebuilds.
+
+The weekly Coach summary and public summary are rebuilt from the database for
+a whole week, so a coach editing three practices in a minute would otherwise
+rebuild and chat_update the same post three times. Submitting those rebuilds
+here keys them by (surface, week start): every submission for a key inside
+the window joins one pending job, and the job runs once when the window
+closes, reading whatever the database holds at that moment. Going-count
+refreshes use the same queue keyed by practice, so a reaction storm on a
+fresh announcement costs one chat_update per window instead of one per
+reaction.
+
+Callers get a concurrent.futures.Future for the rebuild's result dict. Tests
+(and anything that must observe Slack state synchronously) call flush(),
+which runs every pending job immediately on the calling thread.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+# Seconds a summary rebuild waits for further edits before it runs. Zero (the
+# default) disables coalescing so every refresh stays synchronous.
+COALESCE_WINDOW_ENV = "PRACTICE_REFRESH_COALESCE_SECONDS"
+
+
+def coalesce_window_seconds() -> float:
+    """Configured coalescing window; 0 when unset or invalid."""
+    raw = os.environ.get(COALESCE_WINDOW_ENV, "")
+    try:
+        return max(float(raw), 0.0) if raw else 0.0
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", COALESCE_WINDOW_ENV, raw)
+        return 0.0
+
+
+class _PendingRefresh:
+    """One queued rebuild and every submission coalesced into it."""
+
+    def __init__(self, fn, flask_app, timer):
+        self.fn = fn
+        self.flask_app = flask_app
+        self.timer = timer
+        self.future = Future()
+        self.submissions = 1
+
+
+class RefreshQueue:
+    """Run at most one rebuild per key per coalescing window."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict[tuple, _PendingRefresh] = {}
+
+    def submit(self, key: tuple, fn, window_seconds: float) -> Future:
+        """Queue fn() under key, joining an already pending job for the key.
+
+        fn takes no arguments and must re-read its inputs when it runs, so the
+        latest submission's callable replaces the earlier one.
+        """
+        flask_app = (
+            current_app._get_current_object() if has_app_context() else None
+        )
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                pending.fn = fn
+                pending.submissions += 1
+                return pending.future
+
+            timer = threading.Timer(window_seconds, self._run_key, args=(key,))
+            timer.daemon = True
+            pending = _PendingRefresh(fn, flask_app, timer)
+            self._pending[key] = pending
+
+        timer.start()
+        return pending.future
+
+    def pending_keys(self) -> list[tuple]:
+        with self._lock:
+            return list(self._pending)
+
+    def flush(self) -> dict[tuple, dict]:
+        """Run every pending job now, on this thread, and return the results."""
+        with self._lock:
+            drained = self._pending
+            self._pending = {}
+        results = {}
+        for key, pending in drained.items():
+            pending.timer.cancel()
+            self._execute(key, pending, push_context=False)
+            results[key] = (
+                pending.future.result()
+                if pending.future.exception() is None
+                else {"success": False, "error": str(pending.future.exception())}
+            )
+        return results
+
+    def _run_key(self, key):
+        with self._lock:
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            self._execute(key, pending, push_context=True)
+
+    @staticmethod
+    def _execute(key, pending, *, push_context):
+        if pending.submissions > 1:
+            logger.info(
+                "Coalesced %s refresh requests for %s into one rebuild",
+                pending.submissions,
+                key,
+            )
+        try:
+            if push_context and pending.flask_app is not None:
+                with pending.flask_app.app_context():
+                    result = pending.fn()
+            else:
+                result = pending.fn()
+        except Exception as exc:
+            logger.exception("Queued refresh for %s failed", key)
+            pending.future.set_exception(exc)
+        else:
+            pending.future.set_result(result)
+
+
+refresh_queue = RefreshQueue()
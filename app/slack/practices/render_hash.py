@@ -0,0 +1,83 @@
+"""Skip chat_update calls that would not change a Slack message.
+
+chat.update is a tier-3 method and most refreshes re-render a message that
+looks exactly like what is already posted (an RSVP reaction does not change
+the Coach summary, a workout edit does not change the collab post). Each
+surface stores a sha256 of the channel, ts, blocks and fallback text it last
+posted successfully, on Practice or PracticeSummaryPost, and skips the call
+when the next render hashes the same.
+
+Every writer of a hashed message must call remember_render() after a
+successful update (or repost), otherwise a later render matching an older
+hash would be wrongly skipped. The channel and ts are part of the hash, so a
+reposted message never matches its predecessor's digest.
+"""
+
+import hashlib
+import json
+import logging
+
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import db
+
+logger = logging.getLogger(__name__)
+
+# A caller that still holds an uncommitted write on the same row must not
+# leave the hash write waiting on it forever.
+_LOCK_TIMEOUT = "2s"
+
+
+def render_hash(channel, ts, blocks, text) -> str:
+    """Stable digest of one rendered Slack message."""
+    payload = json.dumps(
+        [channel, ts, blocks or [], text or ""],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_unchanged(record, field, digest) -> bool:
+    """Whether record already holds digest as its last posted render."""
+    return getattr(record, field, None) == digest
+
+
+def remember_render(record, field, digest) -> None:
+    """Persist digest without committing (or flushing) the caller's session.
+
+    Best-effort: a record that is not a persisted model (test doubles, legacy
+    summary mirrors) or a failed write just means the next refresh posts.
+    """
+    if not isinstance(record, db.Model) or getattr(record, "id", None) is None:
+        return
+    if getattr(record, field, None) == digest:
+        return
+
+    model = type(record)
+    values = {field: digest}
+    if "updated_at" in model.__table__.c:
+        # Not an edit: keep onupdate from stamping the row as modified.
+        values["updated_at"] = model.__table__.c.updated_at
+    try:
+        with db.engine.begin() as connection:
+            if connection.dialect.name == "postgresql":
+                connection.exec_driver_sql(
+                    f"SET LOCAL lock_timeout = '{_LOCK_TIMEOUT}'"
+                )
+            connection.execute(
+                update(model)
+                .where(model.id == record.id)
+                .values(values)
+            )
+        set_committed_value(record, field, digest)
+    except Exception as exc:
+        logger.warning(
+            "Could not store %s for %s #%s: %s",
+            field,
+            model.__name__,
+            record.id,
+            exc,
+        )
@@ -8,6 +8,7 @@ from app.slack.client import get_slack_client
 from app.practices.models import Practice
 
 from app.slack.practices._config import LOGGING_CHANNEL_ID
+from app.slack.practices.render_hash import remember_render, render_hash
 
 
 def post_thread_reply(
@@ -210,20 +211,34 @@ def update_practice_rsvp_counts(practice: Practice) -> dict:
         if going_context_idx is None:
             return {'success': True, 'skipped': 'no_legacy_count_block'}
 
+        going_text = f":white_check_mark: *{going_count} going* — _see thread for list_"
+        existing_texts = [
+            el.get('text') for el in current_blocks[going_context_idx].get('elements', [])
+        ]
+        if existing_texts == [going_text]:
+            return {'success': True, 'skipped': 'unchanged'}
+
         current_blocks[going_context_idx] = {
             "type": "context",
             "elements": [{
                 "type": "mrkdwn",
-                "text": f":white_check_mark: *{going_count} going* — _see thread for list_"
+                "text": going_text
             }]
         }
 
         # Update message
+        fallback = messages[0].get('text') or 'Practice details unavailable'
         client.chat_update(
             channel=practice.slack_channel_id,
             ts=practice.slack_message_ts,
             blocks=current_blocks,
-            text=messages[0].get('text') or 'Practice details unavailable'
+            text=fallback
+        )
+        remember_render(
+            practice,
+            "slack_message_render_hash",
+            render_hash(practice.slack_channel_id, practice.slack_message_ts,
+                        current_blocks, fallback),
         )
 
         current_app.logger.info(f"Updated going count for practice #{practice.id}: {going_count}")
@@ -235,6 +250,37 @@ def update_practice_rsvp_counts(practice: Practice) -> dict:
         return {'success': False, 'error': error_msg}
 
 
+# Reaction storms after an announcement goes out would otherwise re-render the
+# same message once per reaction; all RSVPs inside this window share one update.
+RSVP_COUNT_REFRESH_SECONDS = 2.0
+
+
+def schedule_rsvp_count_refresh(
+    practice_id: int,
+    window_seconds: float = RSVP_COUNT_REFRESH_SECONDS,
+):
+    """Mark a practice's going count dirty and return the pending refresh.
+
+    Every call for the same practice inside the window joins one queued
+    update_practice_rsvp_counts() run, which reloads the practice in its own
+    app context so it counts every RSVP committed by then. Returns the
+    refresh's Future; callers do not wait on it.
+    """
+    from app.slack.practices.refresh_queue import refresh_queue
+
+    def refresh():
+        from app.models import db
+
+        practice = db.session.get(Practice, practice_id)
+        if practice is None:
+            return {'success': False, 'error': 'Practice not found'}
+        return update_practice_rsvp_counts(practice)
+
+    return refresh_queue.submit(
+        ("rsvp_counts", practice_id), refresh, window_seconds
+    )
+
+
 def log_rsvp_action(practice: Practice, slack_user_id: str, action: str) -> dict:
     """Log an RSVP action to the practice's logging thread.
 
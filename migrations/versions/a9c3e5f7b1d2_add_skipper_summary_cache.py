@@ -0,0 +1,41 @@
+"""add skipper_summary_cache
+
+Revision ID: a9c3e5f7b1d2
+Revises: 539ad532aeb3
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c3e5f7b1d2'
+down_revision = '539ad532aeb3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'skipper_summary_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=40), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.String(length=20), nullable=False),
+        sa.Column('model', sa.String(length=80), nullable=False),
+        sa.Column('practice_id', sa.Integer(), nullable=True),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('input_tokens', sa.Integer(), nullable=True),
+        sa.Column('output_tokens', sa.Integer(), nullable=True),
+        sa.Column('latency_ms', sa.Integer(), nullable=True),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_hit_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'fingerprint', name='uq_skipper_summary_cache_kind_fingerprint'),
+    )
+
+
+def downgrade():
+    op.drop_table('skipper_summary_cache')
@@ -0,0 +1,34 @@
+"""add slack render hashes to practices and summary posts
+
+Revision ID: c7d2e4f6a8b0
+Revises: a9c3e5f7b1d2
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2e4f6a8b0'
+down_revision = 'a9c3e5f7b1d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('practices', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('slack_message_render_hash', sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column('slack_collab_render_hash', sa.String(length=64), nullable=True))
+
+    with op.batch_alter_table('practice_summary_posts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('render_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('practice_summary_posts', schema=None) as batch_op:
+        batch_op.drop_column('render_hash')
+
+    with op.batch_alter_table('practices', schema=None) as batch_op:
+        batch_op.drop_column('slack_collab_render_hash')
+        batch_op.drop_column('slack_message_render_hash')
@@ -0,0 +1,46 @@
+"""add indexes for slack-keyed lookups and case-insensitive email
+
+Revision ID: d3f5a7c9e1b4
+Revises: c7d2e4f6a8b0
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3f5a7c9e1b4'
+down_revision = 'c7d2e4f6a8b0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_practices_slack_channel_message',
+        'practices',
+        ['slack_channel_id', 'slack_message_ts'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_lead_availability_polls_channel_message_status',
+        'lead_availability_polls',
+        ['channel_id', 'message_ts', 'status'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_email_lower', table_name='users')
+    op.drop_index(
+        'ix_lead_availability_polls_channel_message_status',
+        table_name='lead_availability_polls',
+    )
+    op.drop_index('ix_practices_slack_channel_message', table_name='practices')
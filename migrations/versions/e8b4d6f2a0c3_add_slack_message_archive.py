@@ -0,0 +1,60 @@
+"""add slack message archive and per-channel cursors
+
+Revision ID: e8b4d6f2a0c3
+Revises: d3f5a7c9e1b4
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b4d6f2a0c3'
+down_revision = 'd3f5a7c9e1b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'slack_message_archive',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('channel_id', sa.String(length=50), nullable=False),
+        sa.Column('channel_name', sa.String(length=255), nullable=True),
+        sa.Column('message_ts', sa.String(length=50), nullable=False),
+        sa.Column('thread_ts', sa.String(length=50), nullable=True),
+        sa.Column('user_id', sa.String(length=50), nullable=True),
+        sa.Column('user_name', sa.String(length=255), nullable=True),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('permalink', sa.String(length=500), nullable=True),
+        sa.Column('reaction_count', sa.Integer(), nullable=False),
+        sa.Column('reply_count', sa.Integer(), nullable=False),
+        sa.Column('visibility', sa.String(length=50), nullable=False),
+        sa.Column('posted_at', sa.DateTime(), nullable=True),
+        sa.Column('first_seen_at', sa.DateTime(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('channel_id', 'message_ts', name='uq_slack_message_archive_channel_ts'),
+    )
+    op.create_index(
+        'ix_slack_message_archive_posted_at',
+        'slack_message_archive',
+        ['posted_at'],
+        unique=False,
+    )
+    op.create_table(
+        'slack_channel_cursors',
+        sa.Column('channel_id', sa.String(length=50), nullable=False),
+        sa.Column('channel_name', sa.String(length=255), nullable=True),
+        sa.Column('covered_from', sa.DateTime(), nullable=False),
+        sa.Column('collected_through', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('channel_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('slack_channel_cursors')
+    op.drop_index('ix_slack_message_archive_posted_at', table_name='slack_message_archive')
+    op.drop_table('slack_message_archive')
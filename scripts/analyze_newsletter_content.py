@@ -7,9 +7,9 @@ Usage:
     1. Make sure ./scripts/dev.sh is running (or PostgreSQL is accessible)
     2. Run: python scripts/analyze_newsletter_content.py
 
-This uses the existing newsletter collector utilities to scrape Slack,
-then sends the content to Claude Opus 4.5 with extended thinking for
-deep analysis. The goal is to identify what categories would resonate
+This reads Slack through the newsletter message archive (backfilling it
+from Slack on the first run), then sends the content to Claude Opus 4.5
+with extended thinking for deep analysis. The goal is to identify what categories would resonate
 most with the community based on what they're actually talking about -
 keeping the newsletter human-driven.
 
@@ -53,7 +53,8 @@ def collect_slack_content(days: int = 90) -> list[dict]:
     Returns:
         List of message dicts with relevant fields.
     """
-    from app.newsletter.collector import collect_all_messages, clear_caches
+    from app.newsletter.archive import collect_archived_messages
+    from app.newsletter.collector import clear_caches
 
     clear_caches()
     since = datetime.now() - timedelta(days=days)
@@ -62,7 +63,7 @@ def collect_slack_content(days: int = 90) -> list[dict]:
     print(f"   Looking back to: {since.strftime('%Y-%m-%d %H:%M')}")
 
     with app.app_context():
-        messages = collect_all_messages(since)
+        messages = collect_archived_messages(since)
 
     print(f"✅ Collected {len(messages)} messages")
 
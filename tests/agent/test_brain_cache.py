@@ -0,0 +1,95 @@
+"""Skipper LLM output cache: identical prompts reuse the stored text."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.agent import brain
+from app.practices.interfaces import PracticeEvaluation, ThresholdViolation
+from app.practices.models import SkipperSummaryCache
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=f"  Summary #{self.calls}  ")],
+            usage=SimpleNamespace(input_tokens=120, output_tokens=40),
+        )
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://")
+    SkipperSummaryCache.__table__.create(engine)
+    monkeypatch.setattr(brain, "db", SimpleNamespace(engine=engine))
+    monkeypatch.setattr(brain, "ANTHROPIC_AVAILABLE", True)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(brain, "get_anthropic_client", lambda: client)
+    return client
+
+
+def evaluation(practice_id=7, *, is_go=True, violations=()):
+    return PracticeEvaluation(
+        practice_id=practice_id,
+        evaluated_at=datetime(2026, 1, 10, 7),
+        is_go=is_go,
+        violations=list(violations),
+    )
+
+
+def test_identical_evaluation_is_served_from_cache(engine, client):
+    first = brain.generate_evaluation_summary(evaluation())
+    second = brain.generate_evaluation_summary(evaluation())
+
+    assert first == second == "Summary #1"
+    assert client.calls == 1
+    with Session(engine) as session:
+        entry = session.query(SkipperSummaryCache).one()
+        assert entry.kind == "evaluation_summary"
+        assert entry.prompt_version == brain.EVALUATION_SUMMARY_PROMPT_VERSION
+        assert (entry.input_tokens, entry.output_tokens) == (120, 40)
+        assert entry.latency_ms is not None
+        assert entry.hit_count == 1
+
+
+def test_changed_conditions_miss_the_cache(engine, client):
+    brain.generate_evaluation_summary(evaluation())
+    no_go = evaluation(is_go=False, violations=[ThresholdViolation(
+        threshold_name="min_temperature",
+        threshold_value=-10.0,
+        actual_value=-20.0,
+        severity="critical",
+        message="Too cold",
+    )])
+
+    assert brain.generate_evaluation_summary(no_go) == "Summary #2"
+    assert client.calls == 2
+
+
+def test_prompt_version_is_part_of_the_fingerprint(engine, client, monkeypatch):
+    brain.generate_evaluation_summary(evaluation())
+    monkeypatch.setattr(brain, "EVALUATION_SUMMARY_PROMPT_VERSION", "v2")
+
+    assert brain.generate_evaluation_summary(evaluation()) == "Summary #2"
+
+
+def test_unavailable_cache_store_still_calls_the_api(client, monkeypatch):
+    monkeypatch.setattr(brain, "ANTHROPIC_AVAILABLE", True)
+    monkeypatch.setattr(brain, "db", SimpleNamespace(engine=create_engine("sqlite://")))
+
+    assert brain.generate_evaluation_summary(evaluation()) == "Summary #1"
+    assert brain.generate_evaluation_summary(evaluation()) == "Summary #2"
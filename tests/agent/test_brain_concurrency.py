@@ -0,0 +1,66 @@
+"""Concurrent summary generation with a deadline fallback."""
+
+import threading
+import time
+from datetime import datetime
+
+from app.agent import brain
+from app.practices.interfaces import PracticeEvaluation
+
+
+def evaluation(practice_id):
+    return PracticeEvaluation(
+        practice_id=practice_id,
+        evaluated_at=datetime(2026, 1, 10, 7),
+        is_go=True,
+    )
+
+
+def test_summaries_run_concurrently_up_to_the_cap(monkeypatch):
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def summarize(ev):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return f"summary {ev.practice_id}"
+
+    monkeypatch.setattr(brain, "generate_evaluation_summary", summarize)
+
+    summaries = brain.generate_evaluation_summaries(
+        [evaluation(i) for i in range(1, 6)], max_concurrency=3, deadline_seconds=5
+    )
+
+    assert summaries == {i: f"summary {i}" for i in range(1, 6)}
+    assert peak == 3
+
+
+def test_call_missing_the_deadline_gets_fallback_text(monkeypatch):
+    release = threading.Event()
+
+    def summarize(ev):
+        if ev.practice_id == 2:
+            release.wait(5)
+        return f"summary {ev.practice_id}"
+
+    monkeypatch.setattr(brain, "generate_evaluation_summary", summarize)
+
+    try:
+        summaries = brain.generate_evaluation_summaries(
+            [evaluation(1), evaluation(2)], max_concurrency=2, deadline_seconds=0.2
+        )
+    finally:
+        release.set()
+
+    assert summaries[1] == "summary 1"
+    assert summaries[2] == brain._fallback_evaluation_summary(evaluation(2))
+
+
+def test_no_evaluations_makes_no_calls():
+    assert brain.generate_evaluation_summaries([]) == {}
@@ -0,0 +1,120 @@
+"""Batch Skipper evaluation: shared upstream fetches and per-practice results."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.agent import decision_engine as engine
+from app.practices.interfaces import WeatherConditions
+
+
+def practice(practice_id, when, *, name='Theodore Wirth', lat=44.99, lon=-93.32):
+    return SimpleNamespace(
+        id=practice_id,
+        date=when,
+        location=SimpleNamespace(name=name, latitude=lat, longitude=lon),
+        activities=[],
+        leads=[],
+        workout_description=None,
+        is_dark_practice=False,
+    )
+
+
+def weather_at(when):
+    return WeatherConditions(
+        temperature_f=20.0,
+        feels_like_f=15.0,
+        precipitation_chance=0.0,
+        wind_speed_mph=5.0,
+        wind_gust_mph=None,
+        conditions_summary=f'Clear at {when:%H:%M}',
+    )
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = {'grid': [], 'weather': [], 'trails': 0, 'conflicts': 0, 'aqi': [], 'daylight': []}
+
+    def forecast_grid(lat, lon):
+        calls['grid'].append((lat, lon))
+        return ('MPX', 107, 71)
+
+    def forecasts(lat, lon, targets):
+        calls['weather'].append(list(targets))
+        return [weather_at(t) for t in targets]
+
+    def all_trails():
+        calls['trails'] += 1
+        return []
+
+    def all_conflicts():
+        calls['conflicts'] += 1
+        return []
+
+    def aqi_batch(coordinates):
+        calls['aqi'].append(set(coordinates))
+        return {}
+
+    def daylight(lat, lon, date):
+        calls['daylight'].append(date.date())
+        return None
+
+    monkeypatch.setattr(engine, 'load_skipper_config', lambda: {'thresholds': {}})
+    monkeypatch.setattr(engine, 'get_forecast_grid', forecast_grid)
+    monkeypatch.setattr(engine, 'get_weather_forecasts', forecasts)
+    monkeypatch.setattr(engine, 'get_all_trail_conditions', all_trails)
+    monkeypatch.setattr(engine, 'get_trail_conditions', lambda name: None)
+    monkeypatch.setattr(engine, 'get_all_event_conflicts', all_conflicts)
+    monkeypatch.setattr(engine, 'get_event_conflicts', lambda date, name: [])
+    monkeypatch.setattr(engine, 'get_air_quality_batch', aqi_batch)
+    monkeypatch.setattr(engine, 'get_daylight_info', daylight)
+    return calls
+
+
+def test_shared_inputs_are_fetched_once_per_group(upstream):
+    morning = practice(1, datetime(2026, 1, 10, 9))
+    evening = practice(2, datetime(2026, 1, 10, 18))
+
+    batch = engine.evaluate_practices([morning, evening], skip_lead_check=True)
+
+    assert upstream['weather'] == [[morning.date, evening.date]]
+    assert upstream['trails'] == 1
+    assert upstream['conflicts'] == 1
+    assert upstream['aqi'] == [{(44.99, -93.32)}]
+    assert upstream['daylight'] == [morning.date.date()]
+    assert batch.get(1).weather.conditions_summary == 'Clear at 09:00'
+    assert batch.get(2).weather.conditions_summary == 'Clear at 18:00'
+
+
+def test_timings_cover_each_stage(upstream):
+    batch = engine.evaluate_practices([practice(1, datetime(2026, 1, 10, 9))], skip_lead_check=True)
+
+    assert {'forecast_grid', 'weather', 'trail_conditions', 'event_conflicts',
+            'air_quality', 'fetch', 'thresholds', 'total'} <= set(batch.timings)
+
+
+def test_failed_weather_fetch_still_evaluates_practice(upstream, monkeypatch):
+    def boom(lat, lon, targets):
+        raise RuntimeError('nws down')
+
+    monkeypatch.setattr(engine, 'get_weather_forecasts', boom)
+
+    batch = engine.evaluate_practices([practice(1, datetime(2026, 1, 10, 9))], skip_lead_check=True)
+
+    evaluation = batch.get(1)
+    assert evaluation.weather is None
+    assert evaluation.is_go is True
+
+
+def test_per_practice_error_is_reraised_from_get(upstream, monkeypatch):
+    broken = practice(2, datetime(2026, 1, 10, 18))
+    broken.leads = None  # any(...) over None raises during evaluation
+
+    batch = engine.evaluate_practices(
+        [practice(1, datetime(2026, 1, 10, 9)), broken], skip_lead_check=True
+    )
+
+    assert batch.get(1).is_go is True
+    with pytest.raises(TypeError):
+        batch.get(2)
@@ -28,6 +28,10 @@ class FakeQuery:
         self.order_columns = columns
         return self
 
+    def options(self, *loader_options):
+        self.loader_options = loader_options
+        return self
+
     def all(self):
         return self.practices
 
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from app.integrations import air_quality
+from app.integrations.air_quality import AirQualityInfo
+
+
+WIRTH = (44.9917, -93.3236)
+HYLAND = (44.8311, -93.3717)
+DULUTH = (46.7867, -92.1005)
+
+
+def _reading(aqi, area):
+    return AirQualityInfo(
+        aqi=aqi,
+        category='Good',
+        pollutant='PM2.5',
+        reporting_area=area,
+        date_observed=datetime.utcnow(),
+    )
+
+
+def _patch_fetch(monkeypatch):
+    calls = []
+
+    def fetch(lat, lon, api_key):
+        calls.append((lat, lon))
+        return _reading(40 if lat < 46 else 20, 'Metro' if lat < 46 else 'Duluth')
+
+    monkeypatch.setenv('AIRNOW_API_KEY', 'test')
+    monkeypatch.setattr(air_quality, '_fetch_air_quality', fetch)
+    air_quality.clear_cache()
+    return calls
+
+
+def test_batch_fetches_once_per_reporting_area(monkeypatch):
+    calls = _patch_fetch(monkeypatch)
+
+    readings = air_quality.get_air_quality_batch([WIRTH, HYLAND, DULUTH, WIRTH])
+
+    assert calls == [WIRTH, DULUTH]
+    assert readings[HYLAND] is readings[WIRTH]
+    assert readings[DULUTH].reporting_area == 'Duluth'
+
+
+def test_batch_warms_single_location_cache(monkeypatch):
+    calls = _patch_fetch(monkeypatch)
+
+    air_quality.get_air_quality_batch([WIRTH, HYLAND])
+    reading = air_quality.get_air_quality(*HYLAND)
+
+    assert reading.reporting_area == 'Metro'
+    assert calls == [WIRTH]
+
+
+def test_batch_without_api_key_returns_none_per_location(monkeypatch):
+    calls = _patch_fetch(monkeypatch)
+    monkeypatch.delenv('AIRNOW_API_KEY')
+
+    assert air_quality.get_air_quality_batch([WIRTH]) == {WIRTH: None}
+    assert calls == []
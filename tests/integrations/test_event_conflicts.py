@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from app.integrations import event_conflicts
+from app.practices.interfaces import EventConflict
+
+
+def _race(name, when, location=None):
+    return EventConflict(name=name, event_type='race', date=when, location=location, source='SkinnySkI')
+
+
+def _seed(monkeypatch, races):
+    monkeypatch.setattr(event_conflicts, '_scrape_skinnyski_races', lambda: races)
+    event_conflicts.clear_cache()
+
+
+def test_lookup_matches_same_day_and_fuzzy_location(monkeypatch):
+    _seed(monkeypatch, [
+        _race('Loppet', datetime(2026, 2, 1, 9), 'Theodore Wirth Park'),
+        _race('Mystery Race', datetime(2026, 2, 1, 10)),
+        _race('Elm Creek Sprint', datetime(2026, 2, 1, 11), 'Elm Creek'),
+        _race('Next Day', datetime(2026, 2, 2, 9), 'Theodore Wirth Park'),
+    ])
+
+    names = [c.name for c in event_conflicts.get_event_conflicts(datetime(2026, 2, 1, 18), 'Wirth')]
+
+    assert names == ['Loppet', 'Mystery Race']
+
+
+def test_window_lookup_is_inclusive_and_date_sorted(monkeypatch):
+    _seed(monkeypatch, [
+        _race('Late', datetime(2026, 2, 8, 9)),
+        _race('Early', datetime(2026, 1, 31, 9)),
+        _race('Mid', datetime(2026, 2, 4, 9)),
+        _race('Start', datetime(2026, 2, 1, 9)),
+    ])
+
+    conflicts = event_conflicts.get_event_conflicts_between(datetime(2026, 2, 1), datetime(2026, 2, 7, 23))
+
+    assert [c.name for c in conflicts] == ['Start', 'Mid']
+
+
+def test_index_is_built_once_per_cache_fill(monkeypatch):
+    calls = []
+
+    def scrape():
+        calls.append(1)
+        return [_race('Loppet', datetime(2026, 2, 1, 9), 'Wirth')]
+
+    monkeypatch.setattr(event_conflicts, '_scrape_skinnyski_races', scrape)
+    event_conflicts.clear_cache()
+
+    event_conflicts.get_event_conflicts(datetime(2026, 2, 1), 'Wirth')
+    event_conflicts.get_event_conflicts(datetime(2026, 2, 2), 'Wirth')
+
+    assert len(calls) == 1
@@ -0,0 +1,116 @@
+"""Tests for concurrent AI section drafting in generate_all_ai_sections()."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from app.models import db
+from app.newsletter import monthly_generator
+from app.newsletter.interfaces import SectionStatus, SectionType
+from app.newsletter.models import NewsletterSection
+
+NEWSLETTER = SimpleNamespace(id=7, month_year='2099-01', period_start=None, period_end=None)
+
+
+@pytest.fixture
+def sections_db():
+    """An in-memory database holding only the newsletter_sections table."""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[NewsletterSection.__table__])
+        yield
+        db.session.remove()
+
+
+def _usage(input_tokens):
+    return {
+        'input_tokens': input_tokens,
+        'output_tokens': 10,
+        'cache_read_tokens': 100,
+        'cache_write_tokens': 0,
+    }
+
+
+@pytest.fixture
+def drafts(monkeypatch):
+    """Fake drafts: the first runs alone, the rest only finish once all are in flight."""
+    first = monthly_generator.AI_DRAFTED_SECTIONS[0]
+    barrier = threading.Barrier(len(monthly_generator.AI_DRAFTED_SECTIONS) - 1, timeout=5)
+    threads = []
+    events = []
+
+    def draft_section(section_type, context_str):
+        threads.append(threading.current_thread().name)
+        events.append(('start', section_type))
+        if section_type != first:
+            barrier.wait()
+        time.sleep(0.05)
+        events.append(('end', section_type))
+        if section_type == SectionType.UPCOMING_EVENTS.value:
+            return {'success': False, 'error': 'overloaded', 'usage': _usage(5)}
+        return {
+            'success': True,
+            'content': f'{section_type} draft',
+            'char_count': 20,
+            'usage': _usage(50),
+        }
+
+    monkeypatch.setattr(monthly_generator, '_draft_section', draft_section)
+    return SimpleNamespace(threads=threads, events=events)
+
+
+def test_sections_are_drafted_concurrently_and_saved_together(sections_db, drafts):
+    existing = NewsletterSection(
+        newsletter_id=NEWSLETTER.id,
+        section_type=SectionType.FROM_THE_BOARD.value,
+        section_order=3,
+        status=SectionStatus.AWAITING_CONTENT.value,
+    )
+    db.session.add(existing)
+    db.session.commit()
+
+    result = monthly_generator.generate_all_ai_sections(NEWSLETTER, {}, max_concurrency=3)
+
+    assert all(name.startswith('section-draft') for name in drafts.threads)
+    # The first draft warms the prompt cache before the others start.
+    first = monthly_generator.AI_DRAFTED_SECTIONS[0]
+    assert drafts.events[:2] == [('start', first), ('end', first)]
+    assert [s['section_type'] for s in result['sections']] == monthly_generator.AI_DRAFTED_SECTIONS
+    assert result['success'] is False
+    assert result['errors'] == ['upcoming_events: overloaded']
+    assert result['usage']['input_tokens'] == 50 * 3 + 5
+    assert result['usage']['cache_read_tokens'] == 400
+    assert all(s['latency_ms'] >= 50 for s in result['sections'])
+
+    rows = {
+        row.section_type: row
+        for row in NewsletterSection.query.filter_by(newsletter_id=NEWSLETTER.id)
+    }
+    assert set(rows) == {
+        SectionType.FROM_THE_BOARD.value,
+        SectionType.MEMBER_HEADS_UP.value,
+        SectionType.MONTH_IN_REVIEW.value,
+    }
+    assert rows[SectionType.FROM_THE_BOARD.value].id == existing.id
+    assert rows[SectionType.FROM_THE_BOARD.value].status == SectionStatus.HAS_AI_DRAFT.value
+    board = result['sections'][0]
+    assert board['section_id'] == existing.id
+
+
+def test_failed_commit_marks_every_saved_section_failed(sections_db, drafts, monkeypatch):
+    def fail_commit():
+        raise RuntimeError('database unavailable')
+
+    monkeypatch.setattr(db.session, 'commit', fail_commit)
+
+    result = monthly_generator.generate_all_ai_sections(NEWSLETTER, {}, max_concurrency=3)
+
+    assert result['success'] is False
+    assert not any(s['success'] for s in result['sections'])
+    assert 'Failed to save AI drafts: database unavailable' in result['errors']
+    assert NewsletterSection.query.count() == 0
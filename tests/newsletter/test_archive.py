@@ -0,0 +1,242 @@
+"""Tests for the incremental Slack message archive."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from app.models import db
+from app.newsletter import archive
+from app.newsletter.collector import ChannelBatch
+from app.newsletter.interfaces import MessageVisibility, SlackMessage
+from app.newsletter.models import SlackChannelCursor, SlackMessageArchive
+
+WEEK_START = datetime(2099, 1, 5)
+
+
+@pytest.fixture
+def archive_db():
+    """An in-memory database holding only the two archive tables."""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        tables = [SlackMessageArchive.__table__, SlackChannelCursor.__table__]
+        db.metadata.create_all(db.engine, tables=tables)
+        yield
+        db.session.remove()
+
+
+def _message(ts, posted_at, reactions=0, replies=0, thread_ts=None, channel_id='C1'):
+    return SlackMessage(
+        channel_id=channel_id,
+        channel_name='general',
+        message_ts=ts,
+        user_id='U1',
+        user_name='Tester',
+        text=f'message {ts}',
+        permalink=f'https://example.invalid/{ts}',
+        reaction_count=reactions,
+        reply_count=replies,
+        visibility=MessageVisibility.PUBLIC,
+        posted_at=posted_at,
+        thread_ts=thread_ts,
+    )
+
+
+@pytest.fixture
+def slack(monkeypatch):
+    """Fake Slack: records each requested lower bound, returns `messages`.
+
+    `fetched` lists the threads whose replies the fake collector fetched.
+    """
+    state = {
+        'messages': [],
+        'fetched': (),
+        'private': False,
+        'requested': [],
+        'now': datetime(2099, 1, 7, 8, 0),
+    }
+
+    def collect_channels(targets, since_for, known_reply_counts=None):
+        since = since_for('C1')
+        state['requested'].append(since)
+        state['known'] = known_reply_counts
+        return [ChannelBatch(
+            'general', 'C1', state['private'], since,
+            [m for m in state['messages'] if m.posted_at >= since], True,
+            fetched_threads=tuple(state['fetched']),
+        )]
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return state['now']
+
+    monkeypatch.setattr(archive, 'channel_targets', lambda: [('general', False, 'C1')])
+    monkeypatch.setattr(archive, 'collect_channels', collect_channels)
+    monkeypatch.setattr(archive, 'datetime', FakeDatetime)
+    return state
+
+
+def test_first_sync_backfills_then_later_syncs_fetch_only_recent(archive_db, slack):
+    slack['now'] = datetime(2099, 1, 9, 8, 0)
+    slack['messages'] = [
+        _message('1', datetime(2099, 1, 5, 9)),
+        _message('2', datetime(2099, 1, 6, 9)),
+    ]
+
+    first = archive.collect_archived_messages(WEEK_START)
+
+    slack['now'] = datetime(2099, 1, 10, 8, 0)
+    slack['messages'] = [
+        _message('1', datetime(2099, 1, 5, 9)),
+        _message('2', datetime(2099, 1, 6, 9)),
+        _message('3', datetime(2099, 1, 9, 20), reactions=4),
+    ]
+    second = archive.collect_archived_messages(WEEK_START)
+
+    # The second run reaches back only the refresh window before the first.
+    assert slack['requested'] == [
+        WEEK_START,
+        archive._as_local(datetime(2099, 1, 9, 8, 0)) - archive.REFRESH_WINDOW,
+    ]
+    assert [m.message_ts for m in first] == ['2', '1']
+    assert [m.message_ts for m in second] == ['3', '2', '1']
+    assert second[0].reaction_count == 4
+    assert SlackMessageArchive.query.count() == 3
+
+
+def test_recent_messages_get_fresh_engagement_counts(archive_db, slack):
+    slack['messages'] = [_message('1', datetime(2099, 1, 6, 20), reactions=1)]
+    archive.collect_archived_messages(WEEK_START)
+
+    slack['now'] = datetime(2099, 1, 7, 9, 0)
+    slack['messages'] = [_message('1', datetime(2099, 1, 6, 20), reactions=7)]
+    messages = archive.collect_archived_messages(WEEK_START)
+
+    assert [m.reaction_count for m in messages] == [7]
+    assert SlackMessageArchive.query.count() == 1
+
+
+def test_messages_slack_no_longer_returns_are_deleted(archive_db, slack):
+    slack['now'] = datetime(2099, 1, 8, 12, 0)
+    slack['messages'] = [
+        _message('0', datetime(2099, 1, 5, 9)),
+        _message('1', datetime(2099, 1, 7, 10), replies=2),
+        _message('1.1', datetime(2099, 1, 7, 11), thread_ts='1'),
+        _message('1.2', datetime(2099, 1, 7, 12), thread_ts='1'),
+        _message('2', datetime(2099, 1, 7, 13), replies=1),
+        _message('2.1', datetime(2099, 1, 7, 14), thread_ts='2'),
+        _message('3', datetime(2099, 1, 7, 15), replies=1),
+        _message('3.1', datetime(2099, 1, 7, 16), thread_ts='3'),
+    ]
+    slack['fetched'] = ('1', '2', '3')
+    archive.collect_archived_messages(WEEK_START)
+
+    # Reply 1.2 and parent 2 were deleted in Slack; thread 3 was unchanged,
+    # so its replies were not fetched this time. Message 0 is older than the
+    # refresh window, so it is not asked for and stays archived.
+    slack['messages'] = [
+        _message('1', datetime(2099, 1, 7, 10), replies=1),
+        _message('1.1', datetime(2099, 1, 7, 11), thread_ts='1'),
+        _message('3', datetime(2099, 1, 7, 15), replies=1),
+    ]
+    slack['fetched'] = ('1',)
+    messages = archive.collect_archived_messages(WEEK_START)
+
+    assert [m.message_ts for m in messages] == ['3.1', '3', '1.1', '1', '0']
+
+
+def test_only_current_targets_are_read_with_their_current_visibility(archive_db, slack):
+    db.session.add(SlackMessageArchive(
+        channel_id='C-EXCLUDED', message_ts='9', channel_name='random', text='excluded',
+        visibility=MessageVisibility.PUBLIC.value, posted_at=datetime(2099, 1, 6),
+        first_seen_at=datetime(2099, 1, 6), refreshed_at=datetime(2099, 1, 6),
+    ))
+    db.session.commit()
+    slack['messages'] = [_message('1', datetime(2099, 1, 6, 9))]
+    archive.collect_archived_messages(WEEK_START)
+
+    # The channel has since become a private target.
+    slack['private'] = True
+    messages = archive.collect_archived_messages(WEEK_START)
+
+    assert [(m.message_ts, m.visibility, m.permalink) for m in messages] == [
+        ('1', MessageVisibility.PRIVATE, None),
+    ]
+
+
+def test_sync_leaves_the_callers_session_alone(archive_db, slack, monkeypatch):
+    db.session.add(SlackChannelCursor(
+        channel_id='C-PENDING', covered_from=WEEK_START, collected_through=WEEK_START,
+    ))
+    archive.sync_archive(WEEK_START)
+    db.session.rollback()
+
+    assert db.session.get(SlackChannelCursor, 'C-PENDING') is None
+
+    db.session.add(SlackChannelCursor(
+        channel_id='C-PENDING', covered_from=WEEK_START, collected_through=WEEK_START,
+    ))
+    monkeypatch.setattr(archive, 'channel_targets', lambda: 1 / 0)
+    assert archive.collect_archived_messages(WEEK_START) == []
+    db.session.commit()
+
+    assert db.session.get(SlackChannelCursor, 'C-PENDING') is not None
+
+
+def test_request_older_than_coverage_backfills(archive_db, slack):
+    archive.collect_archived_messages(WEEK_START)
+    earlier = WEEK_START - timedelta(days=30)
+
+    archive.collect_archived_messages(earlier)
+
+    assert slack['requested'][-1] == earlier
+    assert db.session.get(SlackChannelCursor, 'C1').covered_from == earlier
+
+
+def test_failed_channel_keeps_its_cursor(archive_db, slack, monkeypatch):
+    slack['messages'] = [_message('1', datetime(2099, 1, 6, 9))]
+    archive.collect_archived_messages(WEEK_START)
+    before = db.session.get(SlackChannelCursor, 'C1').collected_through
+
+    monkeypatch.setattr(archive, 'collect_channels', lambda targets, since_for, **_: [
+        ChannelBatch('general', 'C1', False, since_for('C1'), [], False),
+    ])
+    slack['now'] = datetime(2099, 1, 9)
+    messages = archive.collect_archived_messages(WEEK_START)
+
+    assert db.session.get(SlackChannelCursor, 'C1').collected_through == before
+    assert [m.message_ts for m in messages] == ['1']
+
+
+def test_archived_reply_counts_are_offered_to_the_collector(archive_db, slack):
+    slack['messages'] = [
+        _message('1', datetime(2099, 1, 6, 9), replies=3),
+        _message('2', datetime(2099, 1, 6, 10)),
+    ]
+    archive.collect_archived_messages(WEEK_START)
+
+    archive.collect_archived_messages(WEEK_START)
+
+    assert slack['known'] == {'C1': {'1': 3}}
+
+
+def test_failed_thread_fetch_keeps_the_archived_reply_count(archive_db, slack, monkeypatch):
+    slack['messages'] = [_message('1', datetime(2099, 1, 6, 9), replies=3)]
+    archive.collect_archived_messages(WEEK_START)
+
+    monkeypatch.setattr(archive, 'collect_channels', lambda targets, since_for, **_: [
+        ChannelBatch(
+            'general', 'C1', False, since_for('C1'),
+            [_message('1', datetime(2099, 1, 6, 9), replies=5),
+             _message('2', datetime(2099, 1, 6, 10), replies=2)],
+            True, failed_threads=('1', '2'),
+        ),
+    ])
+    archive.collect_archived_messages(WEEK_START)
+
+    # Counts the replies were not collected for stay behind, so the next
+    # sync sees a change and fetches both threads again.
+    assert archive._known_reply_counts(db.session, WEEK_START) == {'C1': {'1': 3}}
@@ -0,0 +1,282 @@
+"""Tests for concurrent channel collection in the newsletter collector."""
+
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from app.newsletter import collector
+from app.newsletter.interfaces import MessageVisibility, SlackMessage
+
+SINCE = datetime(2099, 1, 1)
+
+
+def _message(channel_id, ts, posted_at):
+    return SlackMessage(
+        channel_id=channel_id,
+        channel_name=channel_id,
+        message_ts=ts,
+        user_id='U1',
+        user_name='Tester',
+        text=f'{channel_id} {ts}',
+        visibility=MessageVisibility.PUBLIC,
+        posted_at=posted_at,
+    )
+
+
+@pytest.fixture
+def channels(monkeypatch):
+    """Three public channels (one excluded) and one private channel."""
+    monkeypatch.setattr(collector, '_load_config', lambda: {
+        'newsletter': {'channels': {
+            'public_exclude': ['random'],
+            'private_include': ['leadership'],
+        }},
+    })
+    monkeypatch.setattr(collector, '_get_all_public_channels', lambda: [
+        {'id': 'C-SLOW', 'name': 'general'},
+        {'id': 'C-RANDOM', 'name': 'random'},
+        {'id': 'C-FAST', 'name': 'trails'},
+    ])
+    monkeypatch.setattr(
+        collector,
+        '_resolve_channel_id',
+        lambda name: 'G-LEAD' if name == 'leadership' else None,
+    )
+
+    tie = datetime(2099, 1, 2, 12, 0)
+    by_channel = {
+        # Every channel has a message at the same instant, so the final order
+        # of those ties depends on the order channels are combined in.
+        'C-SLOW': [_message('C-SLOW', '1', tie)],
+        'C-FAST': [_message('C-FAST', '2', tie), _message('C-FAST', '3', datetime(2099, 1, 3))],
+        'G-LEAD': [_message('G-LEAD', '4', tie)],
+    }
+    calls = []
+
+    def collect(channel_id, since, is_private=False, **_kwargs):
+        calls.append((channel_id, is_private, threading.current_thread().name))
+        if channel_id == 'C-SLOW':
+            time.sleep(0.05)
+        return list(by_channel[channel_id])
+
+    monkeypatch.setattr(collector, 'collect_channel_messages', collect)
+    monkeypatch.setattr(collector, 'load_user_directory', dict)
+    return calls
+
+
+def test_concurrent_collection_matches_serial_order(channels, monkeypatch):
+    monkeypatch.setenv(collector.COLLECT_WORKERS_ENV, '4')
+
+    concurrent = collector.collect_all_messages(SINCE)
+
+    monkeypatch.setenv(collector.COLLECT_WORKERS_ENV, '1')
+    serial = collector.collect_all_messages(SINCE)
+
+    assert [(m.channel_id, m.message_ts) for m in concurrent] == [
+        ('C-FAST', '3'),
+        ('C-SLOW', '1'),
+        ('C-FAST', '2'),
+        ('G-LEAD', '4'),
+    ]
+    assert concurrent == serial
+    assert ('C-RANDOM', False) not in {(c, p) for c, p, _ in channels}
+    assert ('G-LEAD', True) in {(c, p) for c, p, _ in channels}
+    assert all(name.startswith('newsletter-collect') for _, _, name in channels)
+
+
+def test_failed_channel_is_skipped(channels, monkeypatch):
+    def collect(channel_id, since, is_private=False, **_kwargs):
+        if channel_id == 'C-FAST':
+            raise SlackApiError('boom', {'ok': False, 'error': 'internal_error'})
+        return [_message(channel_id, '9', datetime(2099, 1, 2))]
+
+    monkeypatch.setattr(collector, 'collect_channel_messages', collect)
+
+    messages = collector.collect_all_messages(SINCE)
+
+    assert [m.channel_id for m in messages] == ['C-SLOW', 'G-LEAD']
+
+
+def test_rate_limit_pauses_the_pool(monkeypatch):
+    now = [100.0]
+    slept = []
+    monkeypatch.setattr(collector, 'time', SimpleNamespace(
+        monotonic=lambda: now[0],
+        sleep=slept.append,
+    ))
+    gate = collector._RateLimitGate()
+    response = SimpleNamespace(
+        headers={'Retry-After': '12'},
+        get=lambda key, default=None: 'ratelimited' if key == 'error' else default,
+    )
+
+    gate.wait()
+    gate.note(SlackApiError('slow down', response))
+    gate.wait()
+
+    assert slept == [12.0]
+
+
+class FakeClient:
+    """Slack client double for one channel page with a single threaded post."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _record(self, method):
+        self.calls.append(method)
+
+    def auth_test(self):
+        self._record('auth_test')
+        return {'url': 'https://tcsc.slack.com/'}
+
+    def conversations_info(self, channel):
+        self._record('conversations_info')
+        return {'channel': {'name': 'general', 'is_private': False}}
+
+    def users_info(self, user):
+        self._record('users_info')
+        return {'user': {'profile': {'display_name': 'Tester'}}}
+
+    def users_list(self, cursor=None, limit=200):
+        self._record('users_list')
+        if cursor is None:
+            return {
+                'members': [{'id': 'U0', 'profile': {'real_name': 'Someone Else'}}],
+                'response_metadata': {'next_cursor': 'page-2'},
+            }
+        return {'members': [{'id': 'U1', 'profile': {'display_name': 'Directory Name'}}]}
+
+    def conversations_history(self, **params):
+        self._record('conversations_history')
+        return {'messages': [
+            {'user': 'U1', 'ts': '4070908800.000100', 'text': 'parent', 'reply_count': 1},
+        ]}
+
+    def conversations_replies(self, **params):
+        self._record('conversations_replies')
+        return {'messages': [
+            {'user': 'U1', 'ts': '4070908800.000100', 'text': 'parent'},
+            {'user': 'U1', 'ts': '4070908900.000200', 'text': 'reply'},
+        ]}
+
+    def chat_getPermalink(self, **params):
+        raise AssertionError('permalinks must be built locally')
+
+
+def test_permalinks_are_built_without_api_calls(monkeypatch):
+    client = FakeClient()
+    monkeypatch.delenv('SLACK_WORKSPACE_DOMAIN', raising=False)
+    monkeypatch.setattr(collector, 'get_slack_client', lambda: client)
+    collector.clear_caches()
+    try:
+        first = collector.collect_channel_messages('C1', SINCE)
+        collector.collect_channel_messages('C1', SINCE)
+    finally:
+        collector.clear_caches()
+
+    parent, reply = first
+    assert parent.permalink == 'https://tcsc.slack.com/archives/C1/p4070908800000100'
+    assert reply.permalink == (
+        'https://tcsc.slack.com/archives/C1/p4070908900000200'
+        '?thread_ts=4070908800.000100&cid=C1'
+    )
+    assert client.calls.count('auth_test') == 1
+
+
+def test_workspace_domain_env_skips_auth_test(monkeypatch):
+    monkeypatch.setenv('SLACK_WORKSPACE_DOMAIN', 'example')
+    monkeypatch.setattr(collector, 'get_slack_client', lambda: pytest.fail('no API call expected'))
+    collector.clear_caches()
+    try:
+        assert collector.build_message_permalink('C9', '1.000001') == (
+            'https://example.slack.com/archives/C9/p1000001'
+        )
+    finally:
+        collector.clear_caches()
+
+
+def test_run_prefetches_user_names_once(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setenv('SLACK_WORKSPACE_DOMAIN', 'example')
+    monkeypatch.setattr(collector, 'get_slack_client', lambda: client)
+    monkeypatch.setattr(collector, '_get_all_public_channels', lambda: [
+        {'id': 'C1', 'name': 'general'},
+        {'id': 'C2', 'name': 'trails'},
+    ])
+    monkeypatch.setattr(collector, '_load_config', lambda: {})
+    collector.clear_caches()
+    try:
+        messages = collector.collect_all_messages(SINCE)
+    finally:
+        collector.clear_caches()
+
+    assert {m.user_name for m in messages} == {'Directory Name'}
+    assert client.calls.count('users_list') == 2
+    assert 'users_info' not in client.calls
+
+
+@pytest.mark.parametrize(('message', 'known', 'expected'), [
+    # Latest reply predates the window: nothing to fetch.
+    ({'reply_count': 2, 'latest_reply': '4070700000.000000'}, None, False),
+    # Same count as the archive stored last run: already collected.
+    ({'reply_count': 2, 'latest_reply': '4071000000.000000'}, 2, False),
+    # A new reply since the last run.
+    ({'reply_count': 3, 'latest_reply': '4071000000.000000'}, 2, True),
+    # Never archived, or Slack omitted latest_reply.
+    ({'reply_count': 1}, None, True),
+])
+def test_thread_fetch_gating(message, known, expected):
+    assert collector._thread_fetch_needed(message, SINCE, known) is expected
+
+
+def test_unchanged_threads_are_skipped_and_counted(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setenv('SLACK_WORKSPACE_DOMAIN', 'example')
+    monkeypatch.setattr(collector, 'get_slack_client', lambda: client)
+    stats = {}
+    collector.clear_caches()
+    try:
+        messages = collector.collect_channel_messages(
+            'C1', SINCE, known_reply_counts={'4070908800.000100': 1}, thread_stats=stats,
+        )
+    finally:
+        collector.clear_caches()
+
+    assert [m.text for m in messages] == ['parent']
+    assert 'conversations_replies' not in client.calls
+    assert stats == {'skipped': 1, 'fetched': [], 'failed': []}
+
+
+def test_thread_that_fails_mid_pagination_is_retried_then_reported(monkeypatch):
+    client = FakeClient()
+    pages = []
+
+    def conversations_replies(**params):
+        pages.append(params.get('cursor'))
+        if params.get('cursor'):
+            raise SlackApiError('boom', {'ok': False, 'error': 'internal_error'})
+        return {
+            'messages': [{'user': 'U1', 'ts': '4070908900.000200', 'text': 'reply'}],
+            'response_metadata': {'next_cursor': 'page-2'},
+        }
+
+    client.conversations_replies = conversations_replies
+    monkeypatch.setenv('SLACK_WORKSPACE_DOMAIN', 'example')
+    monkeypatch.setattr(collector, 'get_slack_client', lambda: client)
+    monkeypatch.setattr(collector._fetch_thread_pages.retry, 'sleep', lambda seconds: None)
+    stats = {}
+    collector.clear_caches()
+    try:
+        messages = collector.collect_channel_messages('C1', SINCE, thread_stats=stats)
+    finally:
+        collector.clear_caches()
+
+    # Every attempt restarts the thread, and no partial replies are kept.
+    assert pages == [None, 'page-2'] * 3
+    assert [m.text for m in messages] == ['parent']
+    assert stats == {'skipped': 0, 'fetched': [], 'failed': ['4070908800.000100']}
@@ -0,0 +1,155 @@
+"""Tests for ranking, duplicate collapsing and token budgets in the generation context."""
+
+import logging
+from datetime import datetime, timedelta
+
+from app.newsletter.context_budget import ContextBudget, estimate_tokens
+from app.newsletter.generator import build_generation_context
+from app.newsletter.interfaces import (
+    MemberSubmission,
+    MessageVisibility,
+    NewsItem,
+    NewsletterContext,
+    NewsSource,
+    SlackMessage,
+    SubmissionType,
+)
+
+WEEK_START = datetime(2099, 1, 5)
+
+
+def _message(n, text, reactions=0, replies=0, days_in=3, visibility=MessageVisibility.PUBLIC):
+    return SlackMessage(
+        channel_id=f'C{n}',
+        channel_name=f'channel-{n}',
+        message_ts=str(n),
+        user_id='U1',
+        user_name=f'Skier {n}',
+        text=text,
+        reaction_count=reactions,
+        reply_count=replies,
+        visibility=visibility,
+        posted_at=WEEK_START + timedelta(days=days_in),
+    )
+
+
+def _context(**kwargs):
+    return NewsletterContext(week_start=WEEK_START, week_end=WEEK_START + timedelta(days=6), **kwargs)
+
+
+def _budget(**kwargs):
+    budget = ContextBudget()
+    for key, value in kwargs.items():
+        setattr(budget, key, value)
+    return budget
+
+
+def test_top_messages_by_engagement_with_cross_posts_collapsed():
+    messages = [
+        _message(1, 'Quiet note about lost gloves at the trailhead', reactions=0),
+        _message(2, 'Wax clinic Thursday at 7pm in the clubhouse, bring your skis', reactions=9),
+        # Same announcement cross-posted to another channel.
+        _message(3, 'Wax clinic Thursday at 7pm in the clubhouse! bring your skis', reactions=2),
+        _message(4, 'Race results from the Mora Vasaloppet are posted', replies=6),
+        _message(5, 'Older post with a couple of reactions', reactions=1, days_in=0),
+    ]
+    budget = _budget(top_k={'slack_public': 3, 'slack_private': 5})
+
+    text = build_generation_context(_context(slack_messages=messages), budget)
+
+    lines = [line for line in text.splitlines() if line.startswith('- #')]
+    assert [line.split(' |')[0] for line in lines] == ['- #channel-4', '- #channel-2', '- #channel-1']
+    assert 'Total messages collected: 5' in text
+
+
+def test_news_from_two_sources_collapses_to_the_first():
+    items = [
+        NewsItem(NewsSource.SKINNYSKI, 'Loppet trails open for the season this weekend', 'https://a'),
+        NewsItem(NewsSource.LOPPET, 'Loppet trails open for the season this weekend!', 'https://b'),
+    ]
+
+    text = build_generation_context(_context(news_items=items), ContextBudget())
+
+    assert 'https://a' in text
+    assert 'https://b' not in text
+
+
+def test_context_fits_the_ceiling_deterministically(caplog):
+    messages = [
+        _message(n, f'Busy week message number {n} ' + 'powder ' * 40, reactions=n % 7)
+        for n in range(200)
+    ]
+    private = [
+        _message(1000 + n, f'Board discussion {n} ' + 'budget ' * 30, visibility=MessageVisibility.PRIVATE)
+        for n in range(20)
+    ]
+    submissions = [
+        MemberSubmission(
+            id=1, slack_user_id='U9', display_name='Pat', submission_type=SubmissionType.CONTENT,
+            content='A long trip report. ' * 100, permission_to_name=True,
+        ),
+    ]
+    context = _context(
+        slack_messages=messages + private,
+        submissions=submissions,
+        prior_newsletter_content='Last week we skied. ' * 100,
+        admin_feedback='Mention the wax clinic.',
+    )
+    budget = _budget(max_tokens=1500, top_k={'slack_public': 50, 'slack_private': 5})
+
+    with caplog.at_level(logging.INFO, logger='app.newsletter.context_budget'):
+        first = build_generation_context(context, budget)
+    second = build_generation_context(context, budget)
+
+    assert first == second
+    assert estimate_tokens(first) <= 1500
+    # The admin feedback is never trimmed; the submission outranks Slack chatter.
+    assert 'Mention the wax clinic.' in first
+    assert 'A long trip report.' in first
+    assert 'PRIOR NEWSLETTER' not in first
+    assert 'PRIVATE CHANNEL THEMES' not in first
+    assert any('slack_public: kept' in message and 'over top-k' in message
+               for message in caplog.messages)
+    assert any('prior_newsletter: kept 0 of 1' in message for message in caplog.messages)
+
+
+def test_config_overrides_merge_with_defaults():
+    budget = ContextBudget.from_config({'max_tokens': 8000, 'sections': {'news': 100}})
+
+    assert budget.max_tokens == 8000
+    assert budget.section_tokens['news'] == 100
+    assert budget.section_tokens['slack_public'] == 5000
+    assert budget.top_k['slack_public'] == 15
+
+
+def _submission(n, content):
+    return MemberSubmission(
+        id=n, slack_user_id='U9', display_name=f'Member {n}', submission_type=SubmissionType.CONTENT,
+        content=content, permission_to_name=True,
+    )
+
+
+def test_one_long_item_does_not_crowd_out_the_rest():
+    items = [
+        NewsItem(NewsSource.SKINNYSKI, 'Huge preview ' + 'sprint ' * 2000, 'https://long'),
+        NewsItem(NewsSource.LOPPET, 'Trails groomed Friday', 'https://short'),
+    ]
+    submissions = [_submission(1, 'Trip report. ' * 1000), _submission(2, 'Lost a glove at Theo.')]
+
+    text = build_generation_context(_context(news_items=items, submissions=submissions), ContextBudget())
+
+    assert 'https://long' not in text
+    assert 'https://short' in text
+    assert 'Lost a glove at Theo.' in text
+    assert 'Trip report. Trip report.' in text
+    assert text.count('[...]') == 1
+
+
+def test_ceiling_shortens_submissions_but_keeps_each_one():
+    submissions = [_submission(n, f'Submission {n}. ' + 'wax ' * 800) for n in range(4)]
+    budget = _budget(max_tokens=1000)
+
+    text = build_generation_context(_context(submissions=submissions), budget)
+
+    assert estimate_tokens(text) <= 1000
+    assert all(f'Submission {n}.' in text for n in range(4))
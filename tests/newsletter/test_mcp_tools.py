@@ -0,0 +1,124 @@
+"""Tests for concurrent, memoized tool execution in the newsletter agent loop."""
+
+import json
+import threading
+
+import pytest
+from flask import Flask, current_app
+
+from app.newsletter import mcp_server
+
+
+@pytest.fixture
+def tools(monkeypatch):
+    """Gathering tools that only return once all three run at the same time."""
+    barrier = threading.Barrier(3, timeout=5)
+    calls = []
+
+    def gather(name):
+        def handler(**kwargs):
+            calls.append((name, kwargs, current_app.name))
+            barrier.wait()
+            return {"tool": name, **kwargs}
+        return handler
+
+    def write(name, result):
+        def handler(**kwargs):
+            calls.append((name, kwargs, current_app.name))
+            return result
+        return handler
+
+    for name in ("get_member_submissions", "scrape_ski_news", "get_trail_conditions"):
+        monkeypatch.setitem(mcp_server.TOOL_HANDLERS, name, gather(name))
+    monkeypatch.setitem(mcp_server.TOOL_HANDLERS, "save_newsletter_version",
+                        write("save_newsletter_version", {"saved": True}))
+    # Syncs the message archive, so it is treated as a write.
+    monkeypatch.setitem(mcp_server.TOOL_HANDLERS, "collect_slack_messages",
+                        write("collect_slack_messages", {"messages": []}))
+
+    app = Flask("agent-tools")
+    with app.app_context():
+        yield calls
+
+
+def test_gathering_tools_run_concurrently_in_call_order(tools):
+    results = mcp_server.execute_tool_calls([
+        ("save_newsletter_version", {"newsletter_id": 1, "content": "draft"}),
+        ("get_member_submissions", {"newsletter_id": 1}),
+        ("scrape_ski_news", {}),
+        ("get_trail_conditions", {}),
+    ])
+
+    assert [json.loads(r) for r in results] == [
+        {"saved": True},
+        {"tool": "get_member_submissions", "newsletter_id": 1},
+        {"tool": "scrape_ski_news"},
+        {"tool": "get_trail_conditions"},
+    ]
+    # Writes run after the gathering batch, on the calling thread.
+    assert tools[-1][0] == "save_newsletter_version"
+    assert {app_name for _, _, app_name in tools} == {"agent-tools"}
+
+
+def test_repeat_calls_are_memoized_for_the_run(tools):
+    memo = {}
+    first_turn = [
+        ("get_member_submissions", {"newsletter_id": 1}),
+        ("scrape_ski_news", {}),
+        ("get_trail_conditions", {}),
+        # Same call again in the same turn: runs once.
+        ("scrape_ski_news", {}),
+    ]
+
+    first = mcp_server.execute_tool_calls(first_turn, memo)
+    second = mcp_server.execute_tool_calls([
+        ("get_trail_conditions", {}),
+        ("collect_slack_messages", {"since_days_ago": 7}),
+        ("collect_slack_messages", {"since_days_ago": 7}),
+        ("save_newsletter_version", {"newsletter_id": 1, "content": "draft"}),
+        ("save_newsletter_version", {"newsletter_id": 1, "content": "draft"}),
+    ], memo)
+
+    assert first[1] == first[3]
+    assert second[0] == first[2]
+    assert [name for name, _, _ in tools].count("scrape_ski_news") == 1
+    assert [name for name, _, _ in tools].count("get_trail_conditions") == 1
+    # Writes, archive syncs included, are never memoized.
+    assert [name for name, _, _ in tools].count("collect_slack_messages") == 2
+    assert [name for name, _, _ in tools].count("save_newsletter_version") == 2
+
+
+def test_failed_calls_are_not_memoized(monkeypatch):
+    outcomes = {
+        "scrape_ski_news": [RuntimeError("site down"), {"items": []}],
+        "get_trail_conditions": [{"success": False, "error": "timeout"}, {"success": True}],
+    }
+
+    def flaky(name):
+        def handler(**kwargs):
+            outcome = outcomes[name].pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return handler
+
+    for name in outcomes:
+        monkeypatch.setitem(mcp_server.TOOL_HANDLERS, name, flaky(name))
+    memo = {}
+    calls = [("scrape_ski_news", {}), ("get_trail_conditions", {})]
+
+    first = mcp_server.execute_tool_calls(calls, memo)
+    second = mcp_server.execute_tool_calls(calls, memo)
+
+    assert [json.loads(r) for r in first] == [
+        {"error": "site down"},
+        {"success": False, "error": "timeout"},
+    ]
+    assert [json.loads(r) for r in second] == [{"items": []}, {"success": True}]
+    assert len(memo) == 2
+
+
+def test_unknown_tool_still_reports_an_error():
+    assert mcp_server.execute_tool_calls([("no_such_tool", {})]) == [
+        json.dumps({"error": "Unknown tool: no_such_tool"})
+    ]
@@ -0,0 +1,118 @@
+"""Tests for concurrent news scraping with per-source deadlines."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from app.newsletter import news_scraper
+from app.newsletter.interfaces import NewsItem, NewsSource
+
+SINCE = datetime(2099, 1, 1)
+
+
+def _item(source, title, published_at=None):
+    return NewsItem(
+        source=source,
+        title=title,
+        url=f'https://example.com/{title}',
+        published_at=published_at,
+    )
+
+
+@pytest.fixture
+def scrapers(monkeypatch):
+    """Replace the three scrapers; loppet blocks until the test releases it."""
+    release = threading.Event()
+    threads = {}
+
+    def skinnyski(since, max_articles):
+        threads['skinnyski'] = threading.current_thread().name
+        return [_item(NewsSource.SKINNYSKI, 'race-results', datetime(2099, 1, 3))]
+
+    def loppet(since, max_articles):
+        threads['loppet'] = threading.current_thread().name
+        release.wait(5)
+        return [_item(NewsSource.LOPPET, 'fresh-loppet', datetime(2099, 1, 4))]
+
+    def three_rivers(since, max_articles):
+        threads['three_rivers'] = threading.current_thread().name
+        raise RuntimeError('site down')
+
+    monkeypatch.setattr(news_scraper, 'scrape_skinnyski_news', skinnyski)
+    monkeypatch.setattr(news_scraper, 'scrape_loppet_news', loppet)
+    monkeypatch.setattr(news_scraper, 'scrape_three_rivers_news', three_rivers)
+    monkeypatch.setattr(news_scraper, '_load_config', lambda: {'news_sources': {
+        'loppet': {'deadline_seconds': 0.2},
+    }})
+    monkeypatch.setattr(news_scraper, '_cache', {})
+    monkeypatch.setattr(news_scraper, '_last_run_status', {})
+    yield release, threads
+    release.set()
+
+
+def test_slow_source_falls_back_to_stale_cache(scrapers):
+    release, threads = scrapers
+    news_scraper._cache['news_loppet'] = {
+        'data': [_item(NewsSource.LOPPET, 'stale-loppet', datetime(2099, 1, 2))],
+        'cached_at': datetime(2000, 1, 1),
+    }
+
+    started = time.perf_counter()
+    items = news_scraper.scrape_all_news(SINCE)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 2
+    assert [item.title for item in items] == ['race-results', 'stale-loppet']
+    assert all(name.startswith('news-scrape') for name in threads.values())
+
+    sources = {s['name']: s for s in news_scraper.get_scraper_status()['sources']}
+    assert sources['skinnyski']['last_run']['status'] == 'ok'
+    assert sources['skinnyski']['last_run']['items'] == 1
+    assert sources['loppet']['last_run']['status'] == 'timed_out'
+    assert sources['loppet']['last_run']['items'] == 1
+    assert sources['loppet']['deadline_seconds'] == 0.2
+    assert sources['three_rivers']['last_run']['status'] == 'error'
+    assert sources['three_rivers']['last_run']['error'] == 'site down'
+
+
+def test_late_finish_keeps_timeout_and_notes_completion(scrapers):
+    release, _threads = scrapers
+
+    news_scraper.scrape_all_news(SINCE)
+    release.set()
+
+    for _ in range(50):
+        last_run = news_scraper._last_run_status['loppet']
+        if 'finished_late_seconds' in last_run:
+            break
+        time.sleep(0.05)
+
+    assert last_run['status'] == 'timed_out'
+    assert last_run['items'] == 0
+    assert last_run['finished_late_seconds'] >= 0.2
+
+
+def test_sources_run_concurrently(monkeypatch):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def scraper(source):
+        def scrape(since, max_articles):
+            # Only passes once all three scrapers are running at the same time.
+            barrier.wait()
+            return [_item(source, source.value)]
+        return scrape
+
+    monkeypatch.setattr(news_scraper, 'scrape_skinnyski_news', scraper(NewsSource.SKINNYSKI))
+    monkeypatch.setattr(news_scraper, 'scrape_loppet_news', scraper(NewsSource.LOPPET))
+    monkeypatch.setattr(news_scraper, 'scrape_three_rivers_news', scraper(NewsSource.THREE_RIVERS))
+    monkeypatch.setattr(news_scraper, '_load_config', lambda: {})
+    monkeypatch.setattr(news_scraper, '_last_run_status', {})
+
+    items = news_scraper.scrape_all_news(SINCE)
+
+    # Undated items keep source order, as in the serial implementation.
+    assert [item.source for item in items] == [
+        NewsSource.SKINNYSKI, NewsSource.LOPPET, NewsSource.THREE_RIVERS,
+    ]
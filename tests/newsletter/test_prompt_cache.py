@@ -0,0 +1,136 @@
+"""Tests for prompt-cache breakpoints and usage accounting in newsletter calls."""
+
+import copy
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.newsletter import generator, mcp_server, monthly_generator
+from app.newsletter.prompt_cache import (
+    cacheable_tools,
+    mark_conversation_breakpoint,
+    response_usage,
+)
+
+
+def _usage(input_tokens, output_tokens, cache_read=0, cache_write=0):
+    return SimpleNamespace(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_read_input_tokens=cache_read,
+        cache_creation_input_tokens=cache_write,
+    )
+
+
+def _breakpoints(messages):
+    return [
+        (index, block.get('type'))
+        for index, message in enumerate(messages)
+        if isinstance(message['content'], list)
+        for block in message['content']
+        if isinstance(block, dict) and 'cache_control' in block
+    ]
+
+
+def test_cacheable_tools_marks_only_the_last_copy():
+    tools = [{'name': 'a'}, {'name': 'b'}]
+
+    marked = cacheable_tools(tools)
+
+    assert 'cache_control' not in marked[0]
+    assert marked[-1]['cache_control'] == {'type': 'ephemeral'}
+    assert tools == [{'name': 'a'}, {'name': 'b'}]
+
+
+def test_conversation_breakpoint_moves_to_the_latest_user_turn():
+    messages = [{'role': 'user', 'content': 'start'}]
+    mark_conversation_breakpoint(messages)
+    assert _breakpoints(messages) == [(0, 'text')]
+
+    messages.append({'role': 'assistant', 'content': [SimpleNamespace(type='tool_use')]})
+    messages.append({'role': 'user', 'content': [
+        {'type': 'tool_result', 'tool_use_id': '1', 'content': '{}'},
+        {'type': 'tool_result', 'tool_use_id': '2', 'content': '{}'},
+    ]})
+    mark_conversation_breakpoint(messages)
+
+    assert _breakpoints(messages) == [(2, 'tool_result')]
+    assert 'cache_control' not in messages[2]['content'][0]
+
+
+def test_usage_ignores_missing_cache_fields():
+    response = SimpleNamespace(usage=SimpleNamespace(input_tokens=10, output_tokens=5))
+
+    assert response_usage(response) == {
+        'input_tokens': 10,
+        'output_tokens': 5,
+        'cache_read_tokens': 0,
+        'cache_write_tokens': 0,
+    }
+
+
+class FakeClient:
+    """Records each request as sent and replays canned responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.messages = self
+
+    def create(self, **params):
+        self.requests.append(copy.deepcopy(params))
+        return self.responses.pop(0)
+
+
+def test_agent_caches_tools_system_and_conversation(monkeypatch):
+    tool_turn = SimpleNamespace(
+        stop_reason='tool_use',
+        content=[SimpleNamespace(type='tool_use', id='t1', name='get_trail_conditions', input={})],
+        usage=_usage(100, 20, cache_write=3000),
+    )
+    final_turn = SimpleNamespace(
+        stop_reason='end_turn',
+        content=[SimpleNamespace(type='text', text='newsletter body')],
+        usage=_usage(50, 400, cache_read=3100),
+    )
+    client = FakeClient([tool_turn, final_turn])
+    monkeypatch.setattr(mcp_server, 'get_anthropic_client', lambda: client)
+    monkeypatch.setattr(mcp_server, 'execute_tool', lambda name, args: '{"ok": true}')
+    monkeypatch.setattr(generator, 'get_newsletter_prompt', lambda name: 'SYSTEM PROMPT')
+    newsletter = SimpleNamespace(
+        id=1,
+        week_start=datetime(2099, 1, 5),
+        week_end=datetime(2099, 1, 11),
+        current_version=1,
+    )
+
+    result = mcp_server.run_newsletter_agent(newsletter)
+
+    assert result.success
+    assert result.tokens_used == 100 + 20 + 3000 + 50 + 400 + 3100
+    assert (result.cache_read_tokens, result.cache_write_tokens) == (3100, 3000)
+
+    first, second = client.requests
+    assert first['system'][0]['cache_control'] == {'type': 'ephemeral'}
+    assert first['tools'][-1]['cache_control'] == {'type': 'ephemeral'}
+    assert _breakpoints(first['messages']) == [(0, 'text')]
+    assert _breakpoints(second['messages']) == [(2, 'tool_result')]
+
+
+def test_section_drafts_share_a_cached_system_prompt(monkeypatch):
+    response = SimpleNamespace(
+        content=[SimpleNamespace(text='{"section_type": "member_heads_up", "content": "Wax night"}')],
+        usage=_usage(200, 30, cache_read=2500),
+    )
+    client = FakeClient([response, response])
+    monkeypatch.setattr(monthly_generator, '_get_anthropic_client', lambda: client)
+    monkeypatch.setattr(monthly_generator, '_load_monthly_prompt', lambda: 'MONTHLY PROMPT')
+    newsletter = SimpleNamespace(month_year='2099-01', period_start=None, period_end=None)
+
+    first = monthly_generator.generate_section_draft(newsletter, 'member_heads_up', {})
+    monthly_generator.generate_section_draft(newsletter, 'upcoming_events', {})
+
+    assert first['usage']['cache_read_tokens'] == 2500
+    systems = [request['system'] for request in client.requests]
+    assert systems[0] == systems[1]
+    assert systems[0][0]['text'] == 'MONTHLY PROMPT'
+    assert all('MONTHLY PROMPT' not in request['messages'][0]['content'] for request in client.requests)
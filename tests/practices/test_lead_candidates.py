@@ -188,6 +188,43 @@ def test_least_loaded_available_lead_comes_first(db_session):
         _cleanup(users=[busy_id, fresh_id], practices=[practice_id] + other_ids, polls=[poll_id])
 
 
+def test_led_in_block_covers_whole_first_and_last_days(db_session):
+    """The block is compared against datetimes in SQL: a late practice on
+    ends_on still counts, while one a minute either side of the block does not.
+    """
+    practice = _practice(4)
+    poll = _open_poll(practice)
+    user = _lead_user("Edges")
+    _available(poll, practice, user)
+
+    when = (
+        datetime(2099, 7, 31, 23, 59),
+        datetime(2099, 8, 1, 0, 0),
+        datetime(2099, 8, 31, 23, 59),
+        datetime(2099, 9, 1, 0, 0),
+    )
+    others = []
+    for moment in when:
+        other = Practice(date=moment, day_of_week="Tuesday", leads_needed=2)
+        db_session.add(other)
+        db_session.flush()
+        db_session.add(PracticeLead(practice_id=other.id, user_id=user.id, role="lead"))
+        others.append(other)
+    db_session.commit()
+
+    practice_id, poll_id, user_id = practice.id, poll.id, user.id
+    other_ids = [o.id for o in others]
+
+    try:
+        rows = lead_candidates(practice)
+        by_id = {r["user_id"]: r for r in rows}
+        assert by_id[user_id]["led_in_block"] == 2
+        # Only 7/31 and 8/1 fall on or before the 8/4 anchor.
+        assert by_id[user_id]["led_last_90d"] == 2
+    finally:
+        _cleanup(users=[user_id], practices=[practice_id] + other_ids, polls=[poll_id])
+
+
 def test_assist_rows_are_not_counted_as_load(db_session):
     practice = _practice(4)
     poll = _open_poll(practice)
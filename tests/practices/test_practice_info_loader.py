@@ -0,0 +1,138 @@
+"""PRACTICE_INFO_LOADER keeps convert_practice_to_info() off the lazy-load path.
+
+Year 2099 dates and "TEST " names per tests/practices/conftest.py. Queries are
+scoped to the ids this module creates, so real practices in the dev database
+never change the statement count.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import SlackUser, User, db
+from app.practices.models import (
+    Practice,
+    PracticeActivity,
+    PracticeLead,
+    PracticeLocation,
+    PracticeType,
+)
+from app.practices.service import (
+    PRACTICE_INFO_LOADER,
+    coach_visible_practices,
+    convert_practice_to_info,
+    published_practices,
+)
+
+# Reserved for this module: no other suite uses October 2099 at 05:47.
+_WEEK_START = datetime(2099, 10, 5, 5, 47)
+
+
+@contextmanager
+def _count_statements():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+
+def _seed_week(count):
+    unique = uuid.uuid4().hex[:8]
+    location = PracticeLocation(name=f"TEST Loader Wirth {unique}")
+    activity = PracticeActivity(name=f"TEST Loader Classic {unique}")
+    practice_type = PracticeType(name=f"TEST Loader Intervals {unique}")
+    db.session.add_all([location, activity, practice_type])
+    db.session.flush()
+
+    practices, users, slack_users = [], [], []
+    for offset in range(count):
+        slack_user = SlackUser(slack_uid=f"UTESTLOADER{unique}{offset}")
+        user = User(first_name="TEST Loader", last_name=f"Lead {offset}",
+                    email=f"test-loader-{unique}-{offset}@example.invalid",
+                    slack_user=slack_user)
+        when = _WEEK_START + timedelta(days=offset)
+        practice = Practice(date=when, day_of_week=when.strftime("%A"),
+                            location_id=location.id, is_draft=False,
+                            logistics_notes="TEST practice info loader")
+        practice.activities = [activity]
+        practice.practice_types = [practice_type]
+        db.session.add_all([slack_user, user, practice])
+        db.session.flush()
+        db.session.add(PracticeLead(practice_id=practice.id, user_id=user.id, role="lead"))
+        practices.append(practice.id)
+        users.append(user.id)
+        slack_users.append(slack_user.id)
+    db.session.commit()
+    return {
+        "practices": practices,
+        "users": users,
+        "slack_users": slack_users,
+        "other_rows": [(type(row), row.id) for row in (location, activity, practice_type)],
+    }
+
+
+def _cleanup(created):
+    db.session.rollback()
+    for practice_id in created.get("practices", []):
+        stored = db.session.get(Practice, practice_id)
+        if stored is not None:
+            db.session.delete(stored)
+    db.session.flush()
+    for user_id in created.get("users", []):
+        stored = db.session.get(User, user_id)
+        if stored is not None:
+            db.session.delete(stored)
+    db.session.flush()
+    for slack_user_id in created.get("slack_users", []):
+        stored = db.session.get(SlackUser, slack_user_id)
+        if stored is not None:
+            db.session.delete(stored)
+    for model, row_id in created.get("other_rows", []):
+        stored = db.session.get(model, row_id)
+        if stored is not None:
+            db.session.delete(stored)
+    db.session.commit()
+
+
+def _convert_statement_count(query_factory, practice_ids):
+    db.session.expire_all()
+    with _count_statements() as statements:
+        practices = query_factory(PRACTICE_INFO_LOADER).filter(
+            Practice.id.in_(practice_ids)
+        ).order_by(Practice.date).all()
+        infos = [convert_practice_to_info(practice) for practice in practices]
+    assert len(infos) == len(practice_ids)
+    assert all(info.leads and info.leads[0].slack_user_id for info in infos)
+    return len(statements)
+
+
+def test_converting_a_week_costs_a_constant_number_of_statements(db_session):
+    small, week = {}, {}
+    try:
+        small = _seed_week(2)
+        week = _seed_week(7)
+
+        for query_factory in (published_practices, coach_visible_practices):
+            small_count = _convert_statement_count(query_factory, small["practices"])
+            week_count = _convert_statement_count(query_factory, week["practices"])
+            assert week_count == small_count, (
+                f"{query_factory.__name__}: {week_count} statements for 7 practices "
+                f"vs {small_count} for 2 — a relationship is lazy-loading per row"
+            )
+    finally:
+        _cleanup(week)
+        _cleanup(small)
+
+
+def test_unknown_loader_profile_is_rejected():
+    with pytest.raises(ValueError, match="everything"):
+        published_practices("everything")
@@ -0,0 +1,162 @@
+"""Query-plan regression suite for the Slack-keyed hot lookups.
+
+Each test seeds enough rows that a sequential scan would be a real cost,
+ANALYZEs, and EXPLAINs the exact lookup the app issues. Any Seq Scan on a
+table above SEQ_SCAN_ROW_THRESHOLD fails the test: it means a supporting
+index was dropped or a query stopped matching it.
+
+Everything runs inside one transaction on a dedicated connection that is
+rolled back in `finally`, so no seeded row (2099 dates, "TEST " names) and
+no statistics change outlives the test -- see tests/practices/conftest.py.
+"""
+
+from datetime import date, datetime, timedelta
+import uuid
+
+import pytest
+from sqlalchemy import func, select, text
+
+from app.models import User, db
+from app.practices.availability_models import LeadAvailabilityPoll, PollStatus
+from app.practices.models import Practice, PracticeRSVP
+
+SEQ_SCAN_ROW_THRESHOLD = 1000
+SEED_ROWS = 3000
+_BASE_DATE = datetime(2099, 3, 2, 5, 13)
+
+
+@pytest.fixture
+def seeded(db_session):
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection, _seed(connection)
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+def _seed(connection):
+    unique = uuid.uuid4().hex[:8]
+    channel = f"CTESTPLAN{unique}"
+
+    connection.execute(Practice.__table__.insert(), [
+        {
+            "date": _BASE_DATE + timedelta(hours=i),
+            "day_of_week": "Monday",
+            "slack_channel_id": channel,
+            "slack_message_ts": f"4070908800.{i:06d}",
+            "logistics_notes": "TEST query plan seed",
+        }
+        for i in range(SEED_ROWS)
+    ])
+    connection.execute(LeadAvailabilityPoll.__table__.insert(), [
+        {
+            "starts_on": date(2099, 3, 2),
+            "ends_on": date(2099, 3, 29),
+            "status": PollStatus.CLOSED,
+            "channel_id": channel,
+            "message_ts": f"4070908800.{i:06d}",
+        }
+        for i in range(SEED_ROWS)
+    ])
+    connection.execute(User.__table__.insert(), [
+        {
+            "first_name": "TEST Plan",
+            "last_name": f"Member {i}",
+            "email": f"Test-Plan-{unique}-{i}@Example.invalid",
+        }
+        for i in range(SEED_ROWS)
+    ])
+
+    practice_ids = connection.execute(
+        select(Practice.id).where(Practice.slack_channel_id == channel)
+    ).scalars().all()
+    user_ids = connection.execute(
+        select(User.id).where(User.email.like(f"Test-Plan-{unique}-%"))
+    ).scalars().all()
+    connection.execute(PracticeRSVP.__table__.insert(), [
+        {"practice_id": practice_id, "user_id": user_id, "status": "going"}
+        for practice_id, user_id in zip(practice_ids, user_ids)
+    ])
+
+    for table in ("practices", "lead_availability_polls", "users", "practice_rsvps"):
+        connection.exec_driver_sql(f"ANALYZE {table}")
+
+    return {
+        "channel": channel,
+        "message_ts": "4070908800.001234",
+        "practice_id": practice_ids[1234],
+        "user_id": user_ids[1234],
+        "email": f"test-plan-{unique}-1234@example.invalid",
+    }
+
+
+def _plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _assert_no_large_seq_scan(connection, statement):
+    sql = str(statement.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    ))
+    plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    root = plan[0]["Plan"]
+
+    offenders = []
+    for node in _plan_nodes(root):
+        if node["Node Type"] != "Seq Scan":
+            continue
+        table = node["Relation Name"]
+        rows = connection.exec_driver_sql(
+            f"SELECT reltuples FROM pg_class WHERE relname = '{table}'"
+        ).scalar_one()
+        if rows > SEQ_SCAN_ROW_THRESHOLD:
+            offenders.append(f"{table} (~{int(rows)} rows)")
+
+    assert not offenders, (
+        f"Sequential scan on {', '.join(offenders)} for:\n{sql}\nplan: {root}"
+    )
+
+
+def test_announcement_sibling_lookup_uses_index(seeded):
+    connection, seed = seeded
+    _assert_no_large_seq_scan(connection, (
+        select(Practice.id)
+        .where(
+            Practice.slack_channel_id == seed["channel"],
+            Practice.slack_message_ts == seed["message_ts"],
+        )
+        .order_by(Practice.date, Practice.id)
+    ))
+
+
+def test_open_poll_lookup_uses_index(seeded):
+    connection, seed = seeded
+    _assert_no_large_seq_scan(connection, (
+        select(LeadAvailabilityPoll.id).where(
+            LeadAvailabilityPoll.channel_id == seed["channel"],
+            LeadAvailabilityPoll.message_ts == seed["message_ts"],
+            LeadAvailabilityPoll.status == PollStatus.OPEN,
+        )
+    ))
+
+
+def test_rsvp_lookup_uses_index(seeded):
+    connection, seed = seeded
+    _assert_no_large_seq_scan(connection, (
+        select(PracticeRSVP.id).where(
+            PracticeRSVP.practice_id == seed["practice_id"],
+            PracticeRSVP.user_id == seed["user_id"],
+        )
+    ))
+
+
+def test_case_insensitive_email_lookup_uses_index(seeded):
+    connection, seed = seeded
+    _assert_no_large_seq_scan(connection, (
+        select(User.id).where(func.lower(User.email) == seed["email"])
+    ))
@@ -12,12 +12,24 @@ LOCAL DEVELOPMENT DATABASE, not a throwaway test database, so
 ``db.create_all()``/``db.drop_all()`` are forbidden here -- the schema
 already exists. Callers are responsible for their own cleanup (year-2099
 dates, a "TEST"-prefixed marker, and a try/finally that rolls back first).
+
+Practice modal reference lists are cached per process, so every test starts
+with an empty cache rather than seeing rows a previous test created and
+deleted.
 """
 
 import pytest
 
 from app import create_app
 from app.models import db
+from app.slack.modal_cache import invalidate_modal_reference_data
+
+
+@pytest.fixture(autouse=True)
+def _fresh_modal_reference_cache():
+    invalidate_modal_reference_data()
+    yield
+    invalidate_modal_reference_data()
 
 
 @pytest.fixture
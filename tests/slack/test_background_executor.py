@@ -0,0 +1,72 @@
+"""Bounded post-ack worker pool shared by modal post-save work and lazy listeners."""
+
+import threading
+
+from flask import Flask, current_app
+
+from app.slack.background import PostAckExecutor
+
+
+def test_tasks_run_in_the_bound_app_context():
+    flask_app = Flask(__name__)
+    executor = PostAckExecutor(max_workers=1, queue_limit=4)
+    executor.bind_flask_app(flask_app)
+    try:
+        future = executor.submit(lambda: current_app.name)
+        assert future.result(timeout=5) == flask_app.name
+    finally:
+        executor.shutdown()
+
+
+def test_full_queue_runs_on_the_caller_thread():
+    executor = PostAckExecutor(max_workers=1, queue_limit=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+        return threading.current_thread().name
+
+    try:
+        busy = executor.submit(block)
+        assert started.wait(5)
+        queued = executor.submit(block)
+        overflow = executor.submit(threading.current_thread)
+
+        assert overflow.done()
+        assert overflow.result() is threading.current_thread()
+        release.set()
+        assert busy.result(timeout=5).startswith("slack-post-ack")
+        assert queued.result(timeout=5).startswith("slack-post-ack")
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats["ran_inline"] == 1
+    assert stats["completed"] == 3
+    assert stats["queued"] == stats["active"] == 0
+    assert stats["max_queue_depth"] == 1
+
+
+def test_failures_are_counted_and_surface_on_the_future():
+    executor = PostAckExecutor(max_workers=1, queue_limit=2)
+
+    def boom():
+        raise RuntimeError("slack down")
+
+    try:
+        future = executor.submit(boom)
+        assert isinstance(future.exception(timeout=5), RuntimeError)
+    finally:
+        executor.shutdown()
+
+    assert executor.stats()["failed"] == 1
+
+
+def test_no_threads_until_first_submit():
+    executor = PostAckExecutor(max_workers=2, queue_limit=2)
+
+    assert executor._pool is None
+    executor.shutdown()
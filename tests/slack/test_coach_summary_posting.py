@@ -25,6 +25,9 @@ class FakeQuery:
     def order_by(self, *_columns):
         return self
 
+    def options(self, *_loader_options):
+        return self
+
     def all(self):
         return self.rows
 
@@ -0,0 +1,128 @@
+"""In-memory index that lets unrelated reactions skip the database."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.practices.models import Practice
+from app.slack.practices import message_index
+from app.slack.practices.reactions import handle_attendance_reaction
+
+NOW = 1_900_000_000.0
+OLD_TS = f"{NOW - 86400:.6f}"
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    message_index.invalidate_message_index()
+    message_index.invalidate_user_map()
+    monkeypatch.setattr(message_index, "time", SimpleNamespace(time=lambda: NOW))
+    yield
+    message_index.invalidate_message_index()
+    message_index.invalidate_user_map()
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return frozenset({("C-ANN", OLD_TS)})
+
+    monkeypatch.setattr(message_index, "_load_index", load)
+    return calls
+
+
+def test_old_unrelated_message_is_not_a_candidate(loads):
+    assert message_index.is_candidate_message("C-ANN", OLD_TS) is True
+    assert message_index.is_candidate_message("C-OTHER", OLD_TS) is False
+    assert message_index.is_candidate_message("C-ANN", "1.0") is False
+    assert len(loads) == 1
+
+
+def test_messages_newer_than_snapshot_fall_through(loads):
+    assert message_index.is_candidate_message("C-NEW", f"{NOW - 5:.6f}") is True
+    assert message_index.is_candidate_message("C-NEW", "not-a-ts") is True
+
+
+def test_snapshot_expires_and_reloads(loads, monkeypatch):
+    message_index.is_candidate_message("C-OTHER", OLD_TS)
+    later = NOW + message_index.INDEX_TTL_SECONDS + 1
+    monkeypatch.setattr(message_index, "time", SimpleNamespace(time=lambda: later))
+    message_index.is_candidate_message("C-OTHER", OLD_TS)
+
+    assert len(loads) == 2
+
+
+def test_announcement_link_invalidates_snapshot(loads):
+    message_index.is_candidate_message("C-OTHER", OLD_TS)
+
+    Practice(slack_channel_id="C-OTHER", slack_message_ts=OLD_TS)
+    message_index.is_candidate_message("C-OTHER", OLD_TS)
+
+    assert len(loads) == 2
+
+
+def test_failed_load_treats_every_message_as_candidate(monkeypatch):
+    def boom():
+        raise RuntimeError("no database")
+
+    monkeypatch.setattr(message_index, "_load_index", boom)
+
+    assert message_index.is_candidate_message("C-OTHER", OLD_TS) is True
+
+
+def test_unrelated_reaction_returns_without_queries(loads, monkeypatch):
+    def fail(*_args, **_kwargs):
+        raise AssertionError("database touched")
+
+    monkeypatch.setattr(
+        "app.slack.practices.availability_reactions.handle_availability_reaction",
+        fail,
+    )
+
+    result = handle_attendance_reaction(
+        channel="C-OTHER",
+        message_ts=OLD_TS,
+        reaction="white_check_mark",
+        slack_user_id="U1",
+    )
+
+    assert result == {"success": True, "ignored": "message_not_linked"}
+
+
+class FakeQuery:
+    def __init__(self, row, calls):
+        self.row = row
+        self.calls = calls
+
+    def join(self, *_args):
+        return self
+
+    def filter(self, *_args):
+        return self
+
+    def first(self):
+        self.calls.append(1)
+        return self.row
+
+
+def test_user_map_caches_linked_users_only(monkeypatch):
+    calls = []
+    rows = {"U-LINKED": (42,), "U-UNLINKED": None}
+    current = {}
+
+    def query(*_args):
+        return FakeQuery(rows[current["uid"]], calls)
+
+    monkeypatch.setattr(
+        message_index, "db", SimpleNamespace(session=SimpleNamespace(query=query))
+    )
+
+    for uid in ("U-LINKED", "U-LINKED", "U-UNLINKED", "U-UNLINKED"):
+        current["uid"] = uid
+        message_index.user_id_for_slack_uid(uid)
+
+    assert message_index.user_id_for_slack_uid("U-LINKED") == 42
+    assert len(calls) == 3
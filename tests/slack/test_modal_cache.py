@@ -0,0 +1,76 @@
+"""Practice modal reference lists are cached until an admin edit invalidates them."""
+
+from types import SimpleNamespace
+
+from app.slack import bolt_app as bolt_module
+from app.slack import modal_cache
+
+
+def _counting_loader(value):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return value
+
+    return load, calls
+
+
+def test_repeat_reads_share_one_load():
+    load, calls = _counting_loader(("locations",))
+
+    assert modal_cache.cached_reference_data("ref", load) == ("locations",)
+    assert modal_cache.cached_reference_data("ref", load) == ("locations",)
+    assert len(calls) == 1
+
+
+def test_invalidation_forces_a_reload():
+    load, calls = _counting_loader(("locations",))
+    modal_cache.cached_reference_data("ref", load)
+
+    modal_cache.invalidate_modal_reference_data()
+    modal_cache.cached_reference_data("ref", load)
+
+    assert len(calls) == 2
+
+
+def test_load_racing_an_invalidation_is_not_reused():
+    calls = []
+
+    def load():
+        calls.append(1)
+        if len(calls) == 1:
+            # An admin edit commits while the first load is in flight.
+            modal_cache.invalidate_modal_reference_data()
+        return len(calls)
+
+    assert modal_cache.cached_reference_data("ref", load) == 1
+    assert modal_cache.cached_reference_data("ref", load) == 2
+    assert modal_cache.cached_reference_data("ref", load) == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    load, calls = _counting_loader(("locations",))
+    now = [1000.0]
+    monkeypatch.setattr(modal_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    modal_cache.cached_reference_data("ref", load)
+    now[0] += modal_cache.CACHE_TTL_SECONDS + 1
+    modal_cache.cached_reference_data("ref", load)
+
+    assert len(calls) == 2
+
+
+def test_modal_loaders_hand_out_fresh_lists(monkeypatch):
+    load, calls = _counting_loader(
+        (((1, "Theodore Wirth"),), ((2, "Classic"),), ())
+    )
+    monkeypatch.setattr(bolt_module, "_query_modal_ref_data", load)
+
+    locations, _activities, _types = bolt_module._load_modal_ref_data()
+    locations.append((9, "Scratch"))
+
+    assert bolt_module._load_modal_ref_data() == (
+        [(1, "Theodore Wirth")], [(2, "Classic")], [],
+    )
+    assert len(calls) == 1
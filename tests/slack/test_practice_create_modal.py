@@ -432,12 +432,12 @@ def test_create_authoritative_form_lookup_outage_is_retryable_before_mutation(
     add = MagicMock()
     flush = MagicMock()
     commit = MagicMock()
-    thread = MagicMock()
+    executor = MagicMock()
     monkeypatch.setattr(db.session, "rollback", rollback)
     monkeypatch.setattr(db.session, "add", add)
     monkeypatch.setattr(db.session, "flush", flush)
     monkeypatch.setattr(db.session, "commit", commit)
-    monkeypatch.setattr(bolt_module.threading, "Thread", thread)
+    monkeypatch.setattr(bolt_module, "post_ack_executor", executor)
     ack = MagicMock()
     logger = MagicMock()
     before = Practice.query.count()
@@ -461,7 +461,7 @@ def test_create_authoritative_form_lookup_outage_is_retryable_before_mutation(
     add.assert_not_called()
     flush.assert_not_called()
     commit.assert_not_called()
-    thread.assert_not_called()
+    executor.submit.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -753,8 +753,8 @@ def test_create_submission_rejects_blocked_or_tampered_selector_transition(
     )
     modal["state"] = {"values": _view_values(modal)}
     ack = MagicMock()
-    thread = MagicMock()
-    monkeypatch.setattr(bolt_module.threading, "Thread", thread)
+    executor = MagicMock()
+    monkeypatch.setattr(bolt_module, "post_ack_executor", executor)
     before = Practice.query.count()
     add = MagicMock()
     flush = MagicMock()
@@ -777,7 +777,7 @@ def test_create_submission_rejects_blocked_or_tampered_selector_transition(
     add.assert_not_called()
     flush.assert_not_called()
     commit.assert_not_called()
-    thread.assert_not_called()
+    executor.submit.assert_not_called()
 
 
 def test_initial_blocking_error_uses_authoritative_selector_attribution(
@@ -853,7 +853,7 @@ def test_create_submission_counts_duplicate_selector_ids_once(
     create_view["state"]["values"]["activities_block"]["activity_ids"][
         "selected_options"
     ] = [{"value": str(activity.id)}, {"value": str(activity.id)}]
-    monkeypatch.setattr(bolt_module.threading, "Thread", MagicMock())
+    monkeypatch.setattr(bolt_module, "post_ack_executor", MagicMock())
     ack = MagicMock()
 
     bolt_module._handle_practice_create_submission(
@@ -930,8 +930,8 @@ def test_create_submission_accepts_legitimately_omitted_empty_selectors(
         "load_selected_plan_reaction_sources",
         lambda session, **_ids: load_sources(session),
     )
-    thread = MagicMock()
-    monkeypatch.setattr(bolt_module.threading, "Thread", thread)
+    executor = MagicMock()
+    monkeypatch.setattr(bolt_module, "post_ack_executor", executor)
     ack = MagicMock()
 
     bolt_module._handle_practice_create_submission(
@@ -1079,8 +1079,8 @@ def test_create_submission_persists_validated_structured_state(
     values["practice_reaction_row_r0"][
         "practice_reaction_description"
     ]["value"] = "Edited shorter-route label"
-    thread = MagicMock()
-    monkeypatch.setattr(bolt_module.threading, "Thread", thread)
+    executor = MagicMock()
+    monkeypatch.setattr(bolt_module, "post_ack_executor", executor)
     ack = MagicMock()
 
     bolt_module._handle_practice_create_submission(
@@ -1102,15 +1102,15 @@ def test_create_submission_persists_validated_structured_state(
     }]
     assert {item.id for item in practice.activities} == {activity.id}
     assert {item.id for item in practice.practice_types} == {practice_type.id}
-    assert thread.call_args.args == ()
-    worker_args = thread.call_args.kwargs["args"]
+    executor.submit.assert_called_once()
+    worker, *worker_args = executor.submit.call_args.args
+    assert worker is bolt_module._post_practice_create_updates
     assert worker_args[1] == practice.id
-    assert worker_args[2:] == (
+    assert tuple(worker_args[2:]) == (
         "C-CREATE-TEST",
         "U-CREATE-TEST",
         ":white_check_mark: Created practice for Tuesday, July 21 at 6:15 PM",
     )
-    thread.return_value.start.assert_called_once_with()
 
 
 def test_create_post_save_worker_reloads_row_and_refreshes_before_confirmation(
@@ -1118,7 +1118,7 @@ def test_create_post_save_worker_reloads_row_and_refreshes_before_confirmation(
     create_view,
     monkeypatch,
 ):
-    monkeypatch.setattr(bolt_module.threading, "Thread", MagicMock())
+    monkeypatch.setattr(bolt_module, "post_ack_executor", MagicMock())
     bolt_module._handle_practice_create_submission(
         MagicMock(),
         CREATE_BODY,
@@ -1174,7 +1174,7 @@ def test_create_post_save_worker_logs_refresh_failure_and_still_confirms(
     create_view,
     monkeypatch,
 ):
-    monkeypatch.setattr(bolt_module.threading, "Thread", MagicMock())
+    monkeypatch.setattr(bolt_module, "post_ack_executor", MagicMock())
     bolt_module._handle_practice_create_submission(
         MagicMock(),
         CREATE_BODY,
@@ -1219,7 +1219,7 @@ def test_create_post_save_worker_refresh_exception_still_confirms(
     create_view,
     monkeypatch,
 ):
-    monkeypatch.setattr(bolt_module.threading, "Thread", MagicMock())
+    monkeypatch.setattr(bolt_module, "post_ack_executor", MagicMock())
     bolt_module._handle_practice_create_submission(
         MagicMock(),
         CREATE_BODY,
@@ -1291,7 +1291,7 @@ def test_create_submission_without_expanding_preserves_summary_snapshot(
         allow_restore=False,
     )
     collapsed["state"] = {"values": _view_values(collapsed)}
-    monkeypatch.setattr(bolt_module.threading, "Thread", MagicMock())
+    monkeypatch.setattr(bolt_module, "post_ack_executor", MagicMock())
 
     bolt_module._handle_practice_create_submission(
         MagicMock(),
@@ -0,0 +1,109 @@
+"""Tests for the concurrent surface refresh mode of refresh_practice_posts."""
+
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.slack.practices import refresh as refreshmod
+from app.slack.practices.refresh import PracticeSurface, refresh_practice_posts
+
+
+def make_practice(**overrides):
+    fields = dict(
+        id=7,
+        date=datetime(2099, 1, 6, 18, 0),
+        slack_message_ts=None,
+        slack_channel_id=None,
+        slack_collab_message_ts=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def slow_surface(name, calls, delay=0.1, result=None):
+    def refresh_fn(practice, change_type, **_context):
+        calls.append((name, threading.current_thread().name))
+        time.sleep(delay)
+        return result or {"success": True}
+
+    return PracticeSurface(name, None, refreshmod.ALL_CHANGE_TYPES, refresh_fn)
+
+
+def test_surfaces_run_in_parallel_and_keep_registry_order():
+    calls = []
+    surfaces = [
+        slow_surface(name, calls)
+        for name in ("announcement", "collab", "coach_summary", "weekly_summary")
+    ]
+
+    with patch.object(refreshmod, "PRACTICE_SURFACES", surfaces):
+        started = time.monotonic()
+        results = refresh_practice_posts(
+            make_practice(), change_type="edit", notify=False, concurrent=True
+        )
+        elapsed = time.monotonic() - started
+
+    assert list(results) == [
+        "announcement", "collab", "coach_summary", "weekly_summary",
+    ]
+    assert all(r == {"success": True} for r in results.values())
+    # Four 0.1s surfaces finish in roughly the time of one
+    assert elapsed < 0.3
+    # The announcement writes back onto the caller's practice, so it stays put
+    announcement_thread = dict(calls)["announcement"]
+    assert announcement_thread == threading.current_thread().name
+    assert all(
+        thread.startswith("practice-refresh")
+        for name, thread in calls
+        if name != "announcement"
+    )
+
+
+def test_failed_delete_announcement_still_blocks_other_surfaces():
+    calls = []
+    surfaces = [
+        slow_surface("announcement", calls, delay=0,
+                     result={"success": False, "error": "slack down"}),
+        slow_surface("collab", calls, delay=0),
+        slow_surface("coach_summary", calls, delay=0),
+    ]
+
+    with patch.object(refreshmod, "PRACTICE_SURFACES", surfaces):
+        results = refresh_practice_posts(
+            make_practice(slack_message_ts="123.456", slack_channel_id="C1"),
+            change_type="delete",
+            notify=False,
+            concurrent=True,
+        )
+
+    assert [name for name, _ in calls] == ["announcement"]
+    assert results["collab"] == {"skipped": "blocked_by_announcement"}
+    assert results["coach_summary"] == {"skipped": "blocked_by_announcement"}
+
+
+def test_raising_surface_is_reported_as_failure():
+    def boom(practice, change_type, **_context):
+        raise RuntimeError("kaput")
+
+    surfaces = [
+        PracticeSurface("announcement", None, refreshmod.ALL_CHANGE_TYPES,
+                        lambda *a, **k: {"success": True}),
+        PracticeSurface("collab", None, refreshmod.ALL_CHANGE_TYPES, boom),
+    ]
+
+    with patch.object(refreshmod, "PRACTICE_SURFACES", surfaces):
+        results = refresh_practice_posts(
+            make_practice(), change_type="edit", notify=False, concurrent=True
+        )
+
+    assert results["collab"] == {"success": False, "error": "kaput"}
+
+
+def test_concurrency_switch_defaults_off(monkeypatch):
+    monkeypatch.delenv(refreshmod.CONCURRENT_REFRESH_ENV, raising=False)
+    assert refreshmod.surface_refresh_concurrent() is False
+
+    monkeypatch.setenv(refreshmod.CONCURRENT_REFRESH_ENV, "true")
+    assert refreshmod.surface_refresh_concurrent() is True
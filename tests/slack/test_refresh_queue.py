@@ -0,0 +1,145 @@
+"""Tests for the coalescing practice summary refresh queue."""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.slack.practices import refresh as refreshmod
+from app.slack.practices.refresh_queue import (
+    COALESCE_WINDOW_ENV,
+    RefreshQueue,
+    coalesce_window_seconds,
+)
+
+
+def test_submissions_for_one_key_share_a_single_run():
+    queue = RefreshQueue()
+    calls = []
+
+    first = queue.submit(("weekly_summary", date(2099, 1, 5)),
+                         lambda: calls.append("first") or {"success": True},
+                         60)
+    second = queue.submit(("weekly_summary", date(2099, 1, 5)),
+                          lambda: calls.append("second") or {"success": True},
+                          60)
+    other = queue.submit(("coach_summary", date(2099, 1, 5)),
+                         lambda: calls.append("coach") or {"success": True},
+                         60)
+
+    assert first is second
+    assert other is not first
+    assert calls == []
+
+    results = queue.flush()
+
+    # The latest callable wins and runs once per key
+    assert sorted(calls) == ["coach", "second"]
+    assert first.result() == {"success": True}
+    assert results[("weekly_summary", date(2099, 1, 5))] == {"success": True}
+    assert queue.pending_keys() == []
+
+
+def test_window_expiry_runs_job_in_background():
+    queue = RefreshQueue()
+
+    future = queue.submit(("coach_summary", date(2099, 1, 5)),
+                          lambda: {"success": True}, 0.01)
+
+    assert future.result(timeout=5) == {"success": True}
+    assert queue.pending_keys() == []
+
+
+def test_flush_reports_job_errors():
+    queue = RefreshQueue()
+
+    def boom():
+        raise RuntimeError("slack down")
+
+    future = queue.submit(("coach_summary", date(2099, 1, 5)), boom, 60)
+    results = queue.flush()
+
+    assert results[("coach_summary", date(2099, 1, 5))] == {
+        "success": False,
+        "error": "slack down",
+    }
+    assert isinstance(future.exception(), RuntimeError)
+
+
+def test_window_defaults_to_disabled(monkeypatch):
+    monkeypatch.delenv(COALESCE_WINDOW_ENV, raising=False)
+    assert coalesce_window_seconds() == 0.0
+
+    monkeypatch.setenv(COALESCE_WINDOW_ENV, "nope")
+    assert coalesce_window_seconds() == 0.0
+
+    monkeypatch.setenv(COALESCE_WINDOW_ENV, "5")
+    assert coalesce_window_seconds() == 5.0
+
+
+def test_refresh_practice_posts_coalesces_week_summaries(monkeypatch):
+    monkeypatch.setenv(COALESCE_WINDOW_ENV, "60")
+    queue = RefreshQueue()
+    rebuilt = []
+    practices = [
+        SimpleNamespace(id=practice_id, date=datetime(2099, 1, day, 18, 0),
+                        slack_message_ts=None, slack_channel_id=None,
+                        slack_collab_message_ts=None)
+        for practice_id, day in ((1, 6), (2, 7), (3, 8))
+    ]
+
+    with patch.object(refreshmod, "refresh_queue", queue), patch.dict(
+        refreshmod._WEEK_SUMMARY_REFRESHERS,
+        {
+            "coach_summary": lambda week: rebuilt.append(("coach", week))
+            or {"success": True},
+            "weekly_summary": lambda week: rebuilt.append(("weekly", week))
+            or {"success": True},
+        },
+    ), patch.object(
+        refreshmod, "_refresh_availability_poll",
+        return_value={"success": True},
+    ):
+        all_results = [
+            refreshmod.refresh_practice_posts(
+                practice, change_type="edit", notify=False
+            )
+            for practice in practices
+        ]
+        assert rebuilt == []
+        queue.flush()
+
+    assert sorted(rebuilt) == [
+        ("coach", date(2099, 1, 5)),
+        ("weekly", date(2099, 1, 5)),
+    ]
+    for results in all_results:
+        assert results["coach_summary"]["queued"] is True
+        assert results["weekly_summary"]["future"].result() == {
+            "success": True
+        }
+
+
+def test_delete_bypasses_queue(monkeypatch):
+    monkeypatch.setenv(COALESCE_WINDOW_ENV, "60")
+    queue = RefreshQueue()
+    practice = SimpleNamespace(id=4, date=datetime(2099, 1, 6, 18, 0),
+                               slack_message_ts=None, slack_channel_id=None,
+                               slack_collab_message_ts=None)
+
+    with patch.object(refreshmod, "refresh_queue", queue), patch.object(
+        refreshmod, "_refresh_coach_summary_for_week",
+        return_value={"success": True},
+    ) as coach, patch.object(
+        refreshmod, "_refresh_weekly_summary_for_week",
+        return_value={"success": True},
+    ), patch.object(
+        refreshmod, "_refresh_availability_poll",
+        return_value={"success": True},
+    ):
+        results = refreshmod.refresh_practice_posts(
+            practice, change_type="delete", notify=False
+        )
+
+    assert queue.pending_keys() == []
+    assert results["coach_summary"] == {"success": True}
+    assert coach.call_args.kwargs == {"exclude_practice_id": 4}
@@ -0,0 +1,118 @@
+"""Rendered-block hashing lets refreshes skip no-op chat_update calls."""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.models import db
+from app.practices.models import PracticeSummaryPost
+from app.slack.practices import coach_review
+from app.slack.practices import render_hash as render_hash_module
+from app.slack.practices.render_hash import (
+    remember_render,
+    render_hash,
+    render_unchanged,
+)
+
+BLOCKS = [{"type": "section", "text": {"type": "mrkdwn", "text": "Tue 6pm"}}]
+
+
+def test_hash_covers_channel_ts_blocks_and_text():
+    digest = render_hash("C1", "1.0", BLOCKS, "fallback")
+
+    assert digest == render_hash("C1", "1.0", list(BLOCKS), "fallback")
+    assert digest != render_hash("C2", "1.0", BLOCKS, "fallback")
+    assert digest != render_hash("C1", "2.0", BLOCKS, "fallback")
+    assert digest != render_hash("C1", "1.0", BLOCKS, "other")
+    assert digest != render_hash("C1", "1.0", [], "fallback")
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://")
+    PracticeSummaryPost.__table__.create(engine)
+    monkeypatch.setattr(
+        render_hash_module,
+        "db",
+        SimpleNamespace(engine=engine, Model=db.Model),
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_remember_render_persists_without_touching_updated_at(engine):
+    stamped = datetime(2099, 1, 1, 12, 0)
+    with engine.begin() as connection:
+        connection.execute(
+            PracticeSummaryPost.__table__.insert().values(
+                id=1,
+                week_start=date(2099, 1, 5),
+                surface="weekly_summary",
+                channel_id="C1",
+                message_ts="1.0",
+                created_at=stamped,
+                updated_at=stamped,
+            )
+        )
+
+    with Session(engine) as session:
+        record = session.get(PracticeSummaryPost, 1)
+        digest = render_hash("C1", "1.0", BLOCKS, "fallback")
+
+        remember_render(record, "render_hash", digest)
+
+        assert render_unchanged(record, "render_hash", digest)
+        assert not session.dirty
+
+    with engine.connect() as connection:
+        row = connection.execute(
+            text("SELECT render_hash, updated_at FROM practice_summary_posts")
+        ).one()
+    assert row[0] == digest
+    assert str(row[1]).startswith("2099-01-01 12:00")
+
+
+def test_remember_render_ignores_non_model_records():
+    record = SimpleNamespace(id=1)
+
+    remember_render(record, "render_hash", "abc")
+
+    assert not hasattr(record, "render_hash")
+
+
+def test_collab_update_skipped_when_render_is_unchanged():
+    practice = SimpleNamespace(
+        id=3,
+        date=datetime(2099, 1, 6, 18, 0),
+        slack_collab_message_ts="5.0",
+        slack_collab_render_hash=None,
+        coach_approved=False,
+        approved_by_slack_uid=None,
+        approved_at=None,
+    )
+    client = MagicMock()
+
+    with patch.object(coach_review, "get_slack_client", return_value=client), \
+            patch.object(coach_review, "build_collab_practice_blocks",
+                         return_value=BLOCKS), \
+            patch("app.practices.service.convert_practice_to_info"), \
+            Flask(__name__).app_context():
+        assert coach_review.update_collab_post(practice) == {"success": True}
+        assert client.chat_update.call_count == 1
+
+        practice.slack_collab_render_hash = render_hash(
+            coach_review.COLLAB_CHANNEL_ID,
+            "5.0",
+            BLOCKS,
+            "Practice review: Tuesday, January 06",
+        )
+        assert coach_review.update_collab_post(practice) == {
+            "success": True,
+            "skipped": "unchanged",
+        }
+        assert client.chat_update.call_count == 1
@@ -0,0 +1,60 @@
+"""Going-count refreshes are coalesced per practice under reaction storms."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.slack.practices import refresh_queue as refresh_queue_module
+from app.slack.practices import rsvp
+from app.slack.practices.refresh_queue import RefreshQueue
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    queue = RefreshQueue()
+    monkeypatch.setattr(refresh_queue_module, "refresh_queue", queue)
+    return queue
+
+
+def test_storm_of_rsvps_produces_one_update_per_practice(queue, monkeypatch):
+    practices = {1: SimpleNamespace(id=1), 2: SimpleNamespace(id=2)}
+    updated = []
+    monkeypatch.setattr(
+        "app.models.db",
+        SimpleNamespace(session=SimpleNamespace(
+            get=lambda model, practice_id: practices.get(practice_id)
+        )),
+    )
+    monkeypatch.setattr(
+        rsvp,
+        "update_practice_rsvp_counts",
+        lambda practice: updated.append(practice.id) or {"success": True},
+    )
+
+    futures = [
+        rsvp.schedule_rsvp_count_refresh(practice_id, window_seconds=60)
+        for practice_id in (1, 1, 1, 2, 1, 2)
+    ]
+
+    assert updated == []
+    assert sorted(queue.pending_keys()) == [
+        ("rsvp_counts", 1), ("rsvp_counts", 2),
+    ]
+
+    queue.flush()
+
+    assert sorted(updated) == [1, 2]
+    assert futures[0] is futures[1] is futures[4]
+    assert futures[0].result() == {"success": True}
+
+
+def test_missing_practice_reports_failure(queue, monkeypatch):
+    monkeypatch.setattr(
+        "app.models.db",
+        SimpleNamespace(session=SimpleNamespace(get=lambda *_: None)),
+    )
+
+    future = rsvp.schedule_rsvp_count_refresh(9, window_seconds=60)
+    queue.flush()
+
+    assert future.result() == {"success": False, "error": "Practice not found"}